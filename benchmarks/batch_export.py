@@ -0,0 +1,102 @@
+"""Benchmark for exporting a batch of charts.
+
+Starts a local stand-in for the :term:`Export Server` which takes ``--latency``
+seconds to render each chart, then compares the time taken to export the same batch
+of charts one at a time using
+:meth:`ExportServer.get_chart() <highcharts_gantt.headless_export.ExportServer.get_chart>`
+and concurrently using
+:meth:`ExportServer.get_charts() <highcharts_gantt.headless_export.ExportServer.get_charts>`.
+
+Usage::
+
+  python benchmarks/batch_export.py
+  python benchmarks/batch_export.py --charts 500 --workers 8 16 --latency 0.5
+
+"""
+import argparse
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from highcharts_gantt.headless_export import ExportServer
+from highcharts_gantt.options import HighchartsGanttOptions
+
+
+def start_server(latency):
+    """Start a stand-in export server and return it."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers['Content-Length']))
+            time.sleep(latency)
+
+            content = b'\x89PNG' + b'\x00' * 1024
+            self.send_response(200)
+            self.send_header('Content-Type', 'image/png')
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target = server.serve_forever, daemon = True).start()
+
+    return server
+
+
+def make_charts(count):
+    """Return ``count`` Gantt chart options, each with a few tasks."""
+    return [HighchartsGanttOptions(title = {'text': f'Plan {x}'},
+                                   series = [{
+                                       'type': 'gantt',
+                                       'data': [{
+                                           'id': f'task-{y}',
+                                           'name': f'Task {y}',
+                                           'start': 1704067200 + y * 3600,
+                                           'end': 1704067200 + (y + 8) * 3600
+                                       } for y in range(20)]
+                                   }])
+            for x in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.split('\n')[0])
+    parser.add_argument('--charts', type = int, default = 200)
+    parser.add_argument('--workers', nargs = '+', type = int, default = [4, 8, 16])
+    parser.add_argument('--latency', type = float, default = 0.25)
+    args = parser.parse_args()
+
+    server = start_server(args.latency)
+    settings = {
+        'protocol': 'http',
+        'domain': '127.0.0.1',
+        'port': server.server_address[1],
+        'timeout': 10
+    }
+    charts = make_charts(args.charts)
+
+    start = time.perf_counter()
+    for chart in charts:
+        ExportServer.get_chart(options = chart, **settings)
+    sequential = time.perf_counter() - start
+
+    print(f'{"method":>24} {"seconds":>10} {"charts/s":>10}')
+    print(f'{"get_chart":>24} {sequential:10.2f} {args.charts / sequential:10.1f}')
+    for workers in args.workers:
+        start = time.perf_counter()
+        for result in ExportServer.get_charts(charts, max_workers = workers, **settings):
+            pass
+        elapsed = time.perf_counter() - start
+
+        label = f'get_charts ({workers})'
+        print(f'{label:>24} {elapsed:10.2f} {args.charts / elapsed:10.1f}')
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
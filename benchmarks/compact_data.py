@@ -0,0 +1,61 @@
+"""Benchmark for the payload size of compact Gantt series data.
+
+Builds a plan whose tasks carry an id, name, start and end, with some of them also
+carrying a parent, dependency, or completion, then compares the size of the series
+serialized to a JavaScript object literal and to JSON with and without
+:meth:`GanttSeries.compact_data <highcharts_gantt.options.series.gantt.GanttSeries.compact_data>`.
+
+Usage::
+
+  python benchmarks/compact_data.py
+  python benchmarks/compact_data.py --sizes 50000
+
+"""
+import argparse
+
+from highcharts_gantt.options.series.data.gantt import GanttDataColumns
+from highcharts_gantt.options.series.gantt import GanttSeries
+
+
+def make_data(size):
+    """Return ``size`` tasks, each depending on the task before it and grouped under
+    a parent task for every 100 tasks."""
+    start = 1704067200000
+    hour = 3600000
+
+    return GanttDataColumns(
+        id = [f'task-{x}' for x in range(size)],
+        name = [f'Task {x}' for x in range(size)],
+        parent = [None if not x % 100 else f'task-{x - x % 100}' for x in range(size)],
+        start = [start + x * hour for x in range(size)],
+        end = [start + (x + 8) * hour for x in range(size)],
+        completed = [0.5 if x % 3 else None for x in range(size)],
+        dependency = [f'task-{x - 1}' if x % 100 else None for x in range(size)]
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.split('\n')[0])
+    parser.add_argument('--sizes',
+                        nargs = '+',
+                        type = int,
+                        default = [10000])
+    args = parser.parse_args()
+
+    print(f'{"points":>10} {"format":>8} {"objects":>12} {"compact":>12} {"saving":>8}')
+    for size in args.sizes:
+        data = make_data(size)
+        full = GanttSeries(data = data)
+        compact = GanttSeries(data = data, compact_data = True)
+
+        for label, method in [('js', 'to_js_literal'), ('json', 'to_json')]:
+            full_size = len(getattr(full, method)())
+            compact_size = len(getattr(compact, method)())
+
+            print(f'{size:>10} {label:>8} {full_size / 2**20:8.2f} MiB '
+                  f'{compact_size / 2**20:8.2f} MiB '
+                  f'{1 - compact_size / full_size:7.0%}')
+
+
+if __name__ == '__main__':
+    main()
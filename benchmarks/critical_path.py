@@ -0,0 +1,68 @@
+"""Benchmark for dependency graph indexing and critical path scheduling.
+
+Builds a synthetic plan in which every task depends on two of the five tasks before
+it, then times
+:meth:`GanttSeries.dependency_graph <highcharts_gantt.options.series.gantt.GanttSeries.dependency_graph>`
+and
+:meth:`GanttSeries.get_critical_path() <highcharts_gantt.options.series.gantt.GanttSeries.get_critical_path>`.
+
+Usage::
+
+  python benchmarks/critical_path.py
+  python benchmarks/critical_path.py --sizes 50000 100000
+
+"""
+import argparse
+import datetime
+import random
+import time
+
+from highcharts_gantt.options.series.gantt import GanttSeries
+
+
+def make_rows(size):
+    """Return ``size`` tasks, each depending on two of the five tasks before it."""
+    random.seed(size)
+    start = datetime.datetime(2024, 1, 1, tzinfo = datetime.timezone.utc)
+    minute = datetime.timedelta(minutes = 1)
+
+    return [{
+        'id': f'task-{x}',
+        'start': start + x * minute,
+        'end': start + (x + random.randrange(30, 120)) * minute,
+        'dependency': [f'task-{max(x - 1 - random.randrange(5), 0)}'
+                       for y in range(2)]
+                      if x % 1000 else None
+    } for x in range(size)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.split('\n')[0])
+    parser.add_argument('--sizes',
+                        nargs = '+',
+                        type = int,
+                        default = [10000, 50000, 100000])
+    args = parser.parse_args()
+
+    print(f'{"tasks":>10} {"graph":>9} {"validate":>9} {"cpm":>9} {"critical":>9}')
+    for size in args.sizes:
+        series = GanttSeries(trusted_data = True, data = make_rows(size))
+
+        start = time.perf_counter()
+        graph = series.dependency_graph
+        graph_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        graph.validate()
+        validate_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        critical_path = series.get_critical_path()
+        cpm_time = time.perf_counter() - start
+
+        print(f'{size:>10} {graph_time:8.3f}s {validate_time:8.3f}s '
+              f'{cpm_time:8.3f}s {sum(critical_path.critical):>9}')
+
+
+if __name__ == '__main__':
+    main()
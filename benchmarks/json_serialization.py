@@ -0,0 +1,68 @@
+"""Benchmark for serializing a Gantt chart to JSON.
+
+Compares the generic JSON serialization (which validates every value as it trims the
+chart's options) with the single-pass serialization used by
+:meth:`Chart.to_json() <highcharts_gantt.chart.Chart.to_json>` and
+:meth:`Chart.to_json_bytes() <highcharts_gantt.chart.Chart.to_json_bytes>`.
+
+Usage::
+
+  python benchmarks/json_serialization.py
+  python benchmarks/json_serialization.py --sizes 10000 50000
+
+"""
+import argparse
+import datetime
+import time
+
+from highcharts_core.metaclasses import HighchartsMeta
+
+from highcharts_gantt.chart import Chart
+from highcharts_gantt.options.series.gantt import GanttSeries
+
+
+def make_chart(size):
+    """Return a chart with ``size`` tasks, each depending on the task before it."""
+    start = datetime.datetime(2024, 1, 1, tzinfo = datetime.timezone.utc)
+    hour = datetime.timedelta(hours = 1)
+    series = GanttSeries(name = 'Plan', data = [{
+        'id': f'task-{x}',
+        'name': f'Task {x}',
+        'start': start + x * hour,
+        'end': start + (x + 8) * hour,
+        'completed': {'amount': 0.5},
+        'dependency': f'task-{x - 1}' if x else None
+    } for x in range(size)])
+
+    return Chart(container = 'container',
+                 is_gantt_chart = True,
+                 options = {'series': [series]})
+
+
+def measure(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.split('\n')[0])
+    parser.add_argument('--sizes',
+                        nargs = '+',
+                        type = int,
+                        default = [1000, 5000])
+    args = parser.parse_args()
+
+    print(f'{"points":>10} {"generic":>9} {"to_json":>9} {"speedup":>9}')
+    for size in args.sizes:
+        chart = make_chart(size)
+
+        generic = measure(HighchartsMeta.to_json, chart)
+        direct = measure(chart.to_json_bytes)
+
+        print(f'{size:>10} {generic:8.2f}s {direct:8.2f}s {generic / direct:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""Benchmark for the memory used by Gantt data points.
+
+Reports the number of bytes allocated per data point for:
+
+  * a :class:`GanttData <highcharts_gantt.options.series.data.gantt.GanttData>`
+    carrying only an id, name, and start/end times,
+  * a :class:`GanttData <highcharts_gantt.options.series.data.gantt.GanttData>`
+    whose ``completed`` is a
+    :class:`ProgressIndicator <highcharts_gantt.options.series.data.gantt.ProgressIndicator>`
+    and whose ``dependency`` holds two
+    :class:`DataConnection <highcharts_gantt.options.series.data.connect.DataConnection>`
+    instances, and
+  * each of the three classes on their own.
+
+The strings and :class:`datetime <python:datetime.datetime>` values shared by the data
+points are allocated before measurement begins, so the figures reflect the data point
+objects themselves.
+
+Usage::
+
+  python benchmarks/memory_per_point.py
+  python benchmarks/memory_per_point.py --size 100000
+
+"""
+import argparse
+import datetime
+import gc
+import tracemalloc
+
+from highcharts_gantt.options.series.data.connect import DataConnection
+from highcharts_gantt.options.series.data.gantt import GanttData, ProgressIndicator
+
+
+def measure(func, size):
+    """Return the number of bytes allocated per member of ``func(size)``."""
+    gc.collect()
+    tracemalloc.start()
+    result = func(size)
+    gc.collect()
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+
+    return allocated / size
+
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.split('\n')[0])
+    parser.add_argument('--size', type = int, default = 20000)
+    args = parser.parse_args()
+    size = args.size
+
+    start = datetime.datetime(2024, 1, 1, tzinfo = datetime.timezone.utc)
+    ids = [f'task-{x}' for x in range(size)]
+    names = [f'Task {x}' for x in range(size)]
+    starts = [start + datetime.timedelta(hours = x) for x in range(size)]
+    ends = [start + datetime.timedelta(hours = x + 8) for x in range(size)]
+
+    def simple_points(size):
+        return [GanttData(id = ids[x],
+                          name = names[x],
+                          start = starts[x],
+                          end = ends[x])
+                for x in range(size)]
+
+    def dependent_points(size):
+        return [GanttData(id = ids[x],
+                          name = names[x],
+                          start = starts[x],
+                          end = ends[x],
+                          completed = ProgressIndicator(amount = 0.5),
+                          dependency = [DataConnection(to = ids[x - 1]),
+                                        DataConnection(to = ids[x - 2],
+                                                       type = 'simpleConnect')])
+                for x in range(size)]
+
+    cases = [
+        ('GanttData (id, name, start, end)', simple_points),
+        ('GanttData (+ progress, 2 connections)', dependent_points),
+        ('GanttData (empty)', lambda size: [GanttData() for x in range(size)]),
+        ('ProgressIndicator',
+         lambda size: [ProgressIndicator(amount = 0.5) for x in range(size)]),
+        ('DataConnection',
+         lambda size: [DataConnection(to = ids[x]) for x in range(size)]),
+    ]
+
+    print(f'{"data point":<40} {"bytes per point":>16}')
+    for label, func in cases:
+        print(f'{label:<40} {measure(func, size):>16.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark for re-serializing a Gantt series after small edits.
+
+Serializes a series to a JavaScript object literal, then re-serializes it without any
+changes and after editing a single data point, to measure the effect of the data
+points' cached serialized fragments (see
+:class:`ChangeTrackingMixin <highcharts_gantt.metaclasses.ChangeTrackingMixin>`).
+
+Usage::
+
+  python benchmarks/reserialization.py
+  python benchmarks/reserialization.py --sizes 1000 5000
+
+"""
+import argparse
+import datetime
+import time
+
+from highcharts_gantt.options.series.gantt import GanttSeries
+
+
+def make_rows(size):
+    """Return ``size`` tasks, each depending on the task before it."""
+    start = datetime.datetime(2024, 1, 1, tzinfo = datetime.timezone.utc)
+    hour = datetime.timedelta(hours = 1)
+
+    return [{
+        'id': f'task-{x}',
+        'name': f'Task {x}',
+        'start': start + x * hour,
+        'end': start + (x + 8) * hour,
+        'completed': {'amount': 0.5},
+        'dependency': f'task-{x - 1}' if x else None
+    } for x in range(size)]
+
+
+def measure(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.split('\n')[0])
+    parser.add_argument('--sizes',
+                        nargs = '+',
+                        type = int,
+                        default = [1000, 5000, 10000])
+    args = parser.parse_args()
+
+    print(f'{"points":>10} {"first":>9} {"unchanged":>10} {"one edit":>9} '
+          f'{"speedup":>9}')
+    for size in args.sizes:
+        series = GanttSeries(data = make_rows(size))
+
+        first = measure(series.to_js_literal)
+        unchanged = measure(series.to_js_literal)
+        series.data[size // 2].completed.amount = 0.75
+        edited = measure(series.to_js_literal)
+
+        print(f'{size:>10} {first:8.2f}s {unchanged:9.2f}s {edited:8.2f}s '
+              f'{first / edited:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark for creating a series from a JavaScript object literal string.
+
+Builds the JavaScript literal of a Gantt series with ``--sizes`` tasks, then compares
+the time taken to parse it twice (once as a
+:class:`SeriesBase <highcharts_gantt.options.series.base.SeriesBase>` to read its
+``type``, and again as the concrete series class) with the time taken by
+:func:`create_series_obj() <highcharts_gantt.options.series.series_generator.create_series_obj>`,
+which parses it once.
+
+Usage::
+
+  python benchmarks/series_from_js_literal.py
+  python benchmarks/series_from_js_literal.py --sizes 1000 5000
+
+"""
+import argparse
+import time
+
+from highcharts_gantt.options.series.base import SeriesBase
+from highcharts_gantt.options.series.gantt import GanttSeries
+from highcharts_gantt.options.series.series_generator import create_series_obj
+
+
+def make_literal(size):
+    """Return the JavaScript literal of a Gantt series with ``size`` tasks."""
+    tasks = ',\n'.join(f"{{id: 'task-{x}', name: 'Task {x}', "
+                       f"start: {1704067200 + x * 3600}, "
+                       f"end: {1704067200 + (x + 8) * 3600}"
+                       f"{', dependency: ' + repr(f'task-{x - 1}') if x else ''}}}"
+                       for x in range(size))
+
+    return f"{{type: 'gantt', name: 'Plan', data: [{tasks}]}}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.split('\n')[0])
+    parser.add_argument('--sizes',
+                        nargs = '+',
+                        type = int,
+                        default = [500, 2000])
+    args = parser.parse_args()
+
+    def parse_twice(as_str):
+        SeriesBase.from_js_literal(as_str)
+        return GanttSeries.from_js_literal(as_str)
+
+    print(f'{"points":>10} {"parse twice":>12} {"single parse":>14} {"saving":>8}')
+    for size in args.sizes:
+        as_str = make_literal(size)
+
+        start = time.perf_counter()
+        parse_twice(as_str)
+        twice = time.perf_counter() - start
+
+        start = time.perf_counter()
+        create_series_obj(as_str)
+        once = time.perf_counter() - start
+
+        print(f'{size:>10} {twice:11.2f}s {once:13.2f}s {1 - once / twice:7.0%}')
+
+
+if __name__ == '__main__':
+    main()
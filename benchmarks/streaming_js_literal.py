@@ -0,0 +1,87 @@
+"""Benchmark for writing a Gantt chart's JavaScript code to a file.
+
+Builds a chart whose series holds its data points in a
+:class:`GanttDataColumns <highcharts_gantt.options.series.data.gantt.GanttDataColumns>`
+collection, then compares the peak memory allocated (and the time taken) while writing
+the chart to a file using
+:meth:`Chart.to_js_literal() <highcharts_gantt.chart.Chart.to_js_literal>` and
+:meth:`Chart.write_js_literal() <highcharts_gantt.chart.Chart.write_js_literal>`.
+
+Usage::
+
+  python benchmarks/streaming_js_literal.py
+  python benchmarks/streaming_js_literal.py --sizes 50000 200000
+
+"""
+import argparse
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+from highcharts_gantt.chart import Chart
+from highcharts_gantt.options.series.data.gantt import GanttDataColumns
+from highcharts_gantt.options.series.gantt import GanttSeries
+
+
+def make_chart(size):
+    """Return a chart with ``size`` tasks, each depending on the task before it."""
+    start = 1704067200000
+    hour = 3600000
+    data = GanttDataColumns(id = [f'task-{x}' for x in range(size)],
+                            name = [f'Task {x}' for x in range(size)],
+                            start = [start + x * hour for x in range(size)],
+                            end = [start + (x + 8) * hour for x in range(size)],
+                            dependency = [f'task-{x - 1}' if x else None
+                                          for x in range(size)])
+
+    return Chart(container = 'container',
+                 is_gantt_chart = True,
+                 options = {
+                     'series': [GanttSeries(name = 'Plan', data = data)]
+                 })
+
+
+def measure(func, *args, **kwargs):
+    """Return the peak memory allocated (in MiB) and the time taken by ``func``."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return peak / 2**20, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.split('\n')[0])
+    parser.add_argument('--sizes',
+                        nargs = '+',
+                        type = int,
+                        default = [10000, 50000, 200000])
+    args = parser.parse_args()
+
+    def write_string(chart, filename):
+        chart.to_js_literal(filename = filename)
+
+    def write_stream(chart, filename):
+        with open(filename, 'w', encoding = 'utf-8') as file_:
+            chart.write_js_literal(file_)
+
+    print(f'{"points":>10} {"to_js_literal":>22} {"write_js_literal":>22}')
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'chart.js')
+        for size in args.sizes:
+            chart = make_chart(size)
+            string_peak, string_time = measure(write_string, chart, filename)
+            stream_peak, stream_time = measure(write_stream, chart, filename)
+
+            print(f'{size:>10} {string_peak:10.1f} MiB {string_time:6.2f}s '
+                  f'{stream_peak:10.1f} MiB {stream_time:6.2f}s')
+
+
+if __name__ == '__main__':
+    main()
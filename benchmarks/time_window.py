@@ -0,0 +1,80 @@
+"""Benchmark for time-window queries over Gantt data points.
+
+Builds a synthetic multi-year plan (in which every task belongs to a parent task
+spanning its month), then times building the series'
+:meth:`.interval_index <highcharts_gantt.options.series.gantt.GanttSeries.interval_index>`,
+querying a two-week window with
+:meth:`GanttSeries.get_window() <highcharts_gantt.options.series.gantt.GanttSeries.get_window>`,
+and serializing the window compared to the full series.
+
+Usage::
+
+  python benchmarks/time_window.py
+  python benchmarks/time_window.py --sizes 50000 100000
+
+"""
+import argparse
+import datetime
+import random
+import time
+
+from highcharts_gantt.options.series.gantt import GanttSeries
+
+
+def make_rows(size):
+    """Return ``size`` tasks spread over roughly three years, grouped by month."""
+    random.seed(size)
+    start = datetime.datetime(2024, 1, 1, tzinfo = datetime.timezone.utc)
+    span = 3 * 365 * 24 * 60
+    minute = datetime.timedelta(minutes = 1)
+    rows = [{
+        'id': f'month-{x}',
+        'start': start + x * 30 * 24 * 60 * minute,
+        'end': start + (x + 1) * 30 * 24 * 60 * minute
+    } for x in range(37)]
+    for x in range(size - len(rows)):
+        offset = x * span // size
+        rows.append({
+            'id': f'task-{x}',
+            'parent': f'month-{offset // (30 * 24 * 60)}',
+            'start': start + offset * minute,
+            'end': start + (offset + random.randrange(60, 7 * 24 * 60)) * minute
+        })
+
+    return rows
+
+
+def measure(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.split('\n')[0])
+    parser.add_argument('--sizes',
+                        nargs = '+',
+                        type = int,
+                        default = [10000, 50000, 100000])
+    args = parser.parse_args()
+
+    window_start = datetime.datetime(2025, 6, 1, tzinfo = datetime.timezone.utc)
+    window_end = window_start + datetime.timedelta(days = 14)
+
+    print(f'{"tasks":>10} {"in window":>10} {"index":>9} {"query":>9} '
+          f'{"window json":>12} {"full json":>10}')
+    for size in args.sizes:
+        series = GanttSeries(trusted_data = True, data = make_rows(size))
+
+        index_time = measure(lambda: series.interval_index)[1]
+        window, query_time = measure(series.get_window, window_start, window_end)
+        window_json_time = measure(window.to_json)[1]
+        full_json_time = measure(series.to_json)[1]
+
+        print(f'{size:>10} {len(window.data):>10} {index_time:8.3f}s '
+              f'{query_time:8.3f}s {window_json_time:11.3f}s {full_json_time:9.3f}s')
+
+
+if __name__ == '__main__':
+    main()
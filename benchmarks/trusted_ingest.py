@@ -0,0 +1,85 @@
+"""Benchmark for loading Gantt data points with and without validation.
+
+Compares :meth:`GanttData.from_array() <highcharts_gantt.options.series.data.gantt.GanttData.from_array>`
+in its default (validating) mode against its trusted mode, for data points supplied
+both as :class:`dict <python:dict>` objects and as tuples.
+
+Usage::
+
+  python benchmarks/trusted_ingest.py
+  python benchmarks/trusted_ingest.py --sizes 10000 100000
+
+.. note::
+
+  The validating path takes several minutes at 1,000,000 data points. Use
+  ``--validated-max`` to skip the validating path above a given size.
+
+"""
+import argparse
+import datetime
+import time
+
+from highcharts_gantt.options.series.data.gantt import GanttData
+
+KEYS = ('id', 'name', 'parent', 'start', 'end', 'completed', 'dependency')
+
+
+def make_rows(size):
+    """Return ``size`` pre-validated data points, as tuples ordered by ``KEYS``."""
+    start = datetime.datetime(2024, 1, 1, tzinfo = datetime.timezone.utc)
+    hour = datetime.timedelta(hours = 1)
+
+    return [(f'task-{x}',
+             f'Task {x}',
+             f'task-{x // 100 * 100}' if x % 100 else None,
+             start + x * hour,
+             start + (x + 8) * hour,
+             (x % 100) / 100,
+             f'task-{x - 1}' if x % 100 > 1 else None)
+            for x in range(size)]
+
+
+def measure(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.split('\n')[0])
+    parser.add_argument('--sizes',
+                        nargs = '+',
+                        type = int,
+                        default = [10000, 100000, 1000000])
+    parser.add_argument('--validated-max',
+                        type = int,
+                        default = None,
+                        help = 'skip the validating path above this number of points')
+    args = parser.parse_args()
+
+    print(f'{"points":>10} {"validated":>12} {"trusted dict":>14} '
+          f'{"trusted tuple":>14} {"speedup":>9}')
+    for size in args.sizes:
+        rows = make_rows(size)
+        dicts = [dict(zip(KEYS, x)) for x in rows]
+
+        trusted_dict = measure(GanttData.from_array, dicts, trusted = True)
+        trusted_tuple = measure(GanttData.from_array,
+                                rows,
+                                trusted = True,
+                                keys = KEYS)
+        if args.validated_max is None or size <= args.validated_max:
+            validated = measure(GanttData.from_array, dicts)
+            speedup = f'{validated / trusted_dict:8.1f}x'
+            validated = f'{validated:11.2f}s'
+        else:
+            validated = f'{"skipped":>12}'
+            speedup = f'{"-":>9}'
+
+        print(f'{size:>10} {validated} {trusted_dict:13.2f}s '
+              f'{trusted_tuple:13.2f}s {speedup}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,6 @@
-from typing import Optional
+import time
+from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
 
 from validator_collection import validators, checkers
 
@@ -9,8 +11,11 @@ from highcharts_gantt.options import (HighchartsOptions,
                                       HighchartsStockOptions,
                                       HighchartsGanttOptions)
 from highcharts_gantt.decorators import validate_types
-from highcharts_gantt.js_literal_functions import serialize_to_js_literal
+from highcharts_gantt.metaclasses import DirectJSONMixin
+from highcharts_gantt.js_literal_functions import (serialize_to_js_literal,
+                                                   write_js_literal)
 from highcharts_gantt.headless_export import ExportServer
+from highcharts_gantt.utility_functions import run_async
 from highcharts_gantt.options.series.series_generator import (create_series_obj,
                                                               SERIES_CLASSES,
                                                               GANTT_SERIES_LIST)
@@ -20,11 +25,12 @@ from highcharts_gantt.global_options.shared_options import (SharedGanttOptions,
 from highcharts_gantt.options.chart import ChartOptions
 
 
-class Chart(ChartBase):
+class Chart(DirectJSONMixin, ChartBase):
     """Python representation of a Highcharts ``Chart`` object."""
 
     def __init__(self, **kwargs):
         self._is_gantt_chart = None
+        self._portfolio_report = None
 
         self.is_gantt_chart = kwargs.get('is_gantt_chart', False)
 
@@ -158,6 +164,34 @@ class Chart(ChartBase):
     def is_gantt_chart(self, value):
         self._is_gantt_chart = bool(value)
 
+    @property
+    def portfolio_report(self) -> Optional[List[dict]]:
+        """A report on the sources loaded by
+        :meth:`.from_portfolio() <Chart.from_portfolio>`, in the order they were
+        supplied. Defaults to :obj:`None <python:None>`.
+
+        Each entry is a :class:`dict <python:dict>` with the following keys:
+
+          * ``'type'``: the type of the source (``'asana'``, ``'jira'``, or
+            ``'monday'``)
+          * ``'name'``: the name of the series assembled from the source
+          * ``'elapsed'``: the time (in seconds) spent loading the source
+          * ``'data_points'``: the number of data points loaded from the source
+          * ``'error'``: the exception raised while loading the source, or
+            :obj:`None <python:None>` if it loaded successfully
+          * ``'duplicate_ids'``: when the sources were merged, the ids of the source's
+            data points that were skipped because an earlier source already supplied
+            a data point with the same id
+
+        .. note::
+
+          The report is *not* serialized to JavaScript or JSON.
+
+        :rtype: :class:`list <python:list>` of :class:`dict <python:dict>`, or
+          :obj:`None <python:None>`
+        """
+        return self._portfolio_report
+
     @property
     def options(self) -> Optional[HighchartsOptions | HighchartsGanttOptions | HighchartsStockOptions]:
         """The Python representation of the
@@ -305,6 +339,72 @@ class Chart(ChartBase):
 
         return as_str
 
+    def write_js_literal(self,
+                         stream,
+                         encoding = 'utf-8'):
+        """Write the chart, represented as JavaScript code, to ``stream``.
+
+        Produces the same output as :meth:`to_js_literal() <Chart.to_js_literal>`, but
+        writes the chart's options - including each series and each of its data points
+        - to ``stream`` incrementally rather than first assembling them into a single
+        string. The memory needed is therefore roughly constant, regardless of how much
+        data the chart contains.
+
+        .. code-block:: python
+
+          with open('my-chart.js', 'w', encoding = 'utf-8') as file_:
+              my_chart.write_js_literal(file_)
+
+        .. note::
+
+          Unlike :meth:`to_js_literal() <Chart.to_js_literal>`, this method does not
+          cache the serialized fragments of the data points it writes.
+
+        :param stream: A writable text stream (e.g. a file opened in text mode, or an
+          :class:`io.StringIO <python:io.StringIO>`).
+
+        :param encoding: The character encoding to apply when serializing values.
+          Defaults to ``'utf-8'``.
+        :type encoding: :class:`str <python:str>`
+
+        :raises HighchartsValueError: if ``stream`` is not writable
+        """
+        write = getattr(stream, 'write', None)
+        if not callable(write):
+            raise errors.HighchartsValueError(f'stream must be a writable text stream. '
+                                              f'Received: {stream.__class__.__name__}')
+
+        write("""document.addEventListener('DOMContentLoaded', function() {\n""")
+        if self.variable_name:
+            write(f'var {self.variable_name} = ')
+
+        if self.is_gantt_chart:
+            write("""new Highcharts.ganttChart(""")
+        elif self.is_stock_chart:
+            write("""new Highcharts.stockChart(""")
+        else:
+            write("""new Highcharts.chart(""")
+
+        if self.container:
+            write(f"""'{self.container}'""")
+        else:
+            write("""null""")
+        write(',\n')
+
+        if self.options:
+            if not write_js_literal(self.options, stream, encoding = encoding):
+                write(f"""{None}""")
+        else:
+            write("""{}""")
+        write(',\n')
+
+        if self.callback:
+            write(f"""{self.callback.to_js_literal(encoding = encoding)}""")
+
+        write(');')
+        write('\n')
+        write("""});""")
+
     def download_chart(self,
                        format_ = 'png',
                        scale = 1,
@@ -317,6 +417,12 @@ class Chart(ChartBase):
                        **kwargs):
         """Export a downloaded form of the chart using a Highcharts :term:`Export Server`.
 
+        .. tip::
+
+          To avoid re-exporting identical charts, enable the on-disk export cache
+          using
+          :func:`enable_export_cache() <highcharts_gantt.export_cache.enable_export_cache>`.
+
         :param filename: The name of the file where the exported chart should (optionally)
           be persisted. Defaults to :obj:`None <python:None>`.
         :type filename: Path-like or :obj:`None <python:None>`
@@ -1083,6 +1189,22 @@ class Chart(ChartBase):
         
         return instance
       
+    @classmethod
+    async def from_asana_async(cls, *args, **kwargs):
+        """Asynchronous counterpart to :meth:`.from_asana() <Chart.from_asana>`,
+        which accepts the same arguments.
+
+        The requests to Asana are executed in the
+        :func:`shared thread pool <highcharts_gantt.utility_functions.get_async_executor>`,
+        so that many charts can be created concurrently (e.g. using
+        :func:`asyncio.gather() <python:asyncio.gather>`) without blocking the event
+        loop.
+
+        :returns: A Gantt :class:`Chart <highcharts_gantt.chart.Chart>` instance
+        :rtype: :class:`Chart <highcharts_gantt.chart.Chart>`
+        """
+        return await run_async(cls.from_asana, *args, **kwargs)
+
     @classmethod
     def from_monday(cls,
                     board_id,
@@ -1091,6 +1213,7 @@ class Chart(ChartBase):
                     property_column_map = None,
                     connection_kwargs = None,
                     connection_callback = None,
+                    page_size = 100,
                     series_kwargs = None,
                     options_kwargs = None,
                     chart_kwargs = None):
@@ -1163,6 +1286,10 @@ class Chart(ChartBase):
             
         :type connection_callback: Callable or :obj:`None <python:None>`
         
+        :param page_size: The number of items to retrieve from the Monday.com API per 
+          request. Defaults to ``100``.
+        :type page_size: :class:`int <python:int>`
+        
         :param series_kwargs: Collection of additional keyword arguments to use when 
           instantiating the 
           :class:`GanttSeries <highcharts_gantt.options.series.GanttSeries>` (besides 
@@ -1222,6 +1349,7 @@ class Chart(ChartBase):
                                         property_column_map = property_column_map,
                                         connection_kwargs = connection_kwargs,
                                         connection_callback = connection_callback,
+                                        page_size = page_size,
                                         series_kwargs = series_kwargs)
 
         options = HighchartsGanttOptions(**options_kwargs)
@@ -1233,6 +1361,22 @@ class Chart(ChartBase):
         
         return instance
 
+    @classmethod
+    async def from_monday_async(cls, *args, **kwargs):
+        """Asynchronous counterpart to :meth:`.from_monday() <Chart.from_monday>`,
+        which accepts the same arguments.
+
+        The requests to Monday.com are executed in the
+        :func:`shared thread pool <highcharts_gantt.utility_functions.get_async_executor>`,
+        so that many charts can be created concurrently (e.g. using
+        :func:`asyncio.gather() <python:asyncio.gather>`) without blocking the event
+        loop.
+
+        :returns: A Gantt :class:`Chart <highcharts_gantt.chart.Chart>` instance
+        :rtype: :class:`Chart <highcharts_gantt.chart.Chart>`
+        """
+        return await run_async(cls.from_monday, *args, **kwargs)
+
     @classmethod
     def from_jira(cls, 
                   project_key,
@@ -1245,6 +1389,10 @@ class Chart(ChartBase):
                   jira_client = None,
                   connection_kwargs = None,
                   connection_callback = None,
+                  page_size = 100,
+                  max_workers = 8,
+                  fields = None,
+                  custom_fields = '*all',
                   series_kwargs = None,
                   options_kwargs = None,
                   chart_kwargs = None):
@@ -1362,6 +1510,38 @@ class Chart(ChartBase):
             
         :type connection_callback: Callable or :obj:`None <python:None>`
         
+        :param page_size: The number of issues to retrieve from JIRA per request. 
+          Defaults to ``100``.
+        :type page_size: :class:`int <python:int>`
+        
+        :param max_workers: The maximum number of pages of issues to retrieve from JIRA
+          concurrently. Defaults to ``8``.
+        :type max_workers: :class:`int <python:int>`
+
+        :param fields: The names of additional JIRA fields to retrieve for each issue,
+          besides those needed to assemble the data points. If ``'*all'``, all fields
+          will be retrieved. Only applies if ``custom_fields`` is not ``'*all'``, since
+          otherwise all fields are retrieved. Defaults to :obj:`None <python:None>`.
+        :type fields: iterable of :class:`str <python:str>`, ``'*all'``, or
+          :obj:`None <python:None>`
+
+        :param custom_fields: The names of the JIRA fields whose (raw) values should be
+          included in each data point's ``custom`` property, alongside the issue's
+          ``key``. If :obj:`None <python:None>`, only the issue's ``key`` is included.
+          Defaults to ``'*all'``, which uses the complete raw issue representation (and
+          retrieves all of each issue's fields).
+
+          .. tip::
+
+            The complete raw issue representation can be an order of magnitude larger
+            than the data point itself. Supplying a list of field names (or
+            :obj:`None <python:None>`) also limits the fields retrieved from JIRA to
+            those that are needed, which shrinks both the JIRA responses and the
+            serialized chart.
+
+        :type custom_fields: iterable of :class:`str <python:str>`, ``'*all'``, or
+          :obj:`None <python:None>`
+        
         :param series_kwargs: Collection of additional keyword arguments to use when 
           instantiating the 
           :class:`GanttSeries <highcharts_gantt.options.series.GanttSeries>` (besides 
@@ -1395,6 +1575,10 @@ class Chart(ChartBase):
                                       jira_client = jira_client,
                                       connection_kwargs = connection_kwargs,
                                       connection_callback = connection_callback,
+                                      page_size = page_size,
+                                      max_workers = max_workers,
+                                      fields = fields,
+                                      custom_fields = custom_fields,
                                       series_kwargs = series_kwargs)
 
         options = HighchartsGanttOptions(**options_kwargs)
@@ -1405,3 +1589,215 @@ class Chart(ChartBase):
         instance.is_gantt_chart = True
         
         return instance
+
+    @classmethod
+    def from_portfolio(cls,
+                       sources,
+                       merge = False,
+                       max_workers = 8,
+                       raise_on_error = False,
+                       series_kwargs = None,
+                       options_kwargs = None,
+                       chart_kwargs = None):
+        """Create a Gantt :class:`Chart <highcharts_gantt.chart.Chart>` instance
+        from a portfolio of Asana, JIRA, and/or Monday.com projects, which are loaded in
+        parallel.
+
+        Each source is described by a :class:`dict <python:dict>` whose ``'type'`` key
+        indicates the project-management system (``'asana'``, ``'jira'``, or
+        ``'monday'``), and whose remaining keys are passed as keyword arguments to the
+        corresponding
+        :class:`GanttSeries <highcharts_gantt.options.series.gantt.GanttSeries>` method
+        (:meth:`.from_asana() <highcharts_gantt.options.series.gantt.GanttSeries.from_asana>`,
+        :meth:`.from_jira() <highcharts_gantt.options.series.gantt.GanttSeries.from_jira>`,
+        or
+        :meth:`.from_monday() <highcharts_gantt.options.series.gantt.GanttSeries.from_monday>`).
+        For example:
+
+        .. code-block:: python
+
+          my_chart = Chart.from_portfolio([
+              {'type': 'jira', 'project_key': 'ABC'},
+              {'type': 'jira', 'project_key': 'XYZ', 'jql': 'project = XYZ AND ...'},
+              {'type': 'asana', 'project_gid': '1234567890'},
+          ])
+
+        The time spent loading each source, and any error raised while doing so, is
+        reported in the chart's
+        :meth:`.portfolio_report <Chart.portfolio_report>`. A source that fails to load
+        does not prevent the others from being charted (unless ``raise_on_error`` is
+        ``True``).
+
+        :param sources: The collection of source descriptors to load.
+        :type sources: iterable of :class:`dict <python:dict>`
+
+        :param merge: If ``True``, assembles all of the sources' data points into a
+          single series. If ``False``, assembles one series per source. Defaults to
+          ``False``.
+
+          .. warning::
+
+            When merging, data point ids must be unique across the sources (e.g. an
+            Asana task that belongs to several of the merged projects is loaded once
+            per project). Only the first data point with a given id is kept; the ids
+            of later duplicates are listed in each source's ``'duplicate_ids'`` in the
+            :meth:`.portfolio_report <Chart.portfolio_report>`, and if
+            ``raise_on_error`` is ``True`` a :exc:`HighchartsValueError` is raised.
+
+        :type merge: :class:`bool <python:bool>`
+
+        :param max_workers: The maximum number of concurrent requests to issue across
+          all sources. Sources are loaded ``min(max_workers, len(sources))`` at a time,
+          and each JIRA source paginates its issues using the remaining share of
+          ``max_workers`` (i.e. ``max_workers // min(max_workers, len(sources))``
+          page workers, and at least one), unless its descriptor supplies its own
+          ``'max_workers'``. Defaults to ``8``.
+        :type max_workers: :class:`int <python:int>`
+
+        :param raise_on_error: If ``True``, re-raises the first error encountered when
+          loading a source (after all sources have been attempted). Defaults to
+          ``False``.
+        :type raise_on_error: :class:`bool <python:bool>`
+
+        :param series_kwargs: Collection of additional keyword arguments to use when
+          instantiating each
+          :class:`GanttSeries <highcharts_gantt.options.series.GanttSeries>` (or the
+          merged series). A source descriptor may also supply its own
+          ``'series_kwargs'``. Defaults to :obj:`None <python:None>`.
+        :type series_kwargs: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+        :param options_kwargs: Collection of keyword arguments to use when instantiating
+          the :class:`HighchartsGanttOptions` (besides the ``series`` argument).
+          Defaults to :obj:`None <python:None>`.
+        :type options_kwargs: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+        :param chart_kwargs: Collection of keyword arguments to use when instantiating
+          the :class:`Chart` (besides the ``options`` argument). Defaults to
+          :obj:`None <python:None>`.
+        :type chart_kwargs: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+        :returns: A Gantt :class:`Chart <highcharts_gantt.chart.Chart>` instance
+        :rtype: :class:`Chart <highcharts_gantt.chart.Chart>`
+
+        :raises HighchartsValueError: if a source descriptor is not a
+          :class:`dict <python:dict>` or has an unsupported ``'type'``, or if
+          ``merge`` and ``raise_on_error`` are ``True`` and the sources share data
+          point ids
+        """
+        series_cls = SERIES_CLASSES.get('gantt', None)
+        loaders = {
+            'asana': (series_cls.from_asana, 'project_gid'),
+            'jira': (series_cls.from_jira, 'project_key'),
+            'monday': (series_cls.from_monday, 'board_id'),
+        }
+
+        sources = [validators.dict(x) for x in validators.iterable(sources,
+                                                                     forbid_literals = (str,
+                                                                                        bytes,
+                                                                                        dict))]
+        for source in sources:
+            if source.get('type', None) not in loaders:
+                raise errors.HighchartsValueError(f'source type must be one of '
+                                                  f'{list(loaders.keys())}. Received: '
+                                                  f'{source.get("type", None)}')
+        merge = bool(merge)
+        max_workers = validators.integer(max_workers, minimum = 1)
+        series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
+        options_kwargs = validators.dict(options_kwargs, allow_empty = True) or {}
+        chart_kwargs = validators.dict(chart_kwargs, allow_empty = True) or {}
+
+        source_workers = min(max_workers, len(sources)) or 1
+        page_workers = max(max_workers // source_workers, 1)
+
+        def load_source(source):
+            loader, name_key = loaders[source['type']]
+            kwargs = {key: value for key, value in source.items() if key != 'type'}
+            if source['type'] == 'jira':
+                kwargs.setdefault('max_workers', page_workers)
+            kwargs['series_kwargs'] = dict(validators.dict(kwargs.get('series_kwargs',
+                                                                      None),
+                                                           allow_empty = True) or {})
+            for key, value in series_kwargs.items():
+                kwargs['series_kwargs'].setdefault(key, value)
+            if not merge:
+                kwargs['series_kwargs'].setdefault('name', str(kwargs.get(name_key, '')))
+
+            report = {
+                'type': source['type'],
+                'name': kwargs['series_kwargs'].get('name', None),
+                'elapsed': None,
+                'data_points': 0,
+                'error': None,
+                'duplicate_ids': []
+            }
+            series = None
+            start = time.perf_counter()
+            try:
+                series = loader(**kwargs)
+                report['data_points'] = len(series.data or [])
+            except Exception as error:
+                report['error'] = error
+            report['elapsed'] = time.perf_counter() - start
+
+            return series, report
+
+        results = []
+        if sources:
+            with ThreadPoolExecutor(max_workers = source_workers) as executor:
+                results = list(executor.map(load_source, sources))
+
+        portfolio_report = [report for series, report in results]
+        if raise_on_error:
+            for report in portfolio_report:
+                if report['error'] is not None:
+                    raise report['error']
+
+        series = [x for x, report in results if x is not None]
+        if merge:
+            data_points = []
+            seen_ids = set()
+            for item, report in results:
+                for data_point in (item.data or []) if item is not None else []:
+                    point_id = getattr(data_point, 'id', None)
+                    if point_id is not None and point_id in seen_ids:
+                        report['duplicate_ids'].append(point_id)
+                        continue
+                    if point_id is not None:
+                        seen_ids.add(point_id)
+                    data_points.append(data_point)
+
+            if raise_on_error:
+                duplicate_ids = [x for report in portfolio_report
+                                 for x in report['duplicate_ids']]
+                if duplicate_ids:
+                    raise errors.HighchartsValueError(f'the merged sources share data '
+                                                      f'point ids: {duplicate_ids}')
+
+            series = [series_cls(**series_kwargs)]
+            series[0].data = data_points
+
+        options = HighchartsGanttOptions(**options_kwargs)
+        options.series = series
+
+        instance = cls(**chart_kwargs)
+        instance.options = options
+        instance.is_gantt_chart = True
+        instance._portfolio_report = portfolio_report
+
+        return instance
+
+    @classmethod
+    async def from_jira_async(cls, *args, **kwargs):
+        """Asynchronous counterpart to :meth:`.from_jira() <Chart.from_jira>`,
+        which accepts the same arguments.
+
+        The requests to JIRA are executed in the
+        :func:`shared thread pool <highcharts_gantt.utility_functions.get_async_executor>`,
+        so that many charts can be created concurrently (e.g. using
+        :func:`asyncio.gather() <python:asyncio.gather>`) without blocking the event
+        loop.
+
+        :returns: A Gantt :class:`Chart <highcharts_gantt.chart.Chart>` instance
+        :rtype: :class:`Chart <highcharts_gantt.chart.Chart>`
+        """
+        return await run_async(cls.from_jira, *args, **kwargs)
@@ -0,0 +1,308 @@
+import datetime
+from array import array
+from collections import namedtuple
+from typing import Optional, List
+
+from validator_collection import validators
+
+from highcharts_gantt import errors
+from highcharts_gantt.utility_functions import paused_gc, get_schedule_timestamps
+
+
+ScheduledTask = namedtuple('ScheduledTask',
+                           ['id',
+                            'early_start',
+                            'early_finish',
+                            'late_start',
+                            'late_finish',
+                            'total_float',
+                            'is_critical'])
+ScheduledTask.__doc__ = """The schedule calculated for a single data point by
+:class:`CriticalPath`.
+
+:param id: The id of the data point.
+:param early_start: The earliest (UTC) date and time at which the task can start.
+:param early_finish: The earliest (UTC) date and time at which the task can finish.
+:param late_start: The latest (UTC) date and time at which the task can start without
+  delaying the project.
+:param late_finish: The latest (UTC) date and time at which the task can finish without
+  delaying the project.
+:param total_float: The amount by which the task can be delayed without delaying the
+  project, as a :class:`timedelta <python:datetime.timedelta>`.
+:param is_critical: ``True`` if the task is on the critical path.
+"""
+
+
+class CriticalPath(object):
+    """The result of a `critical path method <https://en.wikipedia.org/wiki/Critical_path_method>`__
+    (CPM) calculation over a series' data points.
+
+    The calculation runs a forward pass (in topological order) and a backward pass (in
+    reverse topological order) over the series'
+    :class:`DependencyGraph <highcharts_gantt.dependency_graph.DependencyGraph>`, where
+    each data point's duration is the time between its
+    :meth:`.start <highcharts_gantt.options.series.data.gantt.GanttData.start>` and
+    :meth:`.end <highcharts_gantt.options.series.data.gantt.GanttData.end>`:
+
+      * A data point's **early start** is the latest early finish of the data points it
+        depends on, but no earlier than its own ``start``. Data points without a
+        ``start`` that do not depend on any other data point start at the beginning
+        of the project (the earliest ``start`` in the series).
+      * A data point's **late finish** is the earliest late start of the data points
+        that depend on it, or the end of the project (the latest early finish) if no
+        data point depends on it.
+      * A data point's **total float** is the difference between its late start and
+        its early start. Data points whose total float does not exceed ``tolerance``
+        are *critical*.
+
+    .. note::
+
+      Milestones, and data points with no ``end``, have a duration of zero. Data
+      points with an ``end`` but no ``start`` are treated as zero-duration data points
+      at their ``end``.
+
+    Dates are handled internally as POSIX timestamps (in seconds) held in
+    :class:`array <python:array.array>` columns, and are only converted to
+    :class:`datetime <python:datetime.datetime>` values when an individual data point's
+    schedule is retrieved.
+
+    .. tip::
+
+      Rather than instantiating this class directly, you will typically use
+      :meth:`GanttSeries.get_critical_path() <highcharts_gantt.options.series.gantt.GanttSeries.get_critical_path>`.
+
+    :param data: The data points to schedule, as an iterable of
+      :class:`GanttData <highcharts_gantt.options.series.data.gantt.GanttData>`
+      instances or a
+      :class:`GanttDataColumns <highcharts_gantt.options.series.data.gantt.GanttDataColumns>`
+      collection.
+
+    :param graph: The dependency graph of ``data``.
+    :type graph: :class:`DependencyGraph <highcharts_gantt.dependency_graph.DependencyGraph>`
+
+    :param tolerance: The maximum total float for a data point to be considered
+      critical, as a :class:`timedelta <python:datetime.timedelta>` or a number of
+      seconds. Defaults to ``0``.
+    :type tolerance: :class:`timedelta <python:datetime.timedelta>` or numeric
+
+    :raises GanttDependencyError: if ``graph`` contains a dependency cycle
+    """
+
+    def __init__(self, data, graph, tolerance = 0):
+        if isinstance(tolerance, datetime.timedelta):
+            tolerance = tolerance.total_seconds()
+        self._tolerance = validators.numeric(tolerance, minimum = 0)
+        self._graph = graph
+
+        order = graph.topological_order
+        if len(order) != len(graph):
+            raise errors.GanttDependencyError(f'unable to calculate the critical path '
+                                              f'of a series with dependency cycles: '
+                                              f'{graph.cycles}')
+
+        with paused_gc():
+            self._calculate(data, graph)
+
+    def _calculate(self, data, graph):
+        order = graph.topological_order
+        starts, durations = self._get_times(data)
+        size = len(durations)
+        predecessors = graph.predecessors
+        successors = graph.successors
+
+        known_starts = [x for x in starts if x is not None]
+        project_start = min(known_starts) if known_starts else 0.0
+
+        early_start = [0.0] * size
+        early_finish = [0.0] * size
+        for position in order:
+            value = starts[position]
+            for predecessor in predecessors[position]:
+                finish = early_finish[predecessor]
+                if value is None or finish > value:
+                    value = finish
+            if value is None:
+                value = project_start
+            early_start[position] = value
+            early_finish[position] = value + durations[position]
+
+        project_finish = max(early_finish) if size else project_start
+
+        late_start = [0.0] * size
+        late_finish = [0.0] * size
+        for position in reversed(order):
+            value = project_finish
+            for successor in successors[position]:
+                start = late_start[successor]
+                if start < value:
+                    value = start
+            late_finish[position] = value
+            late_start[position] = value - durations[position]
+
+        tolerance = self._tolerance
+        total_float = [late - early for late, early in zip(late_start, early_start)]
+
+        self._project_start = project_start
+        self._project_finish = project_finish
+        self._early_start = array('d', early_start)
+        self._early_finish = array('d', early_finish)
+        self._late_start = array('d', late_start)
+        self._late_finish = array('d', late_finish)
+        self._total_float = array('d', total_float)
+        self._critical = [x <= tolerance for x in total_float]
+
+    @staticmethod
+    def _get_times(data):
+        """Return the start timestamps (or :obj:`None <python:None>`) and durations (in
+        seconds) of the data points in ``data``."""
+        starts = []
+        durations = []
+        for start, end, milestone in get_schedule_timestamps(data):
+            if start is None:
+                start = end
+            if end is None or start is None or milestone or end < start:
+                durations.append(0.0)
+            else:
+                durations.append(end - start)
+            starts.append(start)
+
+        return starts, durations
+
+    def __len__(self):
+        return len(self._critical)
+
+    def __getitem__(self, id) -> ScheduledTask:
+        return self.get_task(self._graph.index[id])
+
+    @staticmethod
+    def _to_datetime(value):
+        return datetime.datetime.fromtimestamp(value, tz = datetime.timezone.utc)
+
+    @property
+    def tolerance(self) -> float:
+        """The maximum total float (in seconds) for a data point to be considered
+        critical.
+
+        :rtype: :class:`float <python:float>`
+        """
+        return self._tolerance
+
+    @property
+    def project_start(self) -> datetime.datetime:
+        """The (UTC) date and time at which the project starts.
+
+        :rtype: :class:`datetime <python:datetime.datetime>`
+        """
+        return self._to_datetime(self._project_start)
+
+    @property
+    def project_finish(self) -> datetime.datetime:
+        """The (UTC) date and time at which the project finishes.
+
+        :rtype: :class:`datetime <python:datetime.datetime>`
+        """
+        return self._to_datetime(self._project_finish)
+
+    @property
+    def early_start(self) -> array:
+        """The early start of each data point (in series order), as POSIX timestamps in
+        seconds.
+
+        :rtype: :class:`array <python:array.array>`
+        """
+        return self._early_start
+
+    @property
+    def early_finish(self) -> array:
+        """The early finish of each data point (in series order), as POSIX timestamps in
+        seconds.
+
+        :rtype: :class:`array <python:array.array>`
+        """
+        return self._early_finish
+
+    @property
+    def late_start(self) -> array:
+        """The late start of each data point (in series order), as POSIX timestamps in
+        seconds.
+
+        :rtype: :class:`array <python:array.array>`
+        """
+        return self._late_start
+
+    @property
+    def late_finish(self) -> array:
+        """The late finish of each data point (in series order), as POSIX timestamps in
+        seconds.
+
+        :rtype: :class:`array <python:array.array>`
+        """
+        return self._late_finish
+
+    @property
+    def total_float(self) -> array:
+        """The total float of each data point (in series order), in seconds.
+
+        :rtype: :class:`array <python:array.array>`
+        """
+        return self._total_float
+
+    @property
+    def critical(self) -> List[bool]:
+        """Whether each data point (in series order) is critical.
+
+        :rtype: :class:`list <python:list>` of :class:`bool <python:bool>`
+        """
+        return self._critical
+
+    @property
+    def critical_path(self) -> List[Optional[str]]:
+        """The ids of the critical data points, in dependency (topological) order.
+
+        :rtype: :class:`list <python:list>` of :class:`str <python:str>`
+        """
+        ids = self._graph.ids
+        critical = self._critical
+
+        return [ids[x] for x in self._graph.topological_order if critical[x]]
+
+    @property
+    def critical_edges(self) -> List[tuple]:
+        """The dependencies that drive the critical path, as ``(predecessor, successor)``
+        pairs of positions in the series. A dependency is *driving* if both data points
+        are critical and the successor's early start equals the predecessor's early
+        finish.
+
+        :rtype: :class:`list <python:list>` of :class:`tuple <python:tuple>`
+        """
+        critical = self._critical
+        early_start = self._early_start
+        early_finish = self._early_finish
+        tolerance = self._tolerance
+        edges = []
+        for successor, predecessors in enumerate(self._graph.predecessors):
+            if not critical[successor]:
+                continue
+            for predecessor in predecessors:
+                if critical[predecessor] and \
+                   abs(early_start[successor] - early_finish[predecessor]) <= tolerance:
+                    edges.append((predecessor, successor))
+
+        return edges
+
+    def get_task(self, position) -> ScheduledTask:
+        """Return the schedule of the data point at ``position`` in the series.
+
+        :param position: The position of the data point in the series'
+          :meth:`.data <highcharts_gantt.options.series.gantt.GanttSeries.data>`.
+        :type position: :class:`int <python:int>`
+
+        :rtype: :class:`ScheduledTask`
+        """
+        return ScheduledTask(self._graph.ids[position],
+                             self._to_datetime(self._early_start[position]),
+                             self._to_datetime(self._early_finish[position]),
+                             self._to_datetime(self._late_start[position]),
+                             self._to_datetime(self._late_finish[position]),
+                             datetime.timedelta(seconds = self._total_float[position]),
+                             self._critical[position])
@@ -0,0 +1,403 @@
+from collections import deque, namedtuple
+from typing import Optional, List
+
+from validator_collection import checkers
+
+from highcharts_gantt import errors
+from highcharts_gantt.utility_functions import paused_gc
+
+
+DanglingReference = namedtuple('DanglingReference',
+                               ['index', 'id', 'attribute', 'target'])
+DanglingReference.__doc__ = """A reference from a data point to an id that is not
+present in the series.
+
+:param index: The position of the referring data point in the series'
+  :meth:`.data <highcharts_gantt.options.series.gantt.GanttSeries.data>`.
+:param id: The id of the referring data point (which may be
+  :obj:`None <python:None>`).
+:param attribute: The property holding the reference, either ``'dependency'`` or
+  ``'parent'``.
+:param target: The id that could not be found.
+"""
+
+
+class DependencyGraph(object):
+    """An index of the graph implied by the
+    :meth:`.dependency <highcharts_gantt.options.series.data.gantt.GanttData.dependency>`
+    and :meth:`.parent <highcharts_gantt.options.series.data.gantt.GanttData.parent>`
+    properties of a series' data points.
+
+    The index is built in a single pass over the data points (with an additional linear
+    pass for cycle detection), and identifies each data point by its position in the
+    series' :meth:`.data <highcharts_gantt.options.series.gantt.GanttSeries.data>`.
+
+    Dependency edges run from the data point depended upon (the *predecessor*) to the
+    dependent data point (the *successor*).
+
+    .. tip::
+
+      Rather than instantiating this class directly, you will typically use the
+      (cached)
+      :meth:`GanttSeries.dependency_graph <highcharts_gantt.options.series.gantt.GanttSeries.dependency_graph>`
+      property.
+
+    :param data: The data points to index, as an iterable of
+      :class:`GanttData <highcharts_gantt.options.series.data.gantt.GanttData>`
+      instances or a
+      :class:`GanttDataColumns <highcharts_gantt.options.series.data.gantt.GanttDataColumns>`
+      collection. Defaults to :obj:`None <python:None>`.
+    """
+
+    def __init__(self, data = None):
+        self._ids = []
+        self._index = {}
+        self._duplicate_ids = []
+        self._predecessors = []
+        self._successors = []
+        self._parents = []
+        self._children = []
+        self._dangling_references = []
+        self._topological_order = None
+        self._cycles = None
+        self._parent_cycles = None
+
+        self._build(data or [])
+
+    @staticmethod
+    def _get_links(data):
+        """Return the ``(id, parent, dependency)`` of each data point in ``data``."""
+        if checkers.is_type(data, 'GanttDataColumns'):
+            return [(data._id[index], data._parent[index], data._dependency[index])
+                    if view is None else (view.id, view.parent, view.dependency)
+                    for index, view in enumerate(data._views)]
+
+        return [(x.id, x.parent, x.dependency) for x in data]
+
+    def _build(self, data):
+        with paused_gc():
+            self._build_index(data)
+
+    def _build_index(self, data):
+        links = self._get_links(data)
+        ids = self._ids
+        index = self._index
+        for position, link in enumerate(links):
+            id_ = link[0]
+            ids.append(id_)
+            if id_ is None:
+                continue
+            if id_ in index:
+                self._duplicate_ids.append(id_)
+            else:
+                index[id_] = position
+
+        size = len(links)
+        predecessors = self._predecessors = [[] for x in range(size)]
+        successors = self._successors = [[] for x in range(size)]
+        parents = self._parents = [None] * size
+        children = self._children = [[] for x in range(size)]
+        dangling = self._dangling_references
+
+        for position, (id_, parent, dependency) in enumerate(links):
+            if dependency:
+                if isinstance(dependency, str) or \
+                   not isinstance(dependency, (list, tuple)):
+                    dependency = [dependency]
+                for target in dependency:
+                    if not isinstance(target, str):
+                        target = getattr(target, 'to', None)
+                        if target is None:
+                            continue
+                    target_position = index.get(target, None)
+                    if target_position is None:
+                        dangling.append(DanglingReference(position,
+                                                          id_,
+                                                          'dependency',
+                                                          target))
+                        continue
+                    predecessors[position].append(target_position)
+                    successors[target_position].append(position)
+
+            if parent is not None:
+                parent_position = index.get(parent, None)
+                if parent_position is None:
+                    dangling.append(DanglingReference(position, id_, 'parent', parent))
+                else:
+                    parents[position] = parent_position
+                    children[parent_position].append(position)
+
+    def __len__(self):
+        return len(self._ids)
+
+    @property
+    def ids(self) -> List[Optional[str]]:
+        """The ids of the data points, in series order.
+
+        :rtype: :class:`list <python:list>` of :class:`str <python:str>` or
+          :obj:`None <python:None>`
+        """
+        return self._ids
+
+    @property
+    def index(self) -> dict:
+        """Mapping of each data point id to the data point's position in the series. If
+        an id is duplicated, maps to its first occurrence.
+
+        :rtype: :class:`dict <python:dict>`
+        """
+        return self._index
+
+    @property
+    def duplicate_ids(self) -> List[str]:
+        """The ids that are used by more than one data point.
+
+        :rtype: :class:`list <python:list>` of :class:`str <python:str>`
+        """
+        return self._duplicate_ids
+
+    @property
+    def predecessors(self) -> List[List[int]]:
+        """Adjacency list of the data points on which each data point depends, as
+        positions in the series.
+
+        :rtype: :class:`list <python:list>` of :class:`list <python:list>` of
+          :class:`int <python:int>`
+        """
+        return self._predecessors
+
+    @property
+    def successors(self) -> List[List[int]]:
+        """Adjacency list of the data points which depend on each data point, as
+        positions in the series.
+
+        :rtype: :class:`list <python:list>` of :class:`list <python:list>` of
+          :class:`int <python:int>`
+        """
+        return self._successors
+
+    @property
+    def parents(self) -> List[Optional[int]]:
+        """The position of each data point's parent, or :obj:`None <python:None>` if it
+        has no (resolvable) parent.
+
+        :rtype: :class:`list <python:list>` of :class:`int <python:int>` or
+          :obj:`None <python:None>`
+        """
+        return self._parents
+
+    @property
+    def children(self) -> List[List[int]]:
+        """Adjacency list of each data point's children, as positions in the series.
+
+        :rtype: :class:`list <python:list>` of :class:`list <python:list>` of
+          :class:`int <python:int>`
+        """
+        return self._children
+
+    @property
+    def dangling_references(self) -> List[DanglingReference]:
+        """The dependency and parent references to ids that are not present in the
+        series.
+
+        :rtype: :class:`list <python:list>` of :class:`DanglingReference`
+        """
+        return self._dangling_references
+
+    @property
+    def topological_order(self) -> List[int]:
+        """The positions of the data points, ordered so that each data point comes
+        after all of the data points it depends on. Ties are broken by series order.
+
+        .. note::
+
+          Data points that are part of a dependency cycle - or that depend (directly or
+          indirectly) on one - cannot be ordered, and are omitted.
+
+        :rtype: :class:`list <python:list>` of :class:`int <python:int>`
+        """
+        if self._topological_order is None:
+            in_degree = [len(x) for x in self._predecessors]
+            queue = deque(position for position, degree in enumerate(in_degree)
+                          if not degree)
+            order = []
+            successors = self._successors
+            while queue:
+                position = queue.popleft()
+                order.append(position)
+                for successor in successors[position]:
+                    in_degree[successor] -= 1
+                    if not in_degree[successor]:
+                        queue.append(successor)
+
+            self._topological_order = order
+
+        return self._topological_order
+
+    @property
+    def cycles(self) -> List[List[str]]:
+        """The dependency cycles found in the series, each expressed as the ids of the
+        data points that form it (in series order).
+
+        :rtype: :class:`list <python:list>` of :class:`list <python:list>` of
+          :class:`str <python:str>`
+        """
+        if self._cycles is None:
+            if len(self.topological_order) == len(self._ids):
+                # Every data point could be ordered, so there can be no cycles.
+                self._cycles = []
+            else:
+                self._cycles = [[self._ids[x] for x in component]
+                                for component
+                                in self._get_strongly_connected_components()]
+
+        return self._cycles
+
+    @property
+    def parent_cycles(self) -> List[List[str]]:
+        """The cycles found among the data points' parents (e.g. a data point that is
+        its own grandparent), each expressed as the ids of the data points that form it.
+
+        :rtype: :class:`list <python:list>` of :class:`list <python:list>` of
+          :class:`str <python:str>`
+        """
+        if self._parent_cycles is None:
+            parents = self._parents
+            state = [0] * len(parents)
+            cycles = []
+            for start in range(len(parents)):
+                path = []
+                position = start
+                while position is not None and not state[position]:
+                    state[position] = 1
+                    path.append(position)
+                    position = parents[position]
+                if position is not None and state[position] == 1:
+                    cycle = path[path.index(position):]
+                    cycles.append([self._ids[x] for x in sorted(cycle)])
+                for visited in path:
+                    state[visited] = 2
+
+            self._parent_cycles = cycles
+
+        return self._parent_cycles
+
+    @property
+    def is_valid(self) -> bool:
+        """``True`` if the series has no duplicate ids, dangling references, or cycles.
+
+        :rtype: :class:`bool <python:bool>`
+        """
+        return not (self._duplicate_ids or
+                    self._dangling_references or
+                    self.cycles or
+                    self.parent_cycles)
+
+    def validate(self):
+        """Raise an exception if the series has duplicate ids, dangling references, or
+        cycles.
+
+        :raises GanttDependencyError: if the graph is not valid
+        """
+        if self.is_valid:
+            return
+
+        problems = []
+        if self._duplicate_ids:
+            problems.append(f'duplicate ids: {self._duplicate_ids}')
+        if self._dangling_references:
+            references = [f'{x.id} -> {x.target} ({x.attribute})'
+                          for x in self._dangling_references]
+            problems.append(f'dangling references: {references}')
+        if self.cycles:
+            problems.append(f'dependency cycles: {self.cycles}')
+        if self.parent_cycles:
+            problems.append(f'parent cycles: {self.parent_cycles}')
+
+        raise errors.GanttDependencyError('invalid dependency graph, with ' +
+                                          '; '.join(problems))
+
+    def get_predecessors(self, id) -> List[Optional[str]]:
+        """Return the ids of the data points on which the data point ``id`` depends.
+
+        :param id: The id of the data point.
+        :type id: :class:`str <python:str>`
+
+        :rtype: :class:`list <python:list>` of :class:`str <python:str>`
+
+        :raises KeyError: if ``id`` is not present in the series
+        """
+        return [self._ids[x] for x in self._predecessors[self._index[id]]]
+
+    def get_successors(self, id) -> List[Optional[str]]:
+        """Return the ids of the data points which depend on the data point ``id``.
+
+        :param id: The id of the data point.
+        :type id: :class:`str <python:str>`
+
+        :rtype: :class:`list <python:list>` of :class:`str <python:str>`
+
+        :raises KeyError: if ``id`` is not present in the series
+        """
+        return [self._ids[x] for x in self._successors[self._index[id]]]
+
+    def _get_strongly_connected_components(self):
+        """Return the strongly-connected components of the dependency graph which form
+        cycles, using an iterative version of Tarjan's algorithm.
+
+        :rtype: :class:`list <python:list>` of :class:`list <python:list>` of
+          :class:`int <python:int>`
+        """
+        successors = self._successors
+        size = len(successors)
+        indices = [-1] * size
+        low_links = [0] * size
+        on_stack = [False] * size
+        stack = []
+        components = []
+        counter = 0
+
+        for root in range(size):
+            if indices[root] != -1:
+                continue
+            work = [(root, 0)]
+            while work:
+                position, next_child = work.pop()
+                if next_child == 0:
+                    indices[position] = low_links[position] = counter
+                    counter += 1
+                    stack.append(position)
+                    on_stack[position] = True
+
+                recurse = False
+                children = successors[position]
+                for child_index in range(next_child, len(children)):
+                    child = children[child_index]
+                    if indices[child] == -1:
+                        work.append((position, child_index + 1))
+                        work.append((child, 0))
+                        recurse = True
+                        break
+                    elif on_stack[child]:
+                        low_links[position] = min(low_links[position], indices[child])
+                if recurse:
+                    continue
+
+                if low_links[position] == indices[position]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == position:
+                            break
+                    if len(component) > 1 or position in successors[position]:
+                        components.append(sorted(component))
+
+                if work:
+                    parent = work[-1][0]
+                    low_links[parent] = min(low_links[parent], low_links[position])
+
+        components.sort()
+
+        return components
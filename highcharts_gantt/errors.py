@@ -56,3 +56,10 @@ class JIRADuplicateIssueError(HighchartsValueError):
     """:exc:`ValueError <python:ValueError>` encountered when encountering a JIRA issue 
     that is a duplicate of another issue."""
     pass
+
+
+class GanttDependencyError(HighchartsValueError):
+    """:exc:`ValueError <python:ValueError>` encountered when a series' data points contain
+    duplicate ids, references to data points that do not exist, or dependency / parent
+    cycles."""
+    pass
@@ -0,0 +1,261 @@
+import os
+import re
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+
+from validator_collection import validators
+
+_EXPORT_CACHE = None
+
+_ENTRY_NAME = re.compile(r'^[0-9a-f]{64}$')
+
+
+class ExportCache(object):
+    """A persistent, content-addressed cache of the chart images produced by the
+    :term:`Export Server`.
+
+    Each exported image is stored in its own file within
+    :meth:`.path <ExportCache.path>`, named by a hash of the request sent to the
+    export server (i.e. of the serialized chart options together with the export
+    parameters such as format, scale, and width). Identical exports are therefore
+    served from disk without contacting the export server.
+
+    Once the cached images exceed :meth:`.max_size <ExportCache.max_size>` bytes, the
+    least-recently used images are evicted. Recency is recorded in the files'
+    modification times, so it persists between sessions and is shared by processes
+    that use the same directory.
+    """
+
+    def __init__(self, path = None, max_size = 256 * 2**20):
+        self._lock = threading.Lock()
+        self._path = None
+        self._max_size = None
+        self._entries = OrderedDict()
+        self._size = 0
+
+        self.path = path
+        self.max_size = max_size
+
+    @property
+    def path(self) -> str:
+        """The directory in which exported images are persisted. Defaults to
+        ``'~/.cache/highcharts_gantt/exports'``.
+
+        :rtype: :class:`str <python:str>`
+        """
+        return self._path
+
+    @path.setter
+    def path(self, value):
+        value = validators.string(value, allow_empty = True) or \
+            os.path.join(os.path.expanduser('~'),
+                         '.cache',
+                         'highcharts_gantt',
+                         'exports')
+        os.makedirs(value, exist_ok = True)
+
+        entries = []
+        with os.scandir(value) as iterator:
+            for entry in iterator:
+                if _ENTRY_NAME.match(entry.name) and entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.name, stat.st_size))
+
+        with self._lock:
+            self._path = value
+            self._entries = OrderedDict((name, size)
+                                        for _, name, size in sorted(entries))
+            self._size = sum(self._entries.values())
+
+    @property
+    def max_size(self) -> int:
+        """The maximum number of bytes of exported images to keep on disk. Defaults to
+        ``268435456`` (256 MiB).
+
+        :rtype: :class:`int <python:int>`
+        """
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value):
+        self._max_size = validators.integer(value, minimum = 0)
+        self.evict()
+
+    @property
+    def size(self) -> int:
+        """The number of bytes of exported images currently held in the cache.
+
+        :rtype: :class:`int <python:int>`
+        """
+        return self._size
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(*args):
+        """Return the cache key for an export request described by ``args`` (e.g. the
+        export server's URL and the request body).
+
+        :rtype: :class:`str <python:str>`
+        """
+        digest = hashlib.sha256()
+        for arg in args:
+            if arg is None:
+                arg = b''
+            elif not isinstance(arg, bytes):
+                arg = str(arg).encode('utf-8')
+            digest.update(b'\x00' + arg)
+
+        return digest.hexdigest()
+
+    def get(self, key):
+        """Return the exported image stored under ``key``, marking it as the most
+        recently used.
+
+        :param key: The key of the entry.
+        :type key: :class:`str <python:str>`
+
+        :returns: The exported image, or :obj:`None <python:None>` if there is no such
+          entry.
+        :rtype: :class:`bytes <python:bytes>` or :obj:`None <python:None>`
+        """
+        filename = os.path.join(self.path, key)
+        try:
+            with open(filename, 'rb') as file_:
+                content = file_.read()
+            os.utime(filename)
+        except FileNotFoundError:
+            with self._lock:
+                self._size -= self._entries.pop(key, 0)
+            return None
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = len(content)
+                self._size += len(content)
+            self._entries.move_to_end(key)
+
+        return content
+
+    def set(self, key, content):
+        """Store ``content`` under ``key``, replacing any existing entry, then evict
+        the least-recently used entries if the cache has grown beyond
+        :meth:`.max_size <ExportCache.max_size>`.
+
+        .. note::
+
+          Content that is larger than :meth:`.max_size <ExportCache.max_size>` is not
+          stored.
+
+        :param key: The key under which to store the entry.
+        :type key: :class:`str <python:str>`
+
+        :param content: The exported image.
+        :type content: :class:`bytes <python:bytes>`
+        """
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        if len(content) > self.max_size:
+            return
+
+        descriptor, temporary = tempfile.mkstemp(dir = self.path, suffix = '.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as file_:
+                file_.write(content)
+            os.replace(temporary, os.path.join(self.path, key))
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+
+        with self._lock:
+            self._size += len(content) - self._entries.pop(key, 0)
+            self._entries[key] = len(content)
+
+        self.evict()
+
+    def evict(self):
+        """Remove the least-recently used entries until the cache holds no more than
+        :meth:`.max_size <ExportCache.max_size>` bytes.
+
+        :returns: The number of entries removed.
+        :rtype: :class:`int <python:int>`
+        """
+        removed = []
+        with self._lock:
+            while self._entries and self._size > self._max_size:
+                key, size = self._entries.popitem(last = False)
+                self._size -= size
+                removed.append(key)
+
+        for key in removed:
+            try:
+                os.remove(os.path.join(self.path, key))
+            except FileNotFoundError:
+                pass
+
+        return len(removed)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            removed = list(self._entries)
+            self._entries.clear()
+            self._size = 0
+
+        for key in removed:
+            try:
+                os.remove(os.path.join(self.path, key))
+            except FileNotFoundError:
+                pass
+
+
+def get_export_cache():
+    """Return the :class:`ExportCache` enabled using
+    :func:`enable_export_cache() <highcharts_gantt.export_cache.enable_export_cache>`,
+    if any.
+
+    :rtype: :class:`ExportCache` or :obj:`None <python:None>`
+    """
+    return _EXPORT_CACHE
+
+
+def enable_export_cache(path = None, max_size = 256 * 2**20):
+    """Enable the persistent export cache, so that charts exported using
+    :meth:`Chart.download_chart() <highcharts_gantt.chart.Chart.download_chart>` or
+    the :class:`ExportServer <highcharts_gantt.headless_export.ExportServer>` are
+    served from disk whenever an identical chart has already been exported.
+
+    :param path: The directory in which to persist exported images. Defaults to
+      :obj:`None <python:None>`, which uses ``'~/.cache/highcharts_gantt/exports'``.
+    :type path: :class:`str <python:str>` or :obj:`None <python:None>`
+
+    :param max_size: The maximum number of bytes of exported images to keep on disk.
+      Defaults to ``268435456`` (256 MiB).
+    :type max_size: :class:`int <python:int>`
+
+    :returns: The enabled cache.
+    :rtype: :class:`ExportCache`
+    """
+    global _EXPORT_CACHE
+
+    _EXPORT_CACHE = ExportCache(path = path, max_size = max_size)
+
+    return _EXPORT_CACHE
+
+
+def disable_export_cache():
+    """Disable the persistent export cache.
+
+    .. note::
+
+      Images that have already been cached remain on disk, and are served again once
+      the cache is re-enabled with the same ``path``.
+
+    """
+    global _EXPORT_CACHE
+
+    _EXPORT_CACHE = None
@@ -1,11 +1,21 @@
+import copy
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from dotenv import load_dotenv
 from typing import Optional
 
-from validator_collection import checkers
+import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from validator_collection import validators, checkers
 
 from highcharts_core.headless_export import ExportServer as ExportServerBase
 
+from highcharts_gantt import errors
 from highcharts_gantt.decorators import validate_types
+from highcharts_gantt.export_cache import get_export_cache
 from highcharts_gantt.options import HighchartsOptions, HighchartsGanttOptions, HighchartsStockOptions
 from highcharts_gantt.global_options.shared_options import (SharedOptions,
                                                             SharedStockOptions,
@@ -13,6 +23,10 @@ from highcharts_gantt.global_options.shared_options import (SharedOptions,
 
 load_dotenv()
 
+#: HTTP status codes returned by the export server which indicate that a request
+#: may succeed if retried.
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
 
 class ExportServer(ExportServerBase):
     """Class that provides methods for interacting with the Highcharts
@@ -31,8 +45,46 @@ class ExportServer(ExportServerBase):
     """
 
     def __init__(self, **kwargs):
+        self._session = None
+        self._pool_size = 0
+
         super().__init__(**kwargs)
 
+    @property
+    def domain(self) -> Optional[str]:
+        """The domain where the :term:`Export Server` can be found. Defaults to the
+        Highsoft-provided Export Server at ``'export.highcharts.com'``, unless over-ridden
+        by the ``HIGHCHARTS_EXPORT_SERVER_DOMAIN`` environment variable.
+
+        .. tip::
+
+          This property is set automatically by the ``HIGHCHARTS_EXPORT_SERVER_DOMAIN``
+          environment variable, if present.
+
+        .. hint::
+
+          IP addresses (e.g. ``'127.0.0.1'`` for an Export Server running locally) are
+          also accepted.
+
+        .. warning::
+
+          If set to :obj:`None <python:None>`, will fall back to the
+          ``HIGHCHARTS_EXPORT_SERVER_DOMAIN`` value if available, and the Highsoft-
+          provided server (``'export.highcharts.com'``) if not.
+
+        :rtype: :class:`str <python:str>`
+        """
+        return self._domain
+
+    @domain.setter
+    def domain(self, value):
+        value = validators.domain(value, allow_empty = True, allow_ips = True)
+        if not value:
+            value = os.getenv('HIGHCHARTS_EXPORT_SERVER_DOMAIN',
+                              'export.highcharts.com')
+        self._domain = value
+        self._url = None
+
     @property
     def options(self) -> Optional[HighchartsOptions | HighchartsGanttOptions | HighchartsStockOptions]:
         """The :class:`HighchartsOptions` which should be applied to render the exported
@@ -85,3 +137,455 @@ class ExportServer(ExportServerBase):
                 self._global_options = validate_types(value, SharedGanttOptions)
             else:
                 self._global_options = validate_types(value, SharedOptions)
+
+    def _get_session(self, pool_size = 10) -> requests.Session:
+        """Return the pooled :class:`Session <requests:requests.Session>` used to
+        issue batch requests to the :term:`Export Server`, creating it (or enlarging its
+        connection pool) if needed.
+
+        :param pool_size: The number of connections to keep open to the export server.
+          Defaults to ``10``.
+        :type pool_size: :class:`int <python:int>`
+
+        :rtype: :class:`Session <requests:requests.Session>`
+        """
+        if self._session is None or self._pool_size < pool_size:
+            if self._session is not None:
+                self._session.close()
+
+            adapter = HTTPAdapter(pool_maxsize = pool_size)
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+
+            self._session = session
+            self._pool_size = pool_size
+
+        return self._session
+
+    def close(self):
+        """Close the pooled connections held open by :meth:`request_charts`, if any."""
+        if self._session is not None:
+            self._session.close()
+
+        self._session = None
+        self._pool_size = 0
+
+    def _get_payload(self) -> str:
+        """Return the JSON request body to send to the :term:`Export Server` based on
+        the configuration in the instance.
+
+        :rtype: :class:`str <python:str>`
+
+        :raises HighchartsMissingExportSettingsError: if the instance is missing a
+          setting that is required to export a chart
+        """
+        missing_details = []
+        if not self.options:
+            missing_details.append('options')
+        if not self.format_:
+            missing_details.append('format_')
+        if not self.constructor:
+            missing_details.append('constructor')
+        if not self.url:
+            missing_details.append('url')
+
+        if missing_details:
+            raise errors.HighchartsMissingExportSettingsError(
+                f'Unable to export a chart.'
+                f'ExportServer was missing '
+                f' following settings: '
+                f'{missing_details}'
+            )
+
+        serialized = {
+            'infile': self.options,
+            'callback': self.callback,
+            'globalOptions': self.global_options,
+            'dataOptions': self.data_options,
+            'customCode': self.custom_code
+        }
+        serialized = {key: value for key, value in serialized.items() if value}
+
+        payload = {
+            'infile': 'HIGHCHARTS FOR PYTHON: REPLACE WITH infile',
+            'type': self.format_,
+            'scale': self.scale,
+            'constr': self.constructor,
+            'b64': self.use_base64,
+            'noDownload': self.no_download,
+            'asyncRendering': self.async_rendering
+        }
+        if self.width:
+            payload['width'] = self.width
+        for key in serialized:
+            payload[key] = f'HIGHCHARTS FOR PYTHON: REPLACE WITH {key}'
+
+        as_json = json.dumps(payload)
+        for key, value in serialized.items():
+            value_as_json = value.to_json()
+            if isinstance(value_as_json, bytes):
+                value_as_json = str(value_as_json, encoding = 'utf-8')
+
+            as_json = as_json.replace(f'"HIGHCHARTS FOR PYTHON: REPLACE WITH {key}"',
+                                      value_as_json)
+
+        return as_json
+
+    def _export(self,
+                filename = None,
+                session = None,
+                auth = None,
+                timeout = 0.5,
+                retries = 0,
+                backoff = 0.5):
+        """Export the chart configured in the instance, serving it from the
+        :class:`ExportCache <highcharts_gantt.export_cache.ExportCache>` enabled using
+        :func:`enable_export_cache() <highcharts_gantt.export_cache.enable_export_cache>`
+        (if any) and otherwise requesting it from the :term:`Export Server`.
+
+        :param filename: The name of the file where the exported chart should
+          (optionally) be persisted. Defaults to :obj:`None <python:None>`.
+        :type filename: Path-like or :obj:`None <python:None>`
+
+        :param session: The session to use to issue the request. Defaults to
+          :obj:`None <python:None>`, which issues a one-off request.
+        :type session: :class:`Session <requests:requests.Session>` or
+          :obj:`None <python:None>`
+
+        :param auth: The authentication to apply to the request. Defaults to
+          :obj:`None <python:None>`.
+        :type auth: :class:`HTTPBasicAuth <requests:requests.auth.HTTPBasicAuth>` or
+          :obj:`None <python:None>`
+
+        :param timeout: The number of seconds to wait before issuing a timeout error.
+          Defaults to ``0.5``.
+        :type timeout: numeric or :obj:`None <python:None>`
+
+        :param retries: The number of times to retry a failed request. Defaults to
+          ``0``.
+        :type retries: :class:`int <python:int>`
+
+        :param backoff: The number of seconds to wait before the first retry, doubling
+          with each subsequent retry. Defaults to ``0.5``.
+        :type backoff: numeric
+
+        :returns: The exported chart image.
+        :rtype: :class:`bytes <python:bytes>`
+        """
+        payload = self._get_payload()
+
+        cache = get_export_cache()
+        key = None
+        content = None
+        if cache is not None:
+            key = cache.make_key(self.url, payload)
+            content = cache.get(key)
+
+        if content is None:
+            session = session or requests
+            for attempt in range(retries + 1):
+                try:
+                    result = session.post(self.url,
+                                          data = payload,
+                                          headers = { 'Content-Type': 'application/json' },
+                                          auth = auth,
+                                          timeout = timeout)
+                except (requests.ConnectionError, requests.Timeout):
+                    if attempt == retries:
+                        raise
+                else:
+                    if result.status_code not in RETRY_STATUS_CODES or attempt == retries:
+                        break
+
+                time.sleep(backoff * 2 ** attempt)
+
+            result.raise_for_status()
+            content = result.content
+
+            if cache is not None:
+                cache.set(key, content)
+
+        if filename:
+            with open(filename, 'wb') as file_:
+                file_.write(content)
+
+        return content
+
+    def request_chart(self,
+                      filename = None,
+                      auth_user = None,
+                      auth_password = None,
+                      timeout = 0.5,
+                      **kwargs):
+        """Execute a request against the export server based on the configuration in the
+        instance.
+
+        .. tip::
+
+          If an :class:`ExportCache <highcharts_gantt.export_cache.ExportCache>` has
+          been enabled using
+          :func:`enable_export_cache() <highcharts_gantt.export_cache.enable_export_cache>`,
+          a chart that has already been exported with the same options and export
+          settings is served from the cache without contacting the export server.
+
+        :param filename: The name of the file where the exported chart should (optionally)
+          be persisted. Defaults to :obj:`None <python:None>`.
+        :type filename: Path-like or :obj:`None <python:None>`
+
+        :param auth_user: The username to use to authenticate against the
+          Export Server, using :term:`basic authentication`. Defaults to
+          :obj:`None <python:None>`.
+        :type auth_user: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param auth_password: The password to use to authenticate against the Export
+          Server (using :term:`basic authentication`). Defaults to
+          :obj:`None <python:None>`.
+        :type auth_password: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param timeout: The number of seconds to wait before issuing a timeout error.
+          The timeout check is passed if bytes have been received on the socket in less
+          than the ``timeout`` value. Defaults to ``0.5``.
+        :type timeout: numeric or :obj:`None <python:None>`
+
+        .. note::
+
+          All other keyword arguments are as per the :class:`ExportServer` constructor
+          :meth:`ExportServer.__init__() <highcharts_gantt.headless_export.ExportServer.__init__>`
+
+        :returns: The exported chart image, either as a :class:`bytes <python:bytes>`
+          binary object or as a base-64 encoded string (depending on the
+          :meth:`use_base64 <ExportServer.use_base64>` property).
+        :rtype: :class:`bytes <python:bytes>` or :class:`str <python:str>`
+        """
+        self.options = kwargs.get('options', self.options)
+        self.format_ = kwargs.get('format_', kwargs.get('type', self.format_))
+        self.scale = kwargs.get('scale', self.scale)
+        self.width = kwargs.get('width', self.width)
+        self.callback = kwargs.get('callback', self.callback)
+        self.constructor = kwargs.get('constructor', self.constructor)
+        self.use_base64 = kwargs.get('use_base64', self.use_base64)
+        self.no_download = kwargs.get('no_download', self.no_download)
+        self.async_rendering = kwargs.get('async_rendering', self.async_rendering)
+        self.global_options = kwargs.get('global_options', self.global_options)
+        self.data_options = kwargs.get('data_options', self.data_options)
+        self.custom_code = kwargs.get('custom_code', self.custom_code)
+
+        basic_auth = None
+        if auth_user and auth_password:
+            basic_auth = HTTPBasicAuth(auth_user, auth_password)
+
+        return self._export(filename = filename,
+                            auth = basic_auth,
+                            timeout = timeout)
+
+    def _get_batch_instance(self, chart):
+        """Return a copy of the instance configured to export ``chart``, along with
+        the file to which the exported chart should be persisted.
+
+        :param chart: The chart to export. Accepts a
+          :class:`Chart <highcharts_gantt.chart.Chart>`, an options instance, or a
+          :class:`dict <python:dict>` of keyword arguments as per the
+          :class:`ExportServer` constructor (plus an optional ``filename``).
+
+        :rtype: :class:`tuple <python:tuple>` of :class:`ExportServer` and Path-like or
+          :obj:`None <python:None>`
+        """
+        if checkers.is_type(chart, 'Chart'):
+            kwargs = {'options': chart.options}
+        elif isinstance(chart, dict):
+            kwargs = chart
+        else:
+            kwargs = {'options': chart}
+
+        instance = copy.copy(self)
+        instance.format_ = kwargs.get('format_', kwargs.get('type', self.format_))
+        for key in ['options',
+                    'scale',
+                    'width',
+                    'callback',
+                    'constructor',
+                    'use_base64',
+                    'no_download',
+                    'async_rendering',
+                    'global_options',
+                    'data_options',
+                    'custom_code']:
+            if key in kwargs:
+                setattr(instance, key, kwargs[key])
+
+        return instance, kwargs.get('filename', None)
+
+    def request_charts(self,
+                       charts,
+                       auth_user = None,
+                       auth_password = None,
+                       timeout = 0.5,
+                       max_workers = 8,
+                       retries = 2,
+                       backoff = 0.5,
+                       raise_errors = True):
+        """Export a batch of charts concurrently, yielding each exported chart as soon
+        as it has been received from the :term:`Export Server`.
+
+        Requests are issued over a single pooled
+        :class:`Session <requests:requests.Session>` (which remains open for
+        re-use until :meth:`close() <ExportServer.close>` is called) by up to
+        ``max_workers`` threads. ``charts`` is consumed lazily, with no more than
+        ``2 * max_workers`` charts in flight at any one time, so that a large batch
+        (or a generator of charts) is never serialized in full up-front.
+
+        Requests that fail due to a connection error, a timeout, or a transient HTTP
+        status (``429``, ``500``, ``502``, ``503``, or ``504``) are retried up to
+        ``retries`` times, waiting ``backoff * 2 ** attempt`` seconds between attempts.
+
+        :param charts: The charts to export. Each item may be a
+          :class:`Chart <highcharts_gantt.chart.Chart>`, an options instance (e.g.
+          :class:`HighchartsGanttOptions <highcharts_gantt.options.HighchartsGanttOptions>`),
+          or a :class:`dict <python:dict>` of keyword arguments as per the
+          :class:`ExportServer` constructor, which may also supply a ``filename`` where
+          the exported chart should be persisted. Settings not supplied by an item are
+          taken from the instance.
+        :type charts: iterable
+
+        :param auth_user: The username to use to authenticate against the
+          Export Server, using :term:`basic authentication`. Defaults to
+          :obj:`None <python:None>`.
+        :type auth_user: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param auth_password: The password to use to authenticate against the Export
+          Server (using :term:`basic authentication`). Defaults to
+          :obj:`None <python:None>`.
+        :type auth_password: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param timeout: The number of seconds to wait before issuing a timeout error.
+          The timeout check is passed if bytes have been received on the socket in less
+          than the ``timeout`` value. Defaults to ``0.5``.
+        :type timeout: numeric or :obj:`None <python:None>`
+
+        :param max_workers: The maximum number of charts to export concurrently.
+          Defaults to ``8``.
+        :type max_workers: :class:`int <python:int>`
+
+        :param retries: The number of times to retry a failed request. Defaults to
+          ``2``.
+        :type retries: :class:`int <python:int>`
+
+        :param backoff: The number of seconds to wait before the first retry, doubling
+          with each subsequent retry. Defaults to ``0.5``.
+        :type backoff: numeric
+
+        :param raise_errors: If ``True``, the first chart that cannot be exported
+          raises its error (and the remaining charts are abandoned). If ``False``, the
+          error is yielded in place of the exported chart and the batch continues.
+          Defaults to ``True``.
+        :type raise_errors: :class:`bool <python:bool>`
+
+        :returns: Iterator of ``(index, exported_chart)`` tuples in order of
+          completion, where ``index`` is the position of the chart in ``charts`` and
+          ``exported_chart`` is either a :class:`bytes <python:bytes>` binary object or a
+          base-64 encoded string (depending on the
+          :meth:`use_base64 <ExportServer.use_base64>` setting), or the
+          :class:`Exception <python:Exception>` raised if ``raise_errors`` is ``False``
+        :rtype: iterator of :class:`tuple <python:tuple>`
+        """
+        max_workers = validators.integer(max_workers, minimum = 1)
+        retries = validators.integer(retries, minimum = 0)
+        backoff = validators.numeric(backoff, minimum = 0)
+
+        session = self._get_session(max_workers)
+        basic_auth = None
+        if auth_user and auth_password:
+            basic_auth = HTTPBasicAuth(auth_user, auth_password)
+
+        def export(chart):
+            instance, filename = self._get_batch_instance(chart)
+
+            return instance._export(filename = filename,
+                                    session = session,
+                                    auth = basic_auth,
+                                    timeout = timeout,
+                                    retries = retries,
+                                    backoff = backoff)
+
+        charts = enumerate(charts)
+        pending = {}
+        with ThreadPoolExecutor(max_workers = max_workers) as executor:
+            try:
+                for index, chart in charts:
+                    pending[executor.submit(export, chart)] = index
+                    if len(pending) < 2 * max_workers:
+                        continue
+
+                    done, _ = wait(pending, return_when = FIRST_COMPLETED)
+                    for future in done:
+                        yield self._get_batch_result(pending, future, raise_errors)
+
+                while pending:
+                    done, _ = wait(pending, return_when = FIRST_COMPLETED)
+                    for future in done:
+                        yield self._get_batch_result(pending, future, raise_errors)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    @staticmethod
+    def _get_batch_result(pending, future, raise_errors):
+        """Remove the completed ``future`` from ``pending`` and return its
+        ``(index, exported_chart)`` tuple.
+
+        :rtype: :class:`tuple <python:tuple>`
+        """
+        index = pending.pop(future)
+        try:
+            return index, future.result()
+        except Exception as error:
+            if raise_errors:
+                raise
+
+            return index, error
+
+    @classmethod
+    def get_charts(cls,
+                   charts,
+                   auth_user = None,
+                   auth_password = None,
+                   timeout = 0.5,
+                   max_workers = 8,
+                   retries = 2,
+                   backoff = 0.5,
+                   raise_errors = True,
+                   **kwargs):
+        """Produce a batch of exported chart images concurrently, yielding each one as
+        it completes.
+
+        :param charts: The charts to export. Each item may be a
+          :class:`Chart <highcharts_gantt.chart.Chart>`, an options instance, or a
+          :class:`dict <python:dict>` of keyword arguments as per the
+          :class:`ExportServer` constructor (plus an optional ``filename``).
+        :type charts: iterable
+
+        .. note::
+
+          All other arguments are as per
+          :meth:`ExportServer.request_charts() <ExportServer.request_charts>`, while
+          all other keyword arguments are as per the :class:`ExportServer` constructor
+          and apply to every chart in ``charts``.
+
+        :returns: Iterator of ``(index, exported_chart)`` tuples in order of
+          completion.
+        :rtype: iterator of :class:`tuple <python:tuple>`
+        """
+        instance = cls(**kwargs)
+
+        try:
+            yield from instance.request_charts(charts,
+                                               auth_user = auth_user,
+                                               auth_password = auth_password,
+                                               timeout = timeout,
+                                               max_workers = max_workers,
+                                               retries = retries,
+                                               backoff = backoff,
+                                               raise_errors = raise_errors)
+        finally:
+            instance.close()
@@ -0,0 +1,167 @@
+import datetime
+from array import array
+from typing import List
+
+from validator_collection import validators
+
+from highcharts_gantt import errors
+from highcharts_gantt.utility_functions import paused_gc, get_schedule_timestamps
+
+
+class IntervalIndex(object):
+    """An index of the time intervals covered by a series' data points, used to find
+    the data points that overlap a given time window without scanning the whole
+    series.
+
+    The index is an implicit, augmented
+    `interval tree <https://en.wikipedia.org/wiki/Interval_tree#Augmented_tree>`__: the
+    data points' intervals are sorted by their
+    :meth:`.start <highcharts_gantt.options.series.data.gantt.GanttData.start>` and
+    held in :class:`array <python:array.array>` columns, with the (balanced) binary
+    tree implied by the sorted order and each node recording the latest
+    :meth:`.end <highcharts_gantt.options.series.data.gantt.GanttData.end>` found in
+    its subtree. Building the index takes *O(n log n)* time, and a query takes
+    *O(log n + k)* time (for *k* matching data points) in the typical case.
+
+    .. note::
+
+      Milestones, and data points with no ``end``, are indexed as instants at their
+      ``start``. Data points with an ``end`` but no ``start`` are indexed as instants
+      at their ``end``. Data points with neither a ``start`` nor an ``end`` are not
+      indexed, and never overlap a window.
+
+    .. tip::
+
+      Rather than instantiating this class directly, you will typically use the
+      (cached)
+      :meth:`GanttSeries.interval_index <highcharts_gantt.options.series.gantt.GanttSeries.interval_index>`
+      property, or
+      :meth:`GanttSeries.get_window() <highcharts_gantt.options.series.gantt.GanttSeries.get_window>`.
+
+    :param data: The data points to index, as an iterable of
+      :class:`GanttData <highcharts_gantt.options.series.data.gantt.GanttData>`
+      instances or a
+      :class:`GanttDataColumns <highcharts_gantt.options.series.data.gantt.GanttDataColumns>`
+      collection. Defaults to :obj:`None <python:None>`.
+    """
+
+    def __init__(self, data = None):
+        self._size = 0
+        self._starts = array('d')
+        self._ends = array('d')
+        self._max_ends = array('d')
+        self._positions = array('q')
+
+        with paused_gc():
+            self._build(data or [])
+
+    def _build(self, data):
+        timestamps = get_schedule_timestamps(data)
+        self._size = len(timestamps)
+        intervals = []
+        for position, (start, end, milestone) in enumerate(timestamps):
+            if start is None:
+                start = end
+            if start is None:
+                continue
+            if end is None or milestone or end < start:
+                end = start
+            intervals.append((start, end, position))
+
+        intervals.sort()
+        self._starts = array('d', [x[0] for x in intervals])
+        self._ends = array('d', [x[1] for x in intervals])
+        self._positions = array('q', [x[2] for x in intervals])
+        self._max_ends = array('d', self._ends)
+
+        # Post-order pass over the implicit tree, in which the node for the range
+        # [low, high) is the interval at (low + high) // 2.
+        ends = self._ends
+        max_ends = self._max_ends
+        stack = [(0, len(intervals), False)]
+        while stack:
+            low, high, visited = stack.pop()
+            if low >= high:
+                continue
+            middle = (low + high) // 2
+            if not visited:
+                stack.append((low, high, True))
+                stack.append((low, middle, False))
+                stack.append((middle + 1, high, False))
+                continue
+            value = ends[middle]
+            if low < middle and max_ends[(low + middle) // 2] > value:
+                value = max_ends[(low + middle) // 2]
+            if middle + 1 < high and max_ends[(middle + 1 + high) // 2] > value:
+                value = max_ends[(middle + 1 + high) // 2]
+            max_ends[middle] = value
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def indexed_count(self) -> int:
+        """The number of data points in the index, excluding those with neither a
+        ``start`` nor an ``end``.
+
+        :rtype: :class:`int <python:int>`
+        """
+        return len(self._positions)
+
+    @staticmethod
+    def _to_timestamp(value):
+        if isinstance(value, datetime.datetime):
+            return value.timestamp()
+
+        return validators.datetime(value).timestamp()
+
+    def overlapping(self, start, end) -> List[int]:
+        """Return the positions (in series order) of the data points whose interval
+        overlaps the window from ``start`` to ``end``.
+
+        A data point overlaps the window if it starts no later than ``end`` and ends no
+        earlier than ``start``, so data points that only touch the window's boundaries
+        are included.
+
+        :param start: The beginning of the window.
+        :type start: :class:`datetime <python:datetime.datetime>`, or a value that can
+          be coerced to one
+
+        :param end: The end of the window.
+        :type end: :class:`datetime <python:datetime.datetime>`, or a value that can be
+          coerced to one
+
+        :returns: The positions of the overlapping data points in the series'
+          :meth:`.data <highcharts_gantt.options.series.gantt.GanttSeries.data>`.
+        :rtype: :class:`list <python:list>` of :class:`int <python:int>`
+
+        :raises HighchartsValueError: if ``end`` is earlier than ``start``
+        """
+        low = self._to_timestamp(start)
+        high = self._to_timestamp(end)
+        if high < low:
+            raise errors.HighchartsValueError(f'end ({end}) cannot be earlier than '
+                                              f'start ({start})')
+
+        starts = self._starts
+        ends = self._ends
+        max_ends = self._max_ends
+        positions = self._positions
+        result = []
+        stack = [(0, len(positions))]
+        while stack:
+            first, last = stack.pop()
+            if first >= last:
+                continue
+            middle = (first + last) // 2
+            if max_ends[middle] < low:
+                continue
+            stack.append((first, middle))
+            if starts[middle] <= high:
+                if ends[middle] >= low:
+                    result.append(positions[middle])
+                stack.append((middle + 1, last))
+
+        result.sort()
+
+        return result
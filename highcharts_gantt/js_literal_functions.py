@@ -1 +1,135 @@
 from highcharts_core.js_literal_functions import *
+
+import io
+from collections import UserDict
+
+from validator_collection import checkers
+
+from highcharts_gantt import errors
+from highcharts_gantt.metaclasses import HighchartsMeta, ChangeTrackingMixin
+
+
+# Implementations of ``to_js_literal()`` whose output is assembled from the object's
+# untrimmed dict, and which can therefore be reproduced incrementally.
+_ASSEMBLED_TO_JS_LITERAL = (HighchartsMeta.to_js_literal,
+                            ChangeTrackingMixin.to_js_literal)
+
+
+def _is_list(item) -> bool:
+    return checkers.is_iterable(item, forbid_literals = (str, bytes, dict, UserDict))
+
+
+def _is_assembled(item) -> bool:
+    return getattr(item.__class__, 'to_js_literal', None) in _ASSEMBLED_TO_JS_LITERAL
+
+
+def _serialize(item, encoding = 'utf-8'):
+    """Equivalent to :func:`serialize_to_js_literal`, but without populating the
+    cached fragments of change-tracked objects."""
+    if _is_list(item):
+        return [_serialize(x, encoding = encoding) for x in item]
+    elif _is_assembled(item):
+        buffer = io.StringIO()
+        if not _write_object(item, buffer.write, encoding = encoding):
+            return None
+        return buffer.getvalue()
+
+    return serialize_to_js_literal(item, encoding = encoding)
+
+
+def _write_object(item, write, encoding = 'utf-8') -> bool:
+    if isinstance(item, ChangeTrackingMixin):
+        cached = item._get_fragment('js_literal')
+        if cached is not None:
+            write(cached)
+            return True
+
+    # Lists (e.g. a series' data points) are written one member at a time. Every
+    # other property is small, and is serialized up-front.
+    untrimmed = item._to_untrimmed_dict()
+    properties = []
+    for key in untrimmed:
+        value = untrimmed[key]
+        if _is_list(value):
+            properties.append((key, value, True))
+            continue
+        serialized = _serialize(value, encoding = encoding)
+        if serialized is not None:
+            properties.append((key, serialized, False))
+
+    if not properties:
+        return False
+
+    write('{\n')
+    last = len(properties) - 1
+    for counter, (key, value, is_list) in enumerate(properties):
+        write(f"""  {key}: """)
+        if is_list:
+            _write_list(value, write, encoding = encoding)
+        else:
+            write(get_js_literal(value))
+        write(',\n' if counter < last else '\n')
+    write('}')
+
+    return True
+
+
+def _write_list(items, write, encoding = 'utf-8'):
+    write('[')
+    is_first = True
+    for item in items:
+        if not is_first:
+            write(',\n')
+        is_first = False
+        if not _is_list(item) and _is_assembled(item):
+            if not _write_object(item, write, encoding = encoding):
+                write(get_js_literal(None))
+        else:
+            write(get_js_literal(_serialize(item, encoding = encoding)))
+    write(']')
+
+
+def write_js_literal(item, stream, encoding = 'utf-8') -> bool:
+    """Write the JavaScript object literal representation of ``item`` to ``stream``,
+    one piece at a time.
+
+    Produces the same output as ``item.to_js_literal()``, but lists (e.g. a series'
+    data points, or an options object's series) are written one member at a time
+    rather than being assembled into a single string, so the memory needed does not
+    grow with the size of the data.
+
+    .. note::
+
+      Unlike :meth:`to_js_literal() <highcharts_core.metaclasses.HighchartsMeta.to_js_literal>`,
+      this function does not cache the serialized fragments of the data points it
+      writes, though it will re-use any fragments that have already been cached.
+
+    :param item: The Highcharts object to serialize.
+    :type item: :class:`HighchartsMeta <highcharts_core.metaclasses.HighchartsMeta>`
+
+    :param stream: A writable text stream (e.g. a file opened in text mode, or an
+      :class:`io.StringIO <python:io.StringIO>`).
+
+    :param encoding: The character encoding to apply when serializing values. Defaults
+      to ``'utf-8'``.
+    :type encoding: :class:`str <python:str>`
+
+    :returns: ``True`` if ``item`` was written, or ``False`` if it has no properties to
+      serialize (in which case nothing is written).
+    :rtype: :class:`bool <python:bool>`
+
+    :raises HighchartsValueError: if ``stream`` is not writable
+    """
+    write = getattr(stream, 'write', None)
+    if not callable(write):
+        raise errors.HighchartsValueError(f'stream must be a writable text stream. '
+                                          f'Received: {stream.__class__.__name__}')
+
+    if not _is_assembled(item):
+        as_str = item.to_js_literal(encoding = encoding)
+        if as_str is None:
+            return False
+        write(as_str)
+        return True
+
+    return _write_object(item, write, encoding = encoding)
@@ -1 +1,349 @@
 from highcharts_core.metaclasses import *
+
+import datetime
+from decimal import Decimal
+from typing import Optional
+
+from validator_collection import validators
+
+from highcharts_core.constants import EnforcedNullType
+from highcharts_core.utility_classes.javascript_functions import CallbackFunction
+
+
+# Values of these types cannot be changed in-place, so they are held in a snapshot
+# as-is.
+_IMMUTABLE_TYPES = (str, int, float, Decimal, datetime.date, datetime.time,
+                    datetime.timedelta, EnforcedNullType)
+
+# Marks a value whose changes cannot be detected.
+_UNTRACKED = object()
+
+
+class ChangeTrackingMixin(object):
+    """Mixin which detects whether an object - or any of the objects it holds - has
+    changed since it was last serialized, so that the object's serialized fragments
+    (its JavaScript object literal and JSON representations) can be cached and re-used
+    until it changes.
+
+    When a fragment is cached, it is stored alongside a snapshot of the object's
+    state: the values of the attributes declared in its ``__slots__``, with any
+    change-tracked objects it holds (directly, or within a
+    :class:`list <python:list>`) replaced by their own snapshots. A cached fragment is
+    re-used for as long as the object's current snapshot equals the stored one, so when
+    a large series is re-serialized after a small edit, only the data points that
+    changed are serialized again.
+
+    .. note::
+
+      Objects holding a value whose changes cannot be detected (e.g. a
+      :class:`dict <python:dict>`, or a Highcharts object which does not use this
+      mixin) are never cached.
+
+    """
+
+    __slots__ = ('_fragments', )
+
+    @staticmethod
+    def _get_value_snapshot(value):
+        """Return a snapshot of ``value``, or ``_UNTRACKED`` if its changes cannot be
+        detected."""
+        if value is None or isinstance(value, _IMMUTABLE_TYPES):
+            return value
+        elif isinstance(value, ChangeTrackingMixin):
+            return value._get_snapshot()
+        elif isinstance(value, (list, tuple)):
+            snapshot = tuple([ChangeTrackingMixin._get_value_snapshot(x) for x in value])
+            if _UNTRACKED in snapshot:
+                return _UNTRACKED
+
+            return (value.__class__, snapshot)
+
+        return _UNTRACKED
+
+    def _get_snapshot(self):
+        """Return a snapshot of the object's state, or ``_UNTRACKED`` if it holds a
+        value whose changes cannot be detected."""
+        get_value_snapshot = self._get_value_snapshot
+        snapshot = [self.__class__]
+        for name in self.__slots__:
+            value = get_value_snapshot(getattr(self, name, None))
+            if value is _UNTRACKED:
+                return _UNTRACKED
+            snapshot.append(value)
+
+        return tuple(snapshot)
+
+    def _get_fragment(self, key):
+        """Return the cached fragment stored under ``key``, or
+        :obj:`None <python:None>` if it is missing or the object has changed since it
+        was cached."""
+        fragments = getattr(self, '_fragments', None)
+        if fragments is None or key not in fragments[1]:
+            return None
+        if self._get_snapshot() != fragments[0]:
+            self._fragments = None
+            return None
+
+        return fragments[1][key]
+
+    def _set_fragment(self, key, value):
+        """Cache ``value`` as the fragment stored under ``key``."""
+        snapshot = self._get_snapshot()
+        if snapshot is _UNTRACKED:
+            self._fragments = None
+            return
+        fragments = getattr(self, '_fragments', None)
+        if fragments is None or fragments[0] != snapshot:
+            fragments = (snapshot, {})
+            self._fragments = fragments
+        fragments[1][key] = value
+
+    def to_js_literal(self,
+                      filename = None,
+                      encoding = 'utf-8') -> Optional[str]:
+        """Return the object represented as a :class:`str <python:str>` containing the
+        JavaScript object literal.
+
+        .. note::
+
+          The result is cached, and re-used until the object changes.
+
+        :param filename: The name of a file to which the JavaScript object literal should
+          be persisted. Defaults to :obj:`None <python:None>`
+        :type filename: Path-like
+
+        :param encoding: The character encoding to apply to the resulting object. Defaults
+          to ``'utf-8'``.
+        :type encoding: :class:`str <python:str>`
+
+        :rtype: :class:`str <python:str>` or :obj:`None <python:None>`
+        """
+        if filename:
+            filename = validators.path(filename)
+
+        as_str = self._get_fragment('js_literal')
+        if as_str is None:
+            as_str = super().to_js_literal(encoding = encoding)
+            self._set_fragment('js_literal', as_str)
+
+        if filename:
+            with open(filename, 'w', encoding = encoding) as file_:
+                file_.write(as_str)
+
+        return as_str
+
+    def to_json(self,
+                filename = None,
+                encoding = 'utf-8'):
+        """Generate a JSON string/byte string representation of the object compatible with
+        the Highcharts JavaScript library.
+
+        .. note::
+
+          The result is cached, and re-used until the object changes.
+
+        :param filename: The name of a file to which the JSON string should be persisted.
+          Defaults to :obj:`None <python:None>`
+        :type filename: Path-like
+
+        :param encoding: The character encoding to apply to the resulting object. Defaults
+          to ``'utf-8'``.
+        :type encoding: :class:`str <python:str>`
+
+        :returns: A JSON representation of the object compatible with the Highcharts
+          library.
+        :rtype: :class:`str <python:str>` or :class:`bytes <python:bytes>`
+        """
+        if filename:
+            filename = validators.path(filename)
+
+        key = ('json', encoding)
+        as_json = self._get_fragment(key)
+        if as_json is None:
+            as_json = super().to_json(encoding = encoding)
+            self._set_fragment(key, as_json)
+
+        if filename:
+            if isinstance(as_json, bytes):
+                with open(filename, 'wb') as file_:
+                    file_.write(as_json)
+            else:
+                with open(filename, 'w', encoding = encoding) as file_:
+                    file_.write(as_json)
+
+        return as_json
+
+
+def _is_iterable(value) -> bool:
+    """Equivalent to ``checkers.is_iterable(value, forbid_literals = (str, bytes,
+    dict))``, for values that are not :obj:`None <python:None>`."""
+    if isinstance(value, (list, tuple)):
+        return True
+    elif isinstance(value, (str, bytes, dict)):
+        return False
+    try:
+        iter(value)
+    except TypeError:
+        return False
+
+    return True
+
+
+def _trim_dict(untrimmed) -> dict:
+    """Equivalent to
+    :meth:`HighchartsMeta.trim_dict() <highcharts_core.metaclasses.HighchartsMeta.trim_dict>`
+    with ``to_json = True``, using plain type checks."""
+    as_dict = {}
+    for key in untrimmed:
+        value = untrimmed[key]
+        if value is None:
+            continue
+        elif isinstance(value, bool):
+            as_dict[key] = value
+        elif isinstance(value, CallbackFunction):
+            continue
+        elif value and hasattr(value, '_to_untrimmed_dict'):
+            trimmed_value = _trim_dict(value._to_untrimmed_dict())
+            if trimmed_value:
+                as_dict[key] = trimmed_value
+        elif isinstance(value, EnforcedNullType):
+            as_dict[key] = 'null'
+        elif isinstance(value, dict):
+            trimmed_value = _trim_dict(value)
+            if trimmed_value:
+                as_dict[key] = trimmed_value
+        elif _is_iterable(value):
+            trimmed_value = _trim_iterable(value)
+            if trimmed_value:
+                as_dict[key] = trimmed_value
+        elif value or value in [0, 0., False]:
+            as_dict[key] = value
+
+    return as_dict
+
+
+def _trim_iterable(untrimmed) -> list:
+    """Equivalent to
+    :meth:`HighchartsMeta.trim_iterable() <highcharts_core.metaclasses.HighchartsMeta.trim_iterable>`
+    with ``to_json = True``, using plain type checks."""
+    trimmed = []
+    for item in untrimmed:
+        if item is None or isinstance(item, EnforcedNullType):
+            trimmed.append('null')
+        elif isinstance(item, CallbackFunction):
+            continue
+        elif hasattr(item, 'trim_dict'):
+            item_as_dict = _trim_dict(item._to_untrimmed_dict())
+            if item_as_dict:
+                trimmed.append(item_as_dict)
+        elif isinstance(item, dict):
+            if item:
+                trimmed.append(_trim_dict(item))
+        elif _is_iterable(item):
+            if item:
+                trimmed.append(_trim_iterable(item))
+        else:
+            trimmed.append(item)
+
+    return trimmed
+
+
+class DirectJSONMixin(object):
+    """Mixin which serializes an object to JSON in a single pass, without the
+    per-value validation checks applied by
+    :meth:`HighchartsMeta.trim_dict() <highcharts_core.metaclasses.HighchartsMeta.trim_dict>`.
+
+    The object's untrimmed :class:`dict <python:dict>` representation (and those of
+    the objects it holds, including each data point) is trimmed into plain Python
+    values using simple type checks, and then encoded in one call to the JSON library.
+    When `orjson <https://github.com/ijl/orjson>`__ is installed, it encodes the values
+    (including any :class:`datetime <python:datetime.datetime>` values) directly to
+    :class:`bytes <python:bytes>`. The result is identical to that of the generic
+    serialization, but is produced many times faster for large charts.
+    """
+
+    __slots__ = ()
+
+    def _to_json(self, encoding = 'utf-8'):
+        as_dict = _trim_dict(self._to_untrimmed_dict())
+        for key in as_dict:
+            if as_dict[key] == 'null' or isinstance(as_dict[key], EnforcedNullType):
+                as_dict[key] = None
+        try:
+            return json.dumps(as_dict, encoding = encoding)
+        except TypeError:
+            return json.dumps(as_dict)
+
+    def to_json(self,
+                filename = None,
+                encoding = 'utf-8'):
+        """Generate a JSON string/byte string representation of the object compatible with
+        the Highcharts JavaScript library.
+
+        .. note::
+
+          This method will either return a standard :class:`str <python:str>` or a
+          :class:`bytes <python:bytes>` object depending on the JSON serialization library
+          you are using. For example, if your environment has
+          `orjson <https://github.com/ijl/orjson>`_, the result will be a
+          :class:`bytes <python:bytes>` representation of the string.
+
+        :param filename: The name of a file to which the JSON string should be persisted.
+          Defaults to :obj:`None <python:None>`
+        :type filename: Path-like
+
+        :param encoding: The character encoding to apply to the resulting object. Defaults
+          to ``'utf-8'``.
+        :type encoding: :class:`str <python:str>`
+
+        :returns: A JSON representation of the object compatible with the Highcharts
+          library.
+        :rtype: :class:`str <python:str>` or :class:`bytes <python:bytes>`
+        """
+        if filename:
+            filename = validators.path(filename)
+
+        as_json = self._to_json(encoding = encoding)
+
+        if filename:
+            if isinstance(as_json, bytes):
+                with open(filename, 'wb') as file_:
+                    file_.write(as_json)
+            else:
+                with open(filename, 'w', encoding = encoding) as file_:
+                    file_.write(as_json)
+
+        return as_json
+
+    def to_json_bytes(self,
+                      filename = None,
+                      encoding = 'utf-8') -> bytes:
+        """Generate a JSON byte string representation of the object compatible with the
+        Highcharts JavaScript library.
+
+        Returns the same JSON as :meth:`.to_json() <DirectJSONMixin.to_json>`, but
+        always as :class:`bytes <python:bytes>` (e.g. for writing directly to an HTTP
+        response), regardless of the JSON serialization library in use.
+
+        :param filename: The name of a file to which the JSON should be persisted.
+          Defaults to :obj:`None <python:None>`
+        :type filename: Path-like
+
+        :param encoding: The character encoding to apply if the JSON serialization
+          library returns a :class:`str <python:str>`. Defaults to ``'utf-8'``.
+        :type encoding: :class:`str <python:str>`
+
+        :rtype: :class:`bytes <python:bytes>`
+        """
+        if filename:
+            filename = validators.path(filename)
+
+        as_json = self._to_json(encoding = encoding)
+        if not isinstance(as_json, bytes):
+            as_json = as_json.encode(encoding)
+
+        if filename:
+            with open(filename, 'wb') as file_:
+                file_.write(as_json)
+
+        return as_json
@@ -1,4 +1,7 @@
 import os
+import time
+import threading
+from functools import partial
 from validator_collection import validators, checkers
 
 import logging
@@ -26,6 +29,7 @@ except ImportError:
 import requests
 
 from highcharts_gantt import errors
+from highcharts_gantt.response_cache import install_response_cache
 
 
 def get_column_definitions(client, board_id):
@@ -66,7 +70,251 @@ def get_column_definitions(client, board_id):
     return column_definitions
 
 
-def get_tasks(board_id, api_token = None, log_tasks = False):
+def get_client(api_token = None):
+    """Return an authenticated Monday.com API client.
+
+    :param api_token: The Monday.com API token to use when authenticating your
+        request against the Monday.com API. Defaults to :obj:`None <python:None>`,
+        which will then try to determine the token from the ``MONDAY_API_TOKEN``
+        environment variable.
+    :type api_token: :class:`str <python:str>` or :obj:`None <python:None>`
+
+    :rtype: :class:`monday.MondayClient <monday:MondayClient>`
+
+    :raises HighchartsDependencyError: if the
+      `monday <https://pypi.org/project/monday/>`__ Python library is not available
+      in the runtime environment
+    :raises MondayAuthenticationError: if there is no Monday.com API token supplied
+    """
+    if not HAS_MONDAY:
+        raise errors.HighchartsDependencyError('the .from_monday() method depends '
+                                                'on the monday Python library. That '
+                                                'library was not found in your '
+                                                'runtime environment.')
+    if not api_token:
+        api_token = os.getenv('MONDAY_API_TOKEN', None)
+    
+    if not api_token:
+        raise errors.MondayAuthenticationError('.from_monday() requires a '
+                                                'Monday.com API token. None was '
+                                                'supplied.')
+
+    api_token = validators.string(api_token)
+
+    return install_response_cache(monday.MondayClient(api_token), 'monday')
+
+
+def iter_item_pages(client, board_id, page_size = 100):
+    """Iterate over the pages of Monday.com items present in ``board_id``, retrieving
+    them from the Monday.com API one page at a time.
+
+    :param client: The `monday <https://monday.readthedocs.io/en/latest/>`__ API client
+      to use to retrieve the items.
+    :type client: :class:`monday.MondayClient <monday:MondayClient>`
+
+    :param board_id: The unique identifier of the board whose items should be retrieved.
+    :type board_id: :class:`int <python:int>` or :class:`str <python:str>`
+
+    :param page_size: The number of items to retrieve per request. Defaults to ``100``.
+    :type page_size: :class:`int <python:int>`
+
+    :returns: Generator which yields each page as a :class:`list <python:list>` of
+      the Monday.com representation of its items.
+    :rtype: generator of :class:`list <python:list>` of :class:`dict <python:dict>`
+
+    :raises MondayAuthenticationError: if the Monday.com API token is not authorized
+    :raises MondayBoardNotFoundError: if the ``board_id`` is not found
+    """
+    page_size = validators.integer(page_size, minimum = 1)
+
+    page = 1
+    while True:
+        try:
+            response = client.boards.fetch_items_by_board_id([board_id],
+                                                             limit = page_size,
+                                                             page = page)
+        except requests.exceptions.HTTPError:
+            raise errors.MondayAuthenticationError('The Monday.com API token returned as unauthorized.')
+        data = response['data']
+        boards = data['boards']
+        if len(boards) == 0:
+            raise errors.MondayBoardNotFoundError(f'board_id ({board_id}) was not found')
+
+        items = boards[0]['items']
+        yield items
+
+        if len(items) < page_size:
+            break
+
+        page += 1
+
+
+def iter_items(client, board_id, page_size = 100):
+    """Iterate over every Monday.com item present in ``board_id``, retrieving them from
+    the Monday.com API one page at a time.
+
+    :param client: The `monday <https://monday.readthedocs.io/en/latest/>`__ API client
+      to use to retrieve the items.
+    :type client: :class:`monday.MondayClient <monday:MondayClient>`
+
+    :param board_id: The unique identifier of the board whose items should be retrieved.
+    :type board_id: :class:`int <python:int>` or :class:`str <python:str>`
+
+    :param page_size: The number of items to retrieve per request. Defaults to ``100``.
+    :type page_size: :class:`int <python:int>`
+
+    :returns: Generator which yields the Monday.com representation of each item.
+    :rtype: generator of :class:`dict <python:dict>`
+
+    :raises MondayBoardNotFoundError: if the ``board_id`` is not found
+    """
+    for items in iter_item_pages(client, board_id, page_size = page_size):
+        for item in items:
+            yield item
+
+
+def get_subitem_ids(item, column_definitions):
+    """Return the IDs of the sub-items linked to ``item``.
+
+    :param item: The Monday.com item representation.
+    :type item: :class:`dict <python:dict>`
+
+    :param column_definitions: The column definition object returned by the Monday.com
+      API, or the compiled :class:`BoardSchema` for the board.
+    :type column_definitions: :class:`dict <python:dict>` or :class:`BoardSchema`
+
+    :returns: The IDs of the linked sub-items.
+    :rtype: :class:`list <python:list>` of :class:`str <python:str>`
+    """
+    schema = BoardSchema.from_column_definitions(column_definitions)
+
+    subitem_ids = []
+    for column in item.get('column_values', []):
+        type_ = column.get('type', None)
+        if type_ != 'subtasks':
+            try:
+                type_ = schema.get_column(column)[1]
+            except KeyError:
+                continue
+        if type_ != 'subtasks' or not column.get('value', None):
+            continue
+
+        value = json.loads(column['value'])
+        for entry in value.get('linkedPulseIds', []):
+            item_id = entry.get('linkedPulseId', None)
+            if item_id is not None:
+                subitem_ids.append(str(item_id))
+
+    return subitem_ids
+
+
+def get_items_by_id(client, item_ids, batch_size = 25):
+    """Retrieve the Monday.com items whose IDs are in ``item_ids``, requesting them in
+    batches rather than one at a time.
+
+    :param client: The `monday <https://monday.readthedocs.io/en/latest/>`__ API client
+      to use to retrieve the items.
+    :type client: :class:`monday.MondayClient <monday:MondayClient>`
+
+    :param item_ids: The IDs of the items to retrieve.
+    :type item_ids: iterable of :class:`str <python:str>` or :class:`int <python:int>`
+
+    :param batch_size: The number of items to request per API call. Defaults to ``25``,
+      which is the number of items the Monday.com API returns by default.
+    :type batch_size: :class:`int <python:int>`
+
+    :returns: Collection of Monday.com item representations, with the item ID as the
+      key.
+    :rtype: :class:`dict <python:dict>`
+
+    :raises MondayItemNotFoundError: if any of the ``item_ids`` was not found
+    """
+    batch_size = validators.integer(batch_size, minimum = 1)
+
+    unique_ids = list(dict.fromkeys(str(x) for x in item_ids))
+
+    items = {}
+    for index in range(0, len(unique_ids), batch_size):
+        batch = [int(x) for x in unique_ids[index:index + batch_size]]
+        response = client.items.fetch_items_by_id(batch)
+        data = response['data']
+        for item in data['items']:
+            items[str(item['id'])] = item
+
+    missing_ids = [x for x in unique_ids if x not in items]
+    if missing_ids:
+        raise errors.MondayItemNotFoundError(f'Item IDs ({", ".join(missing_ids)}) '
+                                             f'were not found')
+
+    return items
+
+
+def iter_tasks(board_id, api_token = None, page_size = 100, log_tasks = False, schema_ttl = 300):
+    """Iterate over the Monday.com items (tasks) that are present in ``board_id``,
+    converting, elevating, and flattening each item as its page is retrieved.
+
+    .. tip::
+
+      Because items are processed as they are retrieved, memory usage remains flat
+      regardless of the number of items in the board. The sub-items linked to each
+      page of items are retrieved together in a small number of batched requests.
+
+    :param board_id: The unique identifier of the board whose items should be retrieved.
+    :type board_id: :class:`int <python:int>` or :class:`str <python:str>`
+
+    :param api_token: The Monday.com API token to use when authenticating your
+        request against the Monday.com API. Defaults to :obj:`None <python:None>`,
+        which will then try to determine the token from the ``MONDAY_API_TOKEN``
+        environment variable.
+    :type api_token: :class:`str <python:str>` or :obj:`None <python:None>`
+
+    :param page_size: The number of items to retrieve per request. Defaults to ``100``.
+    :type page_size: :class:`int <python:int>`
+
+    :param log_tasks: if ``True``, then will output the task :class:`dict <python:dict>` object
+      at the ``logging.INFO`` level. Defaults to ``False``.
+    :type log_tasks: :class:`bool <python:bool>`
+
+    :param schema_ttl: The number of seconds for which the board's compiled
+      :class:`BoardSchema` may be re-used across calls. Defaults to ``300``.
+    :type schema_ttl: numeric or :obj:`None <python:None>`
+
+    :returns: Generator which yields task :class:`dict <python:dict>` objects, including
+      any sub-tasks elevated to the top level.
+    :rtype: generator of :class:`dict <python:dict>`
+
+    :raises MondayAuthenticationError: if there is no Monday.com API token supplied or
+      if it is not authorized
+    :raises MondayBoardNotFoundError: if the ``board_id`` is not found
+    """
+    client = get_client(api_token)
+    board_id = validators.integer(board_id)
+
+    try:
+        schema = get_board_schema(client, board_id, ttl = schema_ttl)
+    except requests.exceptions.HTTPError:
+        raise errors.MondayAuthenticationError('The Monday.com API token returned as unauthorized.')
+
+    for items in iter_item_pages(client, board_id, page_size = page_size):
+        subitem_ids = []
+        for item in items:
+            subitem_ids.extend(get_subitem_ids(item, schema))
+
+        subitems = get_items_by_id(client, subitem_ids)
+
+        for item in items:
+            task = convert_item_to_task(item,
+                                        schema,
+                                        client,
+                                        log_tasks = log_tasks,
+                                        subitems = subitems)
+            collection = elevate_subtasks({ task['id']: task })
+            collection = flatten_columns(collection)
+            for key in collection:
+                yield collection[key]
+
+
+def get_tasks(board_id, api_token = None, log_tasks = False, page_size = 100, schema_ttl = 300):
     """Return a list of the Monday.com items (tasks) that are present in ``board_id``.
 
     :param api_token: The Monday.com API token to use when authenticating your
@@ -102,66 +350,39 @@ def get_tasks(board_id, api_token = None, log_tasks = False):
         ``property_column_map`` to use when creating a Gantt chart from a Monday.com board.
         
     :type log_tasks: :class:`bool <python:bool>`
+
+    :param page_size: The number of items to retrieve from the Monday.com API per 
+      request. Defaults to ``100``.
+    :type page_size: :class:`int <python:int>`
+
+    :param schema_ttl: The number of seconds for which the board's compiled
+      :class:`BoardSchema` may be re-used across calls. Defaults to ``300``.
+    :type schema_ttl: numeric or :obj:`None <python:None>`
     
     :rtype: :class:`dict <python:dict>`
     
     :raises MondayBoardNotFoundError: if the ``board_id`` is not found
     """
-    if not HAS_MONDAY:
-        raise errors.HighchartsDependencyError('the .from_monday() method depends '
-                                                'on the monday Python library. That '
-                                                'library was not found in your '
-                                                'runtime environment.')
-    if not api_token:
-        api_token = os.getenv('MONDAY_API_TOKEN', None)
-    
-    if not api_token:
-        raise errors.MondayAuthenticationError('.from_monday() requires a '
-                                                'Monday.com API token. None was '
-                                                'supplied.')
-
-    api_token = validators.string(api_token)
-    board_id = validators.integer(board_id)
-
-    client = monday.MondayClient(api_token)
-
-    try:
-        column_definitions = get_column_definitions(client, board_id)
-    except requests.exceptions.HTTPError:
-        raise errors.MondayAuthenticationError('The Monday.com API token returned as unauthorized.')
-
-    response = client.boards.fetch_items_by_board_id([board_id], limit = 100, page = 1)
-    data = response['data']
-    boards = data['boards']
-    if len(boards) == 0:
-        raise errors.MondayBoardNotFoundError(f'board_id ({board_id}) was not found')
-
-    items = boards[0]['items']
-    
     collection = {}
-    for item in items:
-        task = convert_item_to_task(item,
-                                    column_definitions,
-                                    client,
-                                    log_tasks = log_tasks)
-        task_id = task['id']
-        collection[task_id] = task
-    
-    collection = elevate_subtasks(collection)
-    collection = flatten_columns(collection)
+    for task in iter_tasks(board_id,
+                           api_token = api_token,
+                           page_size = page_size,
+                           log_tasks = log_tasks,
+                           schema_ttl = schema_ttl):
+        collection[task['id']] = task
 
     return collection
 
 
-def convert_item_to_task(item, column_definitions, client, log_tasks = False):
+def convert_item_to_task(item, column_definitions, client, log_tasks = False, subitems = None):
     """Convert the Monday.com ``item`` representation into a more logical data structure.
 
     :param item: The Monday.com item representation.
     :type item: :class:`dict <python:dict>`
     
     :param column_definitions: The column definition object returned by the Monday.com 
-      API.
-    :type column_definitions: :class:`dict <python:dict>`
+      API, or the compiled :class:`BoardSchema` for the board.
+    :type column_definitions: :class:`dict <python:dict>` or :class:`BoardSchema`
     
     :param client: The `monday <https://monday.readthedocs.io/en/latest/>`__ API client
       to use to retrieve the column definitions. Defaults to :obj:`None <python:None>`
@@ -178,9 +399,17 @@ def convert_item_to_task(item, column_definitions, client, log_tasks = False):
         ``property_column_map`` to use when creating a Gantt chart from a Monday.com board.
 
     :type log_tasks: :class:`bool <python:bool>`
+
+    :param subitems: Collection of already-retrieved Monday.com sub-item representations,
+      with the item ID as the key. Sub-items linked to ``item`` that are not in
+      ``subitems`` will be retrieved from the Monday.com API individually. Defaults to
+      :obj:`None <python:None>`.
+    :type subitems: :class:`dict <python:dict>` or :obj:`None <python:None>`
     
     :returns: The formatted value.
     """
+    schema = BoardSchema.from_column_definitions(column_definitions)
+
     task = {}
 
     task_id = item.get('id', None)
@@ -191,11 +420,14 @@ def convert_item_to_task(item, column_definitions, client, log_tasks = False):
 
     columns = {}
     for column in column_values:
-        field_name = get_column_title(column, column_definitions)
-        columns[field_name] = format_column(column,
-                                            column_definitions = column_definitions,
-                                            client = client,
-                                            parent_id = task_id)
+        title, type_, formatter = schema.get_column(column)
+        columns[title] = formatter(schema,
+                                   column['value'],
+                                   text = column.get('text', None),
+                                   client = client,
+                                   parent_id = task_id,
+                                   log_tasks = log_tasks,
+                                   subitems = subitems)
     task['columns'] = columns
 
     if log_tasks:
@@ -208,15 +440,16 @@ def format_column(column,
                   column_definitions,
                   client,
                   parent_id = None,
-                  log_tasks = False):
+                  log_tasks = False,
+                  subitems = None):
     """Format the Monday.com ``column`` representation to be navigable.
 
     :param column: The Moday.com ``column_value`` representation of the column.
     :type column: :class:`dict <python:dict>`
     
     :param column_definitions: The column definition object returned by the Monday.com 
-      API.
-    :type column_definition: :class:`dict <python:dict>`
+      API, or the compiled :class:`BoardSchema` for the board.
+    :type column_definition: :class:`dict <python:dict>` or :class:`BoardSchema`
     
     :param client: The `monday <https://monday.readthedocs.io/en/latest/>`__ API client
       to use to retrieve the column definitions. Defaults to :obj:`None <python:None>`
@@ -237,215 +470,333 @@ def format_column(column,
 
     :type log_tasks: :class:`bool <python:bool>`
 
+    :param subitems: Collection of already-retrieved Monday.com sub-item representations,
+      with the item ID as the key. Sub-items that are not in ``subitems`` will be
+      retrieved from the Monday.com API individually. Defaults to
+      :obj:`None <python:None>`.
+    :type subitems: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
     :returns: The formatted value.
     
     """
-    def default(column_definition, field_name, value, text = None, client = None, parent_id = None, log_tasks = False):
-        return value
-    
-    def text_field(column_definition, 
-                   field_name, 
-                   value, 
-                   text = None, 
-                   client = None, 
-                   parent_id = None, 
-                   log_tasks = False):
-        if value is None and text is None:
-            return None
-        
-        if text:
-            return text
-        
-        return json.loads(value)
-    
-    def date_field(column_definition,
-                   field_name,
-                   value,
-                   text = None,
-                   client = None,
-                   parent_id = None,
-                   log_tasks = False):
-        if value is None:
-            return None
-        value = json.loads(value)['date']
-        
-        return validators.date(value, allow_empty = True, text = None, parent_id = None)
-        
-    def numeric_field(column_definition,
-                      field_name,
-                      value,
-                      text = None,
-                      client = None,
-                      parent_id = None,
-                      log_tasks = False):
-        if value is None:
-            return None
-        return json.loads(value)
-    
-    def longtext_field(column_definition,
-                       field_name,
-                       value,
-                       text = None,
-                       client = None,
-                       parent_id = None,
-                       log_tasks = False):
-        if value is None:
-            return None
-        value = json.loads(value)['text']
-        value = value.strip()
-        if not value:
-            return None
-        
-        return value
-    
-    def color_field(column_definition,
-                    field_name,
-                    value,
-                    text = None,
-                    client = None,
-                    parent_id = None,
-                    log_tasks = False):
-        if value is None:
-            return None
-        labels = json.loads(column_definition[field_name]['settings_str'])['labels']
-        value = labels.get(str(json.loads(value)['index']))
-    
-        return value
-    
-    def dropdown_field(column_definition,
-                       field_name,
-                       value,
-                       text = None,
-                       client = None,
-                       parent_id = None,
-                       log_tasks = False):
-        if value is None:
-            return None
-
-        labels = json.loads(column_definition[field_name]['settings_str'])['labels']
-        label_map = { row['id'] : row['name'] for row in labels }
-
-        values = [label_map.get(id, None) for id in json.loads(value)['ids']]
-
-        return values
-    
-    def timeline_field(column_definition,
-                       field_name,
-                       value,
-                       text = None,
-                       client = None,
-                       parent_id = None,
-                       log_tasks = False):
-        if value is None:
-            return None
-        
-        value = json.loads(value)
-        
-        start = value.get('from', None)
-        start = validators.date(start, allow_empty = True)
-        
-        end = value.get('to', None)
-        end = validators.date(end, allow_empty = True)
-        
-        visualization_type = value.get('visualization_type', None)
-        
-        values = {
-            'start': start,
-            'end': end,
-            'is_milestone': visualization_type == 'milestone'
-        }
-        
-        return values
-    
-    def multiple_person_field(column_definition,
-                              field_name,
-                              value,
-                              text = None,
-                              client = None,
-                              parent_id = None,
-                              log_tasks = False):
-        if value is None and text is None:
-            return None
-
-        if text:
-            return text
-
-        if value is None:
-            return None
-        
-        return json.loads(value)
-    
-    def subtask_field(column_definition,
-                      field_name,
-                      value,
-                      text = None,
-                      client = None,
-                      parent_id = None,
-                      log_tasks = False):
-        if not value:
-            return None
-
-        value = json.loads(value)
-
-        link_pulse_ids = value.get('linkedPulseIds', [])
-        subtasks = {}
-        for entry in link_pulse_ids:
-            item_id = entry.get('linkedPulseId', None)
-            response = client.items.fetch_items_by_id(item_id)
-            data = response['data']
-            if len(data['items']) > 0:
-                item = data['items'][0]
-            else:
-                raise errors.MondayItemNotFoundError(f'Item ID ({item_id}) was not found')
+    schema = BoardSchema.from_column_definitions(column_definitions)
+    title, type_, formatter = schema.get_column(column)
 
-            task = convert_item_to_task(item,
-                                        column_definitions,
-                                        client,
-                                        log_tasks = log_tasks)
-            task['parent_id'] = parent_id
-            task_id = task['id']
-            subtasks[task_id] = task
-
-        return subtasks
-
-    def dependency_field(column_definition,
-                         field_name,
-                         value,
-                         text = None,
-                         client = None,
-                         parent_id = None,
-                         log_tasks = False):
-        if not value:
-            return None
-
-        value = json.loads(value)
-
-        link_pulse_ids = value.get('linkedPulseIds', [])
-        dependency_ids = [str(x.get('linkedPulseId', None)) for x in link_pulse_ids]
-        
-        return dependency_ids
-
-    type_to_formatter_map = {
-        'color': color_field,
-        'dropdown': dropdown_field,
-        'long-text': longtext_field,
-        'date': date_field,
-        'numeric': numeric_field,
-        'text': text_field,
-        'subtasks': subtask_field,
-        'timerange': timeline_field,
-        'multiple-person': multiple_person_field,
-        'dependency': dependency_field,
+    return formatter(schema,
+                     column['value'],
+                     text = column.get('text', None),
+                     client = client,
+                     parent_id = parent_id,
+                     log_tasks = log_tasks,
+                     subitems = subitems)
+
+
+def _default_field(schema, value, **kwargs):
+    return value
+
+
+def _text_field(schema, value, text = None, **kwargs):
+    if value is None and text is None:
+        return None
+    
+    if text:
+        return text
+    
+    return json.loads(value)
+
+
+def _date_field(schema, value, **kwargs):
+    if value is None:
+        return None
+    value = json.loads(value)['date']
+    
+    return validators.date(value, allow_empty = True)
+
+
+def _numeric_field(schema, value, **kwargs):
+    if value is None:
+        return None
+    return json.loads(value)
+
+
+def _longtext_field(schema, value, **kwargs):
+    if value is None:
+        return None
+    value = json.loads(value)['text']
+    value = value.strip()
+    if not value:
+        return None
+    
+    return value
+
+
+def _color_field(schema, value, labels = None, **kwargs):
+    if value is None:
+        return None
+    value = labels.get(str(json.loads(value)['index']))
+
+    return value
+
+
+def _dropdown_field(schema, value, label_map = None, **kwargs):
+    if value is None:
+        return None
+
+    values = [label_map.get(id, None) for id in json.loads(value)['ids']]
+
+    return values
+
+
+def _timeline_field(schema, value, **kwargs):
+    if value is None:
+        return None
+    
+    value = json.loads(value)
+    
+    start = value.get('from', None)
+    start = validators.date(start, allow_empty = True)
+    
+    end = value.get('to', None)
+    end = validators.date(end, allow_empty = True)
+    
+    visualization_type = value.get('visualization_type', None)
+    
+    values = {
+        'start': start,
+        'end': end,
+        'is_milestone': visualization_type == 'milestone'
     }
+    
+    return values
+
+
+def _multiple_person_field(schema, value, text = None, **kwargs):
+    if value is None and text is None:
+        return None
+
+    if text:
+        return text
 
-    field_name = column['id']
-    value = column['value']
-    text = column.get('text', None)
+    if value is None:
+        return None
+    
+    return json.loads(value)
+
+
+def _subtask_field(schema,
+                  value,
+                  client = None,
+                  parent_id = None,
+                  log_tasks = False,
+                  subitems = None,
+                  **kwargs):
+    if not value:
+        return None
+
+    value = json.loads(value)
+
+    link_pulse_ids = value.get('linkedPulseIds', [])
+    subtasks = {}
+    for entry in link_pulse_ids:
+        item_id = entry.get('linkedPulseId', None)
+        if subitems and str(item_id) in subitems:
+            item = subitems[str(item_id)]
+        else:
+            item = get_items_by_id(client, [item_id])[str(item_id)]
+
+        task = convert_item_to_task(item,
+                                    schema,
+                                    client,
+                                    log_tasks = log_tasks,
+                                    subitems = subitems)
+        task['parent_id'] = parent_id
+        task_id = task['id']
+        subtasks[task_id] = task
+
+    return subtasks
+
+
+def _dependency_field(schema, value, **kwargs):
+    if not value:
+        return None
+
+    value = json.loads(value)
+
+    link_pulse_ids = value.get('linkedPulseIds', [])
+    dependency_ids = [str(x.get('linkedPulseId', None)) for x in link_pulse_ids]
+    
+    return dependency_ids
+
+
+_TYPE_TO_FORMATTER_MAP = {
+    'color': _color_field,
+    'dropdown': _dropdown_field,
+    'long-text': _longtext_field,
+    'date': _date_field,
+    'numeric': _numeric_field,
+    'text': _text_field,
+    'subtasks': _subtask_field,
+    'timerange': _timeline_field,
+    'multiple-person': _multiple_person_field,
+    'dependency': _dependency_field,
+}
+
+
+class BoardSchema(object):
+    """Compiled representation of a Monday.com board's column definitions, which maps
+    each column ID to its title, its type, and a pre-bound formatter function.
+
+    :param column_definitions: The column definition object returned by the Monday.com
+      API.
+    :type column_definitions: :class:`dict <python:dict>`
+
+    :param eager: If ``True``, compiles every column up-front. If ``False``, each
+      column is compiled the first time it is requested using
+      :meth:`.get_column() <BoardSchema.get_column>`. Defaults to ``True``.
+    :type eager: :class:`bool <python:bool>`
+    """
+
+    def __init__(self, column_definitions, eager = True):
+        self.column_definitions = validators.dict(column_definitions,
+                                                  allow_empty = True) or {}
+        self.columns = {}
+
+        if not eager:
+            return
+
+        for column_id in self.column_definitions:
+            try:
+                self.columns[column_id] = self._compile_column({ 'id': column_id })
+            except (KeyError, ValueError, TypeError):
+                continue
+
+    @classmethod
+    def from_column_definitions(cls, column_definitions):
+        """Return ``column_definitions`` as a :class:`BoardSchema`, wrapping it if it is
+        not one already.
+
+        .. note::
+
+          A :class:`dict <python:dict>` of column definitions is wrapped in a schema that
+          compiles its columns lazily, so that only the columns actually requested are
+          compiled.
+
+        :param column_definitions: The column definition object returned by the
+          Monday.com API, or an already-compiled :class:`BoardSchema`.
+        :type column_definitions: :class:`dict <python:dict>` or :class:`BoardSchema`
+
+        :rtype: :class:`BoardSchema`
+        """
+        if isinstance(column_definitions, cls):
+            return column_definitions
+
+        return cls(column_definitions, eager = False)
+
+    def _compile_column(self, column):
+        column_id = column['id']
+        title = get_column_title(column, self.column_definitions)
+        type_ = get_column_type(column_id, self.column_definitions)
+        formatter = _TYPE_TO_FORMATTER_MAP.get(type_, _default_field)
+
+        if type_ in ['color', 'dropdown']:
+            settings = self.column_definitions[column_id]['settings_str']
+            labels = json.loads(settings)['labels']
+            if type_ == 'color':
+                formatter = partial(formatter, labels = labels)
+            else:
+                label_map = { row['id'] : row['name'] for row in labels }
+                formatter = partial(formatter, label_map = label_map)
+
+        return title, type_, formatter
+
+    def get_column(self, column):
+        """Return the title, type, and formatter for ``column``.
+
+        :param column: The Monday.com ``column_value`` representation of the column.
+        :type column: :class:`dict <python:dict>`
+
+        :returns: The column's title, type, and formatter function.
+        :rtype: :class:`tuple <python:tuple>` of :class:`str <python:str>`,
+          :class:`str <python:str>`, and callable
+
+        :raises KeyError: if ``column`` is not present in the board's column definitions
+        """
+        column_id = column['id']
+        compiled = self.columns.get(column_id, None)
+        if compiled is None:
+            compiled = self._compile_column(column)
+            self.columns[column_id] = compiled
+
+        return compiled
+
+
+_BOARD_SCHEMAS = {}
+_BOARD_SCHEMAS_LOCK = threading.Lock()
+
+
+def get_board_schema(client, board_id, ttl = 300):
+    """Return the compiled :class:`BoardSchema` for ``board_id``, retrieving its column
+    definitions from the Monday.com API if a cached schema is not available.
+
+    .. note::
+
+      Schemas are cached per board *and* per API token, and expired schemas are
+      discarded whenever a new schema is cached.
+
+    :param client: The `monday <https://monday.readthedocs.io/en/latest/>`__ API client
+      to use to retrieve the column definitions.
+    :type client: :class:`monday.MondayClient <monday:MondayClient>`
+
+    :param board_id: The unique identifier of the board whose schema should be returned.
+    :type board_id: :class:`int <python:int>` or :class:`str <python:str>`
+
+    :param ttl: The number of seconds for which a compiled schema should be re-used.
+      Defaults to ``300``. If ``0`` or :obj:`None <python:None>`, the column definitions
+      will always be retrieved from the Monday.com API.
+    :type ttl: numeric or :obj:`None <python:None>`
+
+    :rtype: :class:`BoardSchema`
+
+    :raises MondayBoardNotFoundError: if the ``board_id`` is not found
+    """
+    ttl = validators.numeric(ttl, allow_empty = True, minimum = 0)
+    key = (str(board_id), _get_client_token(client))
+    now = time.monotonic()
+
+    if ttl:
+        with _BOARD_SCHEMAS_LOCK:
+            cached = _BOARD_SCHEMAS.get(key, None)
+        if cached and cached[0] > now:
+            return cached[1]
+
+    schema = BoardSchema(get_column_definitions(client, board_id))
+
+    if ttl:
+        with _BOARD_SCHEMAS_LOCK:
+            expired = [x for x in _BOARD_SCHEMAS if _BOARD_SCHEMAS[x][0] <= now]
+            for expired_key in expired:
+                del _BOARD_SCHEMAS[expired_key]
+            _BOARD_SCHEMAS[key] = (now + ttl, schema)
+
+    return schema
+
+
+def _get_client_token(client):
+    """Return the API token used by ``client``, so that schemas retrieved using one
+    token are never served to callers using another.
+
+    :rtype: :class:`str <python:str>` or :obj:`None <python:None>`
+    """
+    token = getattr(client, 'token', None)
+    if token:
+        return token
 
-    type_ = get_column_type(field_name, column_definitions)
-    formatter = type_to_formatter_map.get(type_, default)
+    for resource in vars(client).values():
+        token = getattr(getattr(resource, 'client', None), 'token', None)
+        if token:
+            return token
 
-    return formatter(column_definitions, field_name, value, text, client, parent_id, log_tasks)
+    return None
 
 
 def get_column_title(column, column_definitions):
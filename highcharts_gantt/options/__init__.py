@@ -5,6 +5,7 @@ from validator_collection import validators
 
 from highcharts_gantt import utility_functions
 from highcharts_gantt.decorators import class_sensitive
+from highcharts_gantt.metaclasses import DirectJSONMixin
 from highcharts_gantt.utility_classes.gradients import Gradient
 from highcharts_gantt.utility_classes.patterns import Pattern
 from highcharts_gantt.options.series.series_generator import create_series_obj
@@ -40,7 +41,7 @@ from highcharts_gantt.options.scrollbar import Scrollbar
 
 from highcharts_stock.options import Options, HighchartsOptions, HighchartsStockOptions
 
-class HighchartsGanttOptions(HighchartsStockOptions):
+class HighchartsGanttOptions(DirectJSONMixin, HighchartsStockOptions):
     """The Python representation of the
     `Highcharts Gantt <https://api.highcharts.com/gantt/>`_ configuration object."""
 
@@ -2,13 +2,17 @@ from typing import Optional
 
 from validator_collection import validators
 
-from highcharts_gantt.metaclasses import HighchartsMeta
+from highcharts_gantt.metaclasses import HighchartsMeta, ChangeTrackingMixin
 from highcharts_gantt.options.plot_options.connectors import ConnectorOptions
 
 
-class DataConnection(ConnectorOptions):
+class DataConnection(ChangeTrackingMixin, ConnectorOptions):
     """Configuration of the connection between two data points."""
 
+    # Includes the attributes set by ConnectorOptions.
+    __slots__ = ('_to', '_type', '_dash_style', '_end_marker', '_line_color',
+                 '_line_width', '_marker', '_start_marker')
+
     def __init__(self, **kwargs):
         self._to = None
         self._type = None
@@ -1,6 +1,11 @@
+import sys
+import math
+import string
+from array import array
+from collections.abc import MutableSequence, Sequence
 from typing import Optional, List
 from decimal import Decimal
-from datetime import datetime
+from datetime import datetime, timezone
 
 from validator_collection import validators, checkers
 
@@ -8,16 +13,19 @@ from highcharts_core.options.series.data.base import DataBase
 
 from highcharts_gantt import errors, constants
 from highcharts_gantt.decorators import validate_types
-from highcharts_gantt.metaclasses import HighchartsMeta
+from highcharts_gantt.js_literal_functions import get_js_literal
+from highcharts_gantt.metaclasses import HighchartsMeta, ChangeTrackingMixin
 from highcharts_gantt.options.series.data.connect import DataConnection
 from highcharts_gantt.utility_functions import validate_color, parse_jira_issue
 from highcharts_gantt.utility_classes.gradients import Gradient
 from highcharts_gantt.utility_classes.patterns import Pattern
 
 
-class ProgressIndicator(HighchartsMeta):
+class ProgressIndicator(ChangeTrackingMixin, HighchartsMeta):
     """Object representing the progress completed within a data point."""
 
+    __slots__ = ('_amount', '_fill')
+
     def __init__(self, **kwargs):
         self._amount = None
         self._fill = None
@@ -74,11 +82,22 @@ class ProgressIndicator(HighchartsMeta):
         return untrimmed
 
 
-class GanttData(DataBase):
+class GanttData(ChangeTrackingMixin, DataBase):
     """Data point used in a
     :class:`GanttSeries <highcharts_gantt.options.series.gantt.GanttSeries>`.
+
+    Data points track changes to their properties, and cache their serialized
+    (JavaScript object literal and JSON) forms until they change. See
+    :class:`ChangeTrackingMixin <highcharts_gantt.metaclasses.ChangeTrackingMixin>`.
     """
 
+    # Includes the attributes set by DataBase, so that data points - of which a
+    # series may hold many - store their properties without a per-instance __dict__.
+    __slots__ = ('_collapsed', '_completed', '_dependency', '_end', '_milestone',
+                 '_parent', '_start', '_y', '_accessibility', '_class_name',
+                 '_color_index', '_custom', '_description', '_selected', '_color',
+                 '_events', '_id', '_label_rank', '_name')
+
     def __init__(self, **kwargs):
         self._collapsed = None
         self._completed = None
@@ -344,7 +363,7 @@ class GanttData(DataBase):
         return untrimmed
 
     @classmethod
-    def from_array(cls, value):
+    def from_array(cls, value, trusted = False, keys = None):
         """Creates a collection of data point instances, parsing the contents of ``value``
         as an array (iterable). This method is specifically used to parse data that is
         input to **Highcharts for Python** without property names, in an array-organized
@@ -423,23 +442,54 @@ class GanttData(DataBase):
 
         :type value: iterable
 
+        :param trusted: If ``True``, assumes that the members of ``value`` have already
+          been validated (e.g. because they were read from a typed data store) and
+          builds the data points with minimal checking, skipping the per-property
+          validation applied by :meth:`.from_dict() <GanttData.from_dict>`. Values whose
+          type is not the type the property stores (e.g. a :class:`str <python:str>`
+          supplied for ``start``) are still validated. Defaults to ``False``.
+
+          .. warning::
+
+            Invalid values supplied in trusted mode (e.g. a ``completed`` value greater
+            than ``1``) will *not* raise an exception, and will be serialized as-is.
+
+        :type trusted: :class:`bool <python:bool>`
+
+        :param keys: The property names (using their JavaScript names, e.g.
+          ``'className'``) that correspond to each position in members of ``value`` that
+          are supplied as a :class:`tuple <python:tuple>` or
+          :class:`list <python:list>` rather than a :class:`dict <python:dict>` (e.g.
+          as serialized by a series'
+          :meth:`.compact_data <highcharts_gantt.options.series.gantt.GanttSeries.compact_data>`
+          mode). Defaults to :obj:`None <python:None>`.
+        :type keys: iterable of :class:`str <python:str>` or :obj:`None <python:None>`
+
         :returns: Collection of :term:`data point` instances (descended from
           :class:`DataBase <highcharts_core.options.series.data.base.DataBase>`)
         :rtype: :class:`list <python:list>` of
           :class:`DataBase <highcharts_core.options.series.data.base.DataBase>`
           descendant instances
+
+        :raises HighchartsValueError: if a member of ``value`` cannot be coerced to a
+          :class:`GanttData` instance
         """
         if not value:
             return []
         elif not checkers.is_iterable(value):
             value = [value]
 
+        if trusted:
+            return cls._from_trusted_array(value, keys = keys)
+
         collection = []
         for item in value:
             if checkers.is_type(item, 'GanttData'):
                 as_obj = item
             elif checkers.is_dict(item):
                 as_obj = cls.from_dict(item)
+            elif keys is not None and isinstance(item, (tuple, list)):
+                as_obj = cls.from_dict(dict(zip(keys, item)))
             elif item is None or isinstance(item, constants.EnforcedNullType):
                 as_obj = cls()
             else:
@@ -451,6 +501,73 @@ class GanttData(DataBase):
 
         return collection
 
+    @classmethod
+    def _from_trusted_array(cls, value, keys = None):
+        """Create a collection of data point instances from pre-validated ``value``,
+        setting the instances' attributes directly.
+
+        :param value: The data points to create, supplied as :class:`GanttData`
+          instances, :class:`dict <python:dict>` objects, or tuples whose members
+          correspond to ``keys``.
+        :type value: iterable
+
+        :param keys: The property names that correspond to the members of tuple data
+          points. Defaults to :obj:`None <python:None>`.
+        :type keys: iterable of :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :rtype: :class:`list <python:list>` of :class:`GanttData`
+        """
+        if keys is not None:
+            keys = tuple(keys)
+            invalid_keys = [x for x in keys if x not in _PROPERTY_NAMES]
+            if invalid_keys:
+                raise errors.HighchartsValueError(f'keys must be GanttData property '
+                                                  f'names. Received: {invalid_keys}')
+
+        empty_state = _get_empty_gantt_data_state()
+        new = cls.__new__
+        collection = []
+        for item in value:
+            if isinstance(item, GanttData):
+                collection.append(item)
+                continue
+            elif isinstance(item, (tuple, list)):
+                if keys is None:
+                    raise errors.HighchartsValueError('keys must be supplied to load '
+                                                      'trusted data points supplied as '
+                                                      'tuples or lists')
+                item = dict(zip(keys, item))
+            elif not isinstance(item, dict):
+                raise errors.HighchartsValueError(f'each trusted data point supplied '
+                                                  f'must be a GanttData Data Point, a '
+                                                  f'dict, or a tuple. Received: '
+                                                  f'{item.__class__.__name__}')
+
+            attributes = empty_state.copy()
+            validated = []
+            for key, item_value in item.items():
+                if item_value is None:
+                    continue
+                trusted_types = _TRUSTED_TYPES.get(key, None)
+                if trusted_types and isinstance(item_value, trusted_types) and \
+                   (item_value.__class__ is not bool or bool in trusted_types):
+                    attributes[_TRUSTED_ATTRIBUTES[key]] = item_value
+                elif key == 'dependency' and isinstance(item_value, list) and \
+                     all(isinstance(x, str) for x in item_value):
+                    attributes['_dependency'] = list(item_value)
+                elif key in _PROPERTY_NAMES:
+                    validated.append((_PROPERTY_NAMES[key], item_value))
+
+            as_obj = new(cls)
+            for name, attribute_value in attributes.items():
+                setattr(as_obj, name, attribute_value)
+            for name, item_value in validated:
+                setattr(as_obj, name, item_value)
+
+            collection.append(as_obj)
+
+        return collection
+
     @classmethod
     def from_asana(cls,
                    task,
@@ -627,7 +744,8 @@ class GanttData(DataBase):
     def from_jira(cls,
                   issue,
                   connection_kwargs = None,
-                  connection_callback = None):
+                  connection_callback = None,
+                  custom_fields = '*all'):
         """Create a 
         :class:`GanttData <highcharts_gantt.options.series.data.gantt.GanttData>` 
         instance from a JIRA :class:`Issue <jira:jira.resources.Issue>` representation.
@@ -657,6 +775,15 @@ class GanttData(DataBase):
         :type connection_kwargs: :class:`dict <python:dict>` or 
           :obj:`None <python:None>`
 
+        :param custom_fields: The names of the JIRA fields whose (raw) values should be
+          included in the data point's
+          :meth:`.custom <highcharts_gantt.options.series.data.gantt.GanttData.custom>`
+          property, alongside the issue's ``key``. If :obj:`None <python:None>`, only
+          the issue's ``key`` is included. Defaults to ``'*all'``, which uses the
+          complete raw issue representation.
+        :type custom_fields: iterable of :class:`str <python:str>`, ``'*all'``, or
+          :obj:`None <python:None>`
+
         :returns: A 
           :class:`GanttData <highcharts_gantt.options.series.data.gantt.Ganttdata>` 
           instance
@@ -668,10 +795,511 @@ class GanttData(DataBase):
           but is not supported
         """
         try:
-            data_point_kwargs = parse_jira_issue(issue)
+            data_point_kwargs = parse_jira_issue(issue,
+                                                 connection_kwargs = connection_kwargs,
+                                                 connection_callback = connection_callback,
+                                                 custom_fields = custom_fields)
         except errors.JIRADuplicateIssueError:
             return None
         
         data_point = cls(**data_point_kwargs)
         
-        return data_point
\ No newline at end of file
+        return data_point
+
+
+# JavaScript property name -> Python property name, for the properties that may be
+# supplied to GanttData.from_array() in trusted mode or to
+# GanttSeries.update_points().
+_PROPERTY_NAMES = {
+    'accessibility': 'accessibility',
+    'className': 'class_name',
+    'collapsed': 'collapsed',
+    'color': 'color',
+    'colorIndex': 'color_index',
+    'completed': 'completed',
+    'custom': 'custom',
+    'dependency': 'dependency',
+    'description': 'description',
+    'end': 'end',
+    'events': 'events',
+    'id': 'id',
+    'labelrank': 'label_rank',
+    'labelRank': 'label_rank',
+    'milestone': 'milestone',
+    'name': 'name',
+    'parent': 'parent',
+    'selected': 'selected',
+    'start': 'start',
+    'y': 'y',
+}
+
+# JavaScript property name -> the types that are stored without validation in
+# trusted mode. All other values are passed to the property setter.
+_TRUSTED_TYPES = {
+    'className': (str, ),
+    'collapsed': (bool, ),
+    'completed': (int, float),
+    'dependency': (str, ),
+    'description': (str, ),
+    'end': (datetime, ),
+    'id': (str, ),
+    'milestone': (bool, ),
+    'name': (str, ),
+    'parent': (str, ),
+    'selected': (bool, ),
+    'start': (datetime, ),
+    'y': (int, float),
+}
+
+_TRUSTED_ATTRIBUTES = {key: '_' + _PROPERTY_NAMES[key]
+                       for key in _TRUSTED_TYPES}
+
+_EMPTY_GANTT_DATA_STATE = None
+
+
+def _get_empty_gantt_data_state():
+    """Return the instance attributes of an empty :class:`GanttData` instance."""
+    global _EMPTY_GANTT_DATA_STATE
+
+    if _EMPTY_GANTT_DATA_STATE is None:
+        instance = GanttData()
+        _EMPTY_GANTT_DATA_STATE = {name: getattr(instance, name)
+                                   for name in GanttData.__slots__}
+
+    return _EMPTY_GANTT_DATA_STATE
+
+
+_MISSING_TIMESTAMP = -2 ** 63
+
+
+class GanttDataColumns(MutableSequence):
+    """Columnar, array-backed collection of
+    :class:`GanttData <highcharts_gantt.options.series.data.gantt.GanttData>` data
+    points, which can be assigned to
+    :meth:`GanttSeries.data <highcharts_gantt.options.series.gantt.GanttSeries.data>`.
+
+    Rather than holding a fully-validated :class:`GanttData` instance per task, the
+    collection stores the core task properties as columns:
+
+      * ``start`` and ``end`` as arrays of 64-bit integer POSIX timestamps (in
+        milliseconds)
+      * ``completed`` as an array of floats
+      * ``id``, ``parent``, and ``name`` as lists of interned strings
+      * ``dependency`` as a list of data point IDs (or tuples of IDs)
+
+    :class:`GanttData` instances ("views") are only created when an individual data
+    point is accessed (e.g. ``my_series.data[5]``), and are retained so that any changes
+    made to them are preserved. When the series is serialized, data points that have
+    not been accessed are serialized directly from the columns.
+
+    .. note::
+
+      Data points that carry properties other than those stored in columns (e.g.
+      ``custom`` or ``color``) are stored as :class:`GanttData` instances.
+
+    .. code-block:: python
+
+      my_series = GanttSeries()
+      my_series.data = GanttDataColumns(id = ['a', 'b'],
+                                        name = ['Task A', 'Task B'],
+                                        start = [1704067200000, 1704153600000],
+                                        end = [1704153600000, 1704240000000],
+                                        dependency = [None, 'a'])
+
+    """
+
+    COLUMNS = ('id', 'name', 'parent', 'start', 'end', 'completed', 'dependency')
+
+    _MISSING_TIMESTAMP = _MISSING_TIMESTAMP
+
+    def __init__(self,
+                 id = None,
+                 name = None,
+                 parent = None,
+                 start = None,
+                 end = None,
+                 completed = None,
+                 dependency = None):
+        columns = {
+            'id': id,
+            'name': name,
+            'parent': parent,
+            'start': start,
+            'end': end,
+            'completed': completed,
+            'dependency': dependency
+        }
+        columns = {key: list(value) for key, value in columns.items()
+                   if value is not None}
+        lengths = set(len(x) for x in columns.values())
+        if len(lengths) > 1:
+            raise errors.HighchartsValueError(f'all columns supplied to '
+                                              f'GanttDataColumns must have the same '
+                                              f'length. Received lengths: '
+                                              f'{sorted(lengths)}')
+        length = lengths.pop() if lengths else 0
+
+        self._id = [self._validate_string(x, 'id')
+                    for x in columns.get('id', None) or [None] * length]
+        self._name = [self._validate_string(x, 'name')
+                      for x in columns.get('name', None) or [None] * length]
+        self._parent = [self._validate_string(x, 'parent')
+                        for x in columns.get('parent', None) or [None] * length]
+        self._start = array('q', [self._validate_timestamp(x)
+                                  for x in columns.get('start', None) or [None] * length])
+        self._end = array('q', [self._validate_timestamp(x)
+                                for x in columns.get('end', None) or [None] * length])
+        self._completed = array('d', [self._validate_completed(x)
+                                      for x in columns.get('completed', None) or [None] * length])
+        self._dependency = [self._validate_dependency(x)
+                            for x in columns.get('dependency', None) or [None] * length]
+        self._views = [None] * length
+
+    @staticmethod
+    def _validate_string(value, column):
+        if value is None:
+            return None
+        if not isinstance(value, str):
+            raise errors.HighchartsValueError(f'{column} values must be strings. '
+                                              f'Received: {value.__class__.__name__}')
+
+        return sys.intern(value) if value else None
+
+    @staticmethod
+    def _validate_timestamp(value):
+        if value is None:
+            return _MISSING_TIMESTAMP
+        if isinstance(value, bool) or not isinstance(value, (int, float, Decimal)):
+            raise errors.HighchartsValueError(f'start and end values must be POSIX '
+                                              f'timestamps (in milliseconds). '
+                                              f'Received: {value.__class__.__name__}')
+
+        return int(value)
+
+    @staticmethod
+    def _validate_completed(value):
+        if value is None:
+            return math.nan
+        value = validators.numeric(value, minimum = 0, maximum = 1)
+
+        return float(value)
+
+    @classmethod
+    def _validate_dependency(cls, value):
+        if not value:
+            return None
+        if isinstance(value, str):
+            return sys.intern(value)
+
+        return tuple(cls._validate_string(x, 'dependency') for x in value)
+
+    @staticmethod
+    def _to_timestamp(value):
+        value = validators.datetime(value, allow_empty = True, coerce_value = True)
+        if value is None:
+            return _MISSING_TIMESTAMP
+
+        return round(value.timestamp() * 1000)
+
+    def _get_column_values(self, item):
+        """Return the column values for ``item``, or :obj:`None <python:None>` if
+        ``item`` cannot be stored in columns."""
+        if not isinstance(item, dict):
+            return None
+        if any(key not in self.COLUMNS for key in item):
+            return None
+        dependency = item.get('dependency', None)
+        if dependency and not isinstance(dependency, str) and \
+           not all(isinstance(x, str) for x in dependency):
+            return None
+        completed = item.get('completed', None)
+        if completed is not None and not checkers.is_numeric(completed):
+            return None
+
+        return (self._validate_string(item.get('id', None), 'id'),
+                self._validate_string(item.get('name', None), 'name'),
+                self._validate_string(item.get('parent', None), 'parent'),
+                self._to_timestamp(item.get('start', None)),
+                self._to_timestamp(item.get('end', None)),
+                self._validate_completed(item.get('completed', None)),
+                self._validate_dependency(dependency))
+
+    def _get_schedule_values(self, index):
+        """Return the ``start``, ``end``, and ``completed`` values of the data point at
+        ``index``, read directly from the columns."""
+        start = self._start[index]
+        end = self._end[index]
+        completed = self._completed[index]
+
+        return (datetime.fromtimestamp(start / 1000, tz = timezone.utc)
+                if start != _MISSING_TIMESTAMP else None,
+                datetime.fromtimestamp(end / 1000, tz = timezone.utc)
+                if end != _MISSING_TIMESTAMP else None,
+                None if math.isnan(completed) else completed)
+
+    def _get_subset(self, indices):
+        """Return a new :class:`GanttDataColumns` collection containing the data points
+        at ``indices``. Views of data points that have already been accessed are shared
+        with the new collection."""
+        subset = self.__class__()
+        subset._id = [self._id[x] for x in indices]
+        subset._name = [self._name[x] for x in indices]
+        subset._parent = [self._parent[x] for x in indices]
+        subset._start = array('q', [self._start[x] for x in indices])
+        subset._end = array('q', [self._end[x] for x in indices])
+        subset._completed = array('d', [self._completed[x] for x in indices])
+        subset._dependency = [self._dependency[x] for x in indices]
+        subset._views = [self._views[x] for x in indices]
+
+        return subset
+
+    def _get_view_kwargs(self, index):
+        kwargs = {
+            'id': self._id[index],
+            'name': self._name[index],
+            'parent': self._parent[index],
+            'dependency': self._dependency[index],
+        }
+        if self._start[index] != _MISSING_TIMESTAMP:
+            kwargs['start'] = datetime.fromtimestamp(self._start[index] / 1000,
+                                                     tz = timezone.utc)
+        if self._end[index] != _MISSING_TIMESTAMP:
+            kwargs['end'] = datetime.fromtimestamp(self._end[index] / 1000,
+                                                   tz = timezone.utc)
+        if not math.isnan(self._completed[index]):
+            kwargs['completed'] = self._completed[index]
+        if isinstance(kwargs['dependency'], tuple):
+            kwargs['dependency'] = list(kwargs['dependency'])
+
+        return kwargs
+
+    def _get_untrimmed_row(self, index):
+        """Return the untrimmed :class:`dict <python:dict>` representation of the data
+        point at ``index``, read directly from the columns."""
+        untrimmed = dict.fromkeys(_get_gantt_data_keys())
+        untrimmed['id'] = self._id[index]
+        untrimmed['name'] = self._name[index]
+        untrimmed['parent'] = self._parent[index]
+        if self._start[index] != _MISSING_TIMESTAMP:
+            untrimmed['start'] = self._start[index] / 1000
+        if self._end[index] != _MISSING_TIMESTAMP:
+            untrimmed['end'] = self._end[index] / 1000
+        if not math.isnan(self._completed[index]):
+            untrimmed['completed'] = self._completed[index]
+        dependency = self._dependency[index]
+        if isinstance(dependency, tuple):
+            dependency = list(dependency)
+        untrimmed['dependency'] = dependency
+
+        return untrimmed
+
+    def __len__(self):
+        return len(self._views)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[x] for x in range(*index.indices(len(self)))]
+
+        index = range(len(self))[index]
+        view = self._views[index]
+        if view is None:
+            view = GanttData(**self._get_view_kwargs(index))
+            self._views[index] = view
+
+        return view
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            raise errors.HighchartsValueError('GanttDataColumns does not support '
+                                              'slice assignment')
+
+        index = range(len(self))[index]
+        self._views[index] = GanttData.from_array([value])[0]
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            for item in sorted(range(*index.indices(len(self))), reverse = True):
+                del self[item]
+            return
+
+        index = range(len(self))[index]
+        for column in [self._id, self._name, self._parent, self._start, self._end,
+                       self._completed, self._dependency, self._views]:
+            del column[index]
+
+    def insert(self, index, value):
+        column_values = self._get_column_values(value)
+        if column_values is None:
+            view = GanttData.from_array([value])[0]
+            column_values = (None, None, None, _MISSING_TIMESTAMP, _MISSING_TIMESTAMP,
+                             math.nan, None)
+        else:
+            view = None
+
+        columns = [self._id, self._name, self._parent, self._start, self._end,
+                   self._completed, self._dependency]
+        for column, column_value in zip(columns, column_values):
+            column.insert(index, column_value)
+        self._views.insert(index, view)
+
+    @classmethod
+    def from_array(cls, value):
+        """Create a :class:`GanttDataColumns` collection from an iterable of
+        :class:`GanttData` instances or :class:`dict <python:dict>` objects.
+
+        :class:`dict <python:dict>` objects whose keys are limited to the columns
+        (``'id'``, ``'name'``, ``'parent'``, ``'start'``, ``'end'``, ``'completed'``,
+        and ``'dependency'``) are stored in columns. All other values are stored as
+        :class:`GanttData` instances.
+
+        :param value: The data points to store.
+        :type value: iterable
+
+        :rtype: :class:`GanttDataColumns`
+        """
+        collection = cls()
+        if not value:
+            return collection
+        elif checkers.is_type(value, 'GanttDataColumns'):
+            return value
+        elif not checkers.is_iterable(value, forbid_literals = (str, bytes, dict)):
+            value = [value]
+
+        for item in value:
+            collection.append(item)
+
+        return collection
+
+    def to_rows(self):
+        """Return a collection of objects that serialize the data points (e.g. to
+        JavaScript object literal notation or JSON) without creating
+        :class:`GanttData` views of data points that have not been accessed.
+
+        .. note::
+
+          The serializers are created as each data point is read from the collection,
+          so iterating over the collection does not hold a serializer for every data
+          point in memory at once.
+
+        :rtype: :class:`Sequence <python:collections.abc.Sequence>` of
+          :class:`HighchartsMeta <highcharts_core.metaclasses.HighchartsMeta>`
+        """
+        return _GanttDataRows(self)
+
+
+class _GanttDataRows(Sequence):
+    """Read-only sequence of the serializers for the data points in a
+    :class:`GanttDataColumns` collection."""
+
+    def __init__(self, columns):
+        self._columns = columns
+
+    def __len__(self):
+        return len(self._columns._views)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[x] for x in range(*index.indices(len(self)))]
+
+        index = range(len(self))[index]
+        view = self._columns._views[index]
+        if view is not None:
+            return view
+
+        return _GanttDataRow(self._columns, index)
+
+    def __iter__(self):
+        columns = self._columns
+        for index, view in enumerate(columns._views):
+            yield view if view is not None else _GanttDataRow(columns, index)
+
+
+class _GanttDataRow(HighchartsMeta):
+    """Read-only serializer for a data point stored in a :class:`GanttDataColumns`
+    collection."""
+
+    def __init__(self, columns, index):
+        self._columns = columns
+        self._index = index
+
+    @classmethod
+    def _get_kwargs_from_dict(cls, as_dict):
+        return {}
+
+    def _to_untrimmed_dict(self, in_cls = None) -> dict:
+        return self._columns._get_untrimmed_row(self._index)
+
+    def to_js_literal(self,
+                      filename = None,
+                      encoding = 'utf-8') -> Optional[str]:
+        """Return the data point represented as a :class:`str <python:str>` containing
+        the JavaScript object literal.
+
+        Produces the same output as
+        :meth:`GanttData.to_js_literal() <highcharts_gantt.options.series.data.gantt.GanttData.to_js_literal>`,
+        but skips the generic serialization machinery since column values are already
+        plain strings, numbers, and lists of strings.
+
+        :param filename: The name of a file to which the JavaScript object literal should
+          be persisted. Defaults to :obj:`None <python:None>`
+        :type filename: Path-like
+
+        :param encoding: The character encoding to apply to the resulting object. Defaults
+          to ``'utf-8'``.
+        :type encoding: :class:`str <python:str>`
+
+        :rtype: :class:`str <python:str>` or :obj:`None <python:None>`
+        """
+        if filename:
+            filename = validators.path(filename)
+
+        untrimmed = self._to_untrimmed_dict()
+        properties = [f"""  {key}: {_get_row_literal(untrimmed[key])}"""
+                      for key in untrimmed
+                      if untrimmed[key] is not None]
+
+        as_str = None
+        if properties:
+            as_str = '{\n' + ',\n'.join(properties) + '\n}'
+
+        if filename:
+            with open(filename, 'w', encoding = encoding) as file_:
+                file_.write(as_str)
+
+        return as_str
+
+
+def _get_row_literal(item) -> str:
+    """Convert a column value (a :class:`str <python:str>`, a number, or a
+    :class:`list <python:list>` of strings) into a JavaScript literal string, matching
+    :func:`get_js_literal() <highcharts_core.js_literal_functions.get_js_literal>`.
+
+    Strings that could not possibly be a JavaScript function or class are quoted
+    directly, rather than being parsed.
+    """
+    if isinstance(item, list):
+        return '[' + ',\n'.join(_get_row_literal(x) for x in item) + ']'
+    if not isinstance(item, str):
+        return f"""{item}"""
+    if item == 'null':
+        return 'null'
+    if item.startswith(('{', '[', 'Date')) or item in string.whitespace or \
+       any(x in item for x in ('function', 'Function', 'class', '=>', '\\')):
+        return get_js_literal(item)
+
+    return f"""'{item}'"""
+
+
+_GANTT_DATA_KEYS = None
+
+
+def _get_gantt_data_keys():
+    """Return the keys of a :class:`GanttData` instance's untrimmed
+    :class:`dict <python:dict>` representation, in serialization order."""
+    global _GANTT_DATA_KEYS
+
+    if _GANTT_DATA_KEYS is None:
+        _GANTT_DATA_KEYS = tuple(GanttData()._to_untrimmed_dict().keys())
+
+    return _GANTT_DATA_KEYS
+
@@ -1,4 +1,8 @@
 import os
+import re
+import math
+import datetime
+from decimal import Decimal
 from typing import Optional, List
 
 from dotenv import load_dotenv
@@ -19,21 +23,112 @@ except ImportError:
 from highcharts_core.options.series.base import SeriesBase
 
 from highcharts_gantt import errors, monday
+from highcharts_gantt.critical_path import CriticalPath
+from highcharts_gantt.dependency_graph import DependencyGraph
+from highcharts_gantt.interval_index import IntervalIndex
+from highcharts_gantt.metaclasses import DirectJSONMixin
+from highcharts_gantt.response_cache import install_response_cache, bypass_response_cache
 from highcharts_gantt.options.plot_options.gantt import GanttOptions
-from highcharts_gantt.options.series.data.gantt import GanttData
-from highcharts_gantt.utility_functions import mro__to_untrimmed_dict
+from highcharts_gantt.options.series.data.connect import DataConnection
+from highcharts_gantt.options.series.data.gantt import (GanttData, ProgressIndicator,
+                                                        _PROPERTY_NAMES)
+from highcharts_gantt.utility_functions import (mro__to_untrimmed_dict, get_jira_issues,
+                                               get_jira_client, get_jira_fields,
+                                               run_async)
 
 
 load_dotenv()
 
-
-class GanttSeries(SeriesBase, GanttOptions):
+# The data point properties which may be serialized positionally when a series'
+# ``compact_data`` is ``True``.
+_COMPACT_KEYS = ('id', 'name', 'start', 'end', 'parent', 'dependency', 'completed',
+                 'milestone')
+
+# Marks a value which can only be serialized as part of a data point object.
+_NOT_COMPACT = object()
+
+
+def _get_compact_value(key, value):
+    """Return ``value`` as it should appear in a data point serialized as an array, or
+    ``_NOT_COMPACT`` if the data point must be serialized as an object."""
+    if key == 'dependency':
+        if isinstance(value, (list, tuple)):
+            value = [_get_compact_value(key, x) for x in value]
+            if any(not isinstance(x, str) for x in value):
+                return _NOT_COMPACT
+            return value
+        elif isinstance(value, DataConnection):
+            untrimmed = value._to_untrimmed_dict()
+            if [x for x in untrimmed if untrimmed[x] is not None] != ['to']:
+                return _NOT_COMPACT
+            value = value.to
+    elif key == 'completed':
+        if isinstance(value, ProgressIndicator):
+            if value.fill is not None:
+                return _NOT_COMPACT
+            value = value.amount
+        if isinstance(value, Decimal):
+            value = float(value)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return value
+        return _NOT_COMPACT
+    elif key == 'milestone':
+        return value if isinstance(value, bool) else _NOT_COMPACT
+    elif key in ('start', 'end'):
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return value
+        return _NOT_COMPACT
+
+    return value if isinstance(value, str) else _NOT_COMPACT
+
+#: Margin subtracted from the last Asana synchronization time when requesting changed
+#: tasks, to tolerate differences between the local clock and Asana's.
+ASANA_SYNC_SKEW = datetime.timedelta(minutes = 5)
+
+ASANA_OPT_FIELDS = ['approval_status',
+                    'assignee_status',
+                    'completed',
+                    'completed_at',
+                    'dependencies',
+                    'dependents',
+                    'due_at',
+                    'due_on',
+                    'html_notes',
+                    'name',
+                    'notes',
+                    'start_at',
+                    'start_on',
+                    'assignee',
+                    'assignee_section',
+                    'parent',
+                    'permalink_url',
+                    'custom_fields',
+                    'resource_type',
+                    'resource_subtype']
+
+
+class GanttSeries(DirectJSONMixin, SeriesBase, GanttOptions):
     """Options to configure a Gantt series.
 
     Gantt charts are a type of chart used to visualize efforts executed in a sequence.
     """
 
     def __init__(self, **kwargs):
+        self._asana_sync_token = None
+        self._asana_synced_at = None
+        self._jira_synced_at = None
+        self._trusted_data = False
+        self._compact_data = False
+        self._keys = None
+        self._dependency_graph = None
+        self._interval_index = None
+        self._point_index = None
+
+        self.trusted_data = kwargs.get('trusted_data', False)
+        self.compact_data = kwargs.get('compact_data', False)
+        # Set ahead of the data, so that data points supplied as arrays can be loaded.
+        self.keys = kwargs.get('keys', None)
+
         super().__init__(**kwargs)
 
     @property
@@ -45,17 +140,855 @@ class GanttSeries(SeriesBase, GanttOptions):
         it accepts as input an iterable of :class:`GanttData` instances or
         :class:`dict <python:dict>` instances that can be coerced to :class:`GanttData`.
 
-        :rtype: :class:`list <python:list>` of :class:`GanttData` or
-          :obj:`None <python:None>`
+        .. tip::
+
+          For very large series, you can also supply a
+          :class:`GanttDataColumns <highcharts_gantt.options.series.data.gantt.GanttDataColumns>`
+          collection, which stores the data points' core properties in columnar arrays
+          and only creates :class:`GanttData` instances for the data points that are
+          accessed individually.
+
+        :rtype: :class:`list <python:list>` of :class:`GanttData`,
+          :class:`GanttDataColumns <highcharts_gantt.options.series.data.gantt.GanttDataColumns>`,
+          or :obj:`None <python:None>`
         """
         return self._data
 
     @data.setter
     def data(self, value):
+        self._dependency_graph = None
+        self._interval_index = None
+        self._point_index = None
         if not value:
             self._data = None
+        elif checkers.is_type(value, 'GanttDataColumns'):
+            self._data = value
         else:
-            self._data = GanttData.from_array(value)
+            self._data = GanttData.from_array(value,
+                                              trusted = self.trusted_data,
+                                              keys = self.keys or None)
+
+    @property
+    def dependency_graph(self) -> DependencyGraph:
+        """A :class:`DependencyGraph <highcharts_gantt.dependency_graph.DependencyGraph>`
+        indexing the dependencies and parent/child relationships between the series'
+        data points, which can be used to find dependency cycles and references to
+        data points that do not exist before the chart is rendered.
+
+        The graph is built when first accessed, and is cached until
+        :meth:`.data <GanttSeries.data>` is set again.
+
+        .. warning::
+
+          Changes made in-place to individual data points (e.g.
+          ``my_series.data[0].dependency = 'other-task'``) are not detected. Call
+          :meth:`.reset_dependency_graph() <GanttSeries.reset_dependency_graph>` after
+          making such changes.
+
+        .. code-block:: python
+
+          graph = my_series.dependency_graph
+          if not graph.is_valid:
+              print(graph.cycles, graph.dangling_references)
+
+        :rtype: :class:`DependencyGraph <highcharts_gantt.dependency_graph.DependencyGraph>`
+        """
+        if self._dependency_graph is None:
+            self._dependency_graph = DependencyGraph(self._data)
+
+        return self._dependency_graph
+
+    def reset_dependency_graph(self):
+        """Discard the cached
+        :meth:`.dependency_graph <GanttSeries.dependency_graph>`, so that it is rebuilt
+        when next accessed."""
+        self._dependency_graph = None
+
+    @property
+    def interval_index(self) -> IntervalIndex:
+        """An :class:`IntervalIndex <highcharts_gantt.interval_index.IntervalIndex>`
+        of the time intervals covered by the series' data points, which is used to find
+        the data points that overlap a time window.
+
+        The index is built when first accessed, and is cached until the series' data
+        points are changed using :meth:`.data <GanttSeries.data>`,
+        :meth:`.update_points() <GanttSeries.update_points>`,
+        :meth:`.upsert_points() <GanttSeries.upsert_points>`,
+        :meth:`.remove_points() <GanttSeries.remove_points>`, or
+        :meth:`.roll_up() <GanttSeries.roll_up>`.
+
+        .. warning::
+
+          Changes made in-place to individual data points (e.g.
+          ``my_series.data[0].end = new_end_date``) are not detected. Call
+          :meth:`.reset_interval_index() <GanttSeries.reset_interval_index>` after
+          making such changes.
+
+        :rtype: :class:`IntervalIndex <highcharts_gantt.interval_index.IntervalIndex>`
+        """
+        if self._interval_index is None:
+            self._interval_index = IntervalIndex(self._data)
+
+        return self._interval_index
+
+    def reset_interval_index(self):
+        """Discard the cached :meth:`.interval_index <GanttSeries.interval_index>`, so
+        that it is rebuilt when next accessed."""
+        self._interval_index = None
+
+    def _get_window_positions(self, start, end, include_ancestors = True):
+        positions = self.interval_index.overlapping(start, end)
+        if not include_ancestors or not positions:
+            return positions
+
+        parents = self.dependency_graph.parents
+        selected = set(positions)
+        for position in positions:
+            parent = parents[position]
+            while parent is not None and parent not in selected:
+                selected.add(parent)
+                parent = parents[parent]
+
+        return sorted(selected)
+
+    def get_points_in_window(self,
+                             start,
+                             end,
+                             include_ancestors = True) -> List[GanttData]:
+        """Return the data points that overlap the time window from ``start`` to
+        ``end``, using the series' :meth:`.interval_index <GanttSeries.interval_index>`.
+
+        A data point overlaps the window if it starts no later than ``end`` and ends no
+        earlier than ``start``.
+
+        :param start: The beginning of the window.
+        :type start: :class:`datetime <python:datetime.datetime>`, or a value that can
+          be coerced to one
+
+        :param end: The end of the window.
+        :type end: :class:`datetime <python:datetime.datetime>`, or a value that can be
+          coerced to one
+
+        :param include_ancestors: If ``True``, also returns the parents (and their
+          parents, and so on) of the overlapping data points, even if they do not
+          overlap the window themselves. Defaults to ``True``.
+        :type include_ancestors: :class:`bool <python:bool>`
+
+        :returns: The data points, in series order.
+        :rtype: :class:`list <python:list>` of :class:`GanttData`
+
+        :raises HighchartsValueError: if ``end`` is earlier than ``start``
+        """
+        positions = self._get_window_positions(start,
+                                               end,
+                                               include_ancestors = include_ancestors)
+
+        return [self._data[x] for x in positions]
+
+    def get_window(self, start, end, include_ancestors = True):
+        """Return a copy of the series which only contains the data points that
+        overlap the time window from ``start`` to ``end`` (and, optionally, their
+        ancestors).
+
+        This makes it possible to render a chart for a viewport onto a very large
+        series, without serializing the data points that fall outside it:
+
+        .. code-block:: python
+
+          visible_series = my_series.get_window(viewport_start, viewport_end)
+          my_chart.add_series(visible_series)
+
+        .. note::
+
+          The series' other options are copied, but its data points are *shared* with
+          the original series rather than copied. Data points held in a
+          :class:`GanttDataColumns <highcharts_gantt.options.series.data.gantt.GanttDataColumns>`
+          collection are copied into a new
+          :class:`GanttDataColumns <highcharts_gantt.options.series.data.gantt.GanttDataColumns>`
+          collection.
+
+        :param start: The beginning of the window.
+        :type start: :class:`datetime <python:datetime.datetime>`, or a value that can
+          be coerced to one
+
+        :param end: The end of the window.
+        :type end: :class:`datetime <python:datetime.datetime>`, or a value that can be
+          coerced to one
+
+        :param include_ancestors: If ``True``, also includes the parents (and their
+          parents, and so on) of the overlapping data points, so that the hierarchy
+          of the window's data points is preserved. Defaults to ``True``.
+        :type include_ancestors: :class:`bool <python:bool>`
+
+        :rtype: :class:`GanttSeries`
+
+        :raises HighchartsValueError: if ``end`` is earlier than ``start``
+        """
+        positions = self._get_window_positions(start,
+                                               end,
+                                               include_ancestors = include_ancestors)
+
+        data = self._data
+        self._data = None
+        try:
+            window = self.__class__.from_dict(self.to_dict())
+        finally:
+            self._data = data
+
+        window.trusted_data = self.trusted_data
+        window.compact_data = self.compact_data
+        if checkers.is_type(data, 'GanttDataColumns'):
+            window.data = data._get_subset(positions)
+        elif positions:
+            window._data = [data[x] for x in positions]
+
+        return window
+
+    def get_critical_path(self, tolerance = 0) -> CriticalPath:
+        """Calculate the series' critical path, using the
+        `critical path method <https://en.wikipedia.org/wiki/Critical_path_method>`__
+        over the series' :meth:`.dependency_graph <GanttSeries.dependency_graph>`.
+
+        .. code-block:: python
+
+          critical_path = my_series.get_critical_path()
+          print(critical_path.critical_path)
+          print(critical_path['some-task-id'].total_float)
+
+        :param tolerance: The maximum total float for a data point to be considered
+          critical, as a :class:`timedelta <python:datetime.timedelta>` or a number of
+          seconds. Defaults to ``0``.
+        :type tolerance: :class:`timedelta <python:datetime.timedelta>` or numeric
+
+        :returns: The early / late start and finish, total float, and criticality of
+          each data point.
+        :rtype: :class:`CriticalPath <highcharts_gantt.critical_path.CriticalPath>`
+
+        :raises GanttDependencyError: if the series contains a dependency cycle
+        """
+        return CriticalPath(self._data, self.dependency_graph, tolerance = tolerance)
+
+    def highlight_critical_path(self,
+                                color = None,
+                                connector_color = None,
+                                connector_width = None,
+                                dash_style = None,
+                                tolerance = 0,
+                                critical_path = None) -> CriticalPath:
+        """Style the data points on the series' critical path, and / or the
+        dependencies that drive it.
+
+        Critical data points have their
+        :meth:`.color <highcharts_gantt.options.series.data.gantt.GanttData.color>` set
+        to ``color``. The driving dependencies between critical data points (see
+        :meth:`CriticalPath.critical_edges <highcharts_gantt.critical_path.CriticalPath.critical_edges>`)
+        are converted to
+        :class:`DataConnection <highcharts_gantt.options.series.data.connect.DataConnection>`
+        objects (if supplied as ids) and styled using ``connector_color``,
+        ``connector_width``, and ``dash_style``.
+
+        :param color: The color to apply to critical data points. Defaults to
+          :obj:`None <python:None>`, which leaves their color unchanged.
+        :type color: :class:`str <python:str>`, :class:`Gradient`, :class:`Pattern`,
+          or :obj:`None <python:None>`
+
+        :param connector_color: The line color to apply to driving dependencies.
+          Defaults to :obj:`None <python:None>`.
+        :type connector_color: :class:`str <python:str>`, :class:`Gradient`,
+          :class:`Pattern`, or :obj:`None <python:None>`
+
+        :param connector_width: The line width to apply to driving dependencies.
+          Defaults to :obj:`None <python:None>`.
+        :type connector_width: numeric or :obj:`None <python:None>`
+
+        :param dash_style: The dash style to apply to driving dependencies. Defaults to
+          :obj:`None <python:None>`.
+        :type dash_style: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param tolerance: The maximum total float for a data point to be considered
+          critical. Ignored if ``critical_path`` is supplied. Defaults to ``0``.
+        :type tolerance: :class:`timedelta <python:datetime.timedelta>` or numeric
+
+        :param critical_path: A previously-calculated critical path for the series. If
+          :obj:`None <python:None>`, will be calculated using
+          :meth:`.get_critical_path() <GanttSeries.get_critical_path>`. Defaults to
+          :obj:`None <python:None>`.
+        :type critical_path: :class:`CriticalPath <highcharts_gantt.critical_path.CriticalPath>`
+          or :obj:`None <python:None>`
+
+        :returns: The critical path that was applied.
+        :rtype: :class:`CriticalPath <highcharts_gantt.critical_path.CriticalPath>`
+
+        :raises HighchartsValueError: if none of ``color``, ``connector_color``,
+          ``connector_width``, or ``dash_style`` are supplied
+        :raises GanttDependencyError: if the series contains a dependency cycle
+        """
+        connector_styles = {
+            'line_color': connector_color,
+            'line_width': connector_width,
+            'dash_style': dash_style
+        }
+        connector_styles = {key: value for key, value in connector_styles.items()
+                            if value is not None}
+        if color is None and not connector_styles:
+            raise errors.HighchartsValueError('highlight_critical_path() requires at '
+                                              'least one of color, connector_color, '
+                                              'connector_width, or dash_style')
+
+        if critical_path is None:
+            critical_path = self.get_critical_path(tolerance = tolerance)
+
+        if color is not None:
+            for position, is_critical in enumerate(critical_path.critical):
+                if is_critical:
+                    self.data[position].color = color
+
+        if connector_styles:
+            ids = self.dependency_graph.ids
+            for predecessor, successor in critical_path.critical_edges:
+                data_point = self.data[successor]
+                target = ids[predecessor]
+                dependency = data_point.dependency
+                is_collection = isinstance(dependency, list)
+                if not is_collection:
+                    dependency = [dependency]
+
+                styled = []
+                for item in dependency:
+                    if isinstance(item, str) and item == target:
+                        item = DataConnection(to = item, **connector_styles)
+                    elif isinstance(item, DataConnection) and item.to == target:
+                        for key, value in connector_styles.items():
+                            setattr(item, key, value)
+                    styled.append(item)
+
+                data_point.dependency = styled if is_collection else styled[0]
+
+        return critical_path
+
+    def roll_up(self,
+                ids = None,
+                start = True,
+                end = True,
+                completed = True) -> List[str]:
+        """Roll up the schedule of each parent data point from its children (i.e. the
+        data points whose :meth:`.parent <highcharts_gantt.options.series.data.gantt.GanttData.parent>`
+        is the parent's id), working from the bottom of the hierarchy upwards.
+
+        Each parent data point receives:
+
+          * the earliest ``start`` of its children,
+          * the latest ``end`` of its children, and
+          * the duration-weighted average ``completed`` of its children (children
+            without a ``completed`` value count as ``0``). If the parent's ``completed``
+            is a :class:`ProgressIndicator <highcharts_gantt.options.series.data.gantt.ProgressIndicator>`,
+            only its ``amount`` is updated.
+
+        Since the children of a parent are themselves rolled up first, each parent
+        reflects its entire sub-tree.
+
+        .. tip::
+
+          After changing one or more data points, supply their ``ids`` to only
+          recalculate their ancestors, rather than the entire hierarchy:
+
+          .. code-block:: python
+
+            my_series.roll_up()
+
+            my_series.data[1234].end = new_end_date
+            my_series.roll_up(ids = my_series.data[1234].id)
+
+        :param ids: The id(s) of the data points that have changed. If supplied, only
+          their ancestors are rolled up. If :obj:`None <python:None>`, rolls up every
+          parent data point in the series. Defaults to :obj:`None <python:None>`.
+        :type ids: :class:`str <python:str>`, iterable of :class:`str <python:str>`, or
+          :obj:`None <python:None>`
+
+        .. note::
+
+          A parent's ``start`` / ``end`` is left unchanged if none of its children
+          have a ``start`` / ``end``.
+
+        :param start: If ``True``, rolls up ``start``. Defaults to ``True``.
+        :type start: :class:`bool <python:bool>`
+
+        :param end: If ``True``, rolls up ``end``. Defaults to ``True``.
+        :type end: :class:`bool <python:bool>`
+
+        :param completed: If ``True``, rolls up ``completed``. Defaults to ``True``.
+        :type completed: :class:`bool <python:bool>`
+
+        :returns: The ids of the parent data points that were rolled up, in the order
+          in which they were updated.
+        :rtype: :class:`list <python:list>` of :class:`str <python:str>`
+
+        :raises GanttDependencyError: if the data points' parents form a cycle
+        :raises KeyError: if one of ``ids`` is not present in the series
+        """
+        graph = self.dependency_graph
+        if graph.parent_cycles:
+            raise errors.GanttDependencyError(f'unable to roll up a series whose '
+                                              f'parents form a cycle: '
+                                              f'{graph.parent_cycles}')
+
+        parents = graph.parents
+        children = graph.children
+        if ids is None:
+            queue = [position for position, parent in enumerate(parents)
+                     if parent is None]
+            order = []
+            while queue:
+                position = queue.pop()
+                order.append(position)
+                queue.extend(children[position])
+            order = [x for x in reversed(order) if children[x]]
+        else:
+            if isinstance(ids, str):
+                ids = [ids]
+            depths = {}
+            for id_ in ids:
+                position = parents[graph.index[id_]]
+                while position is not None and position not in depths:
+                    depths[position] = None
+                    position = parents[position]
+            for position in depths:
+                depth = 0
+                ancestor = parents[position]
+                while ancestor is not None:
+                    depth += 1
+                    ancestor = parents[ancestor]
+                depths[position] = depth
+            order = sorted(depths, key = lambda x: depths[x], reverse = True)
+
+        data = self._data
+        is_columnar = checkers.is_type(data, 'GanttDataColumns')
+
+        def get_values(position):
+            if is_columnar and data._views[position] is None:
+                return data._get_schedule_values(position)
+            data_point = data[position]
+            amount = data_point.completed
+            if isinstance(amount, ProgressIndicator):
+                amount = amount.amount
+            return data_point.start, data_point.end, amount
+
+        updated = []
+        for position in order:
+            parent_start = parent_end = None
+            start_timestamp = end_timestamp = None
+            total_weight = total_amount = weighted_amount = 0
+            for child in children[position]:
+                child_start, child_end, child_amount = get_values(child)
+                child_amount = float(child_amount or 0)
+                total_amount += child_amount
+                if child_start is not None:
+                    child_start_timestamp = child_start.timestamp()
+                    if start_timestamp is None or child_start_timestamp < start_timestamp:
+                        parent_start = child_start
+                        start_timestamp = child_start_timestamp
+                if child_end is not None:
+                    child_end_timestamp = child_end.timestamp()
+                    if end_timestamp is None or child_end_timestamp > end_timestamp:
+                        parent_end = child_end
+                        end_timestamp = child_end_timestamp
+                    if child_start is not None:
+                        weight = max(child_end_timestamp - child_start_timestamp, 0)
+                        total_weight += weight
+                        weighted_amount += child_amount * weight
+
+            if total_weight > 0:
+                amount = weighted_amount / total_weight
+            else:
+                amount = total_amount / len(children[position])
+            amount = min(max(amount, 0), 1)
+
+            data_point = data[position]
+            if start and parent_start is not None:
+                data_point.start = parent_start
+            if end and parent_end is not None:
+                data_point.end = parent_end
+            if completed:
+                if isinstance(data_point.completed, ProgressIndicator):
+                    data_point.completed.amount = amount
+                else:
+                    data_point.completed = amount
+
+            updated.append(graph.ids[position])
+
+        if updated and (start or end):
+            self._interval_index = None
+
+        return updated
+
+    def _get_point_index(self) -> dict:
+        """Return the (cached) mapping of each data point's id to its position in
+        :meth:`.data <GanttSeries.data>`. If an id is duplicated, maps to its first
+        occurrence.
+
+        :rtype: :class:`dict <python:dict>`
+        """
+        if self._point_index is None:
+            index = {}
+            for position, id_ in enumerate(self._get_point_ids()):
+                if id_ is not None and id_ not in index:
+                    index[id_] = position
+            self._point_index = index
+
+        return self._point_index
+
+    def _get_point_ids(self, start = 0) -> List[Optional[str]]:
+        """Return the ids of the data points in :meth:`.data <GanttSeries.data>`,
+        beginning at position ``start``, without creating views of data points held in
+        a :class:`GanttDataColumns <highcharts_gantt.options.series.data.gantt.GanttDataColumns>`
+        collection."""
+        data = self._data or []
+        if checkers.is_type(data, 'GanttDataColumns'):
+            return [data._id[position] if view is None else view.id
+                    for position, view in enumerate(data._views[start:],
+                                                    start = start)]
+
+        return [x.id for x in data[start:]]
+
+    def _get_positions(self, ids, ignore_missing = False):
+        """Return the positions of the data points identified by ``ids``.
+
+        :raises HighchartsValueError: if one of ``ids`` is not present in the series
+          and ``ignore_missing`` is ``False``
+        """
+        index = self._get_point_index()
+        positions = {}
+        missing = []
+        for id_ in ids:
+            position = index.get(id_, None)
+            if position is None:
+                missing.append(id_)
+            else:
+                positions[id_] = position
+
+        if missing and not ignore_missing:
+            raise errors.HighchartsValueError(f'data points not found in the series: '
+                                              f'{missing}')
+
+        return positions
+
+    def update_points(self, updates, ignore_missing = False) -> List[str]:
+        """Update the properties of existing data points, identified by id, in-place.
+
+        Unlike re-assigning :meth:`.data <GanttSeries.data>`, only the data points being
+        updated are touched: they are found using an id index that is maintained by the
+        series, and only the properties supplied are validated.
+
+        .. code-block:: python
+
+          my_series.update_points({
+              'task-1': {'completed': 0.5},
+              'task-2': {'end': '2024-03-01', 'className': 'late'},
+          })
+
+        :param updates: The updates to apply, either as a
+          :class:`dict <python:dict>` mapping data point ids to a
+          :class:`dict <python:dict>` of properties, or as an iterable of
+          :class:`dict <python:dict>` objects that each contain an ``'id'`` key. Property
+          names may use either their JavaScript (e.g. ``'className'``) or Python (e.g.
+          ``'class_name'``) form.
+        :type updates: :class:`dict <python:dict>` or iterable of
+          :class:`dict <python:dict>`
+
+        :param ignore_missing: If ``True``, updates for ids that are not present in the
+          series are ignored. If ``False``, raises an exception. Defaults to ``False``.
+        :type ignore_missing: :class:`bool <python:bool>`
+
+        :returns: The ids of the data points that were updated.
+        :rtype: :class:`list <python:list>` of :class:`str <python:str>`
+
+        :raises HighchartsValueError: if an update contains an unrecognized property,
+          or if one of the ids is not present in the series and ``ignore_missing`` is
+          ``False``
+        """
+        if checkers.is_dict(updates):
+            updates = list(updates.items())
+        else:
+            updates = [(x.get('id', None), x) for x in updates]
+
+        property_names = {}
+        for id_, properties in updates:
+            for key in properties:
+                if key in property_names:
+                    continue
+                name = _PROPERTY_NAMES.get(key, key)
+                if name not in _PROPERTY_NAMES.values():
+                    raise errors.HighchartsValueError(f'"{key}" is not a GanttData '
+                                                      f'property')
+                property_names[key] = name
+
+        positions = self._get_positions([x[0] for x in updates],
+                                        ignore_missing = ignore_missing)
+        updated = []
+        for id_, properties in updates:
+            position = positions.get(id_, None)
+            if position is None:
+                continue
+            data_point = self._data[position]
+            for key, value in properties.items():
+                setattr(data_point, property_names[key], value)
+
+            if data_point.id != id_:
+                self._point_index = None
+            if any(property_names[key] in ('id', 'parent', 'dependency')
+                   for key in properties):
+                self._dependency_graph = None
+            if any(property_names[key] in ('start', 'end', 'milestone')
+                   for key in properties):
+                self._interval_index = None
+            updated.append(data_point.id)
+
+        return updated
+
+    def upsert_points(self, data_points) -> List[str]:
+        """Replace existing data points with the same id in-place, and append any data
+        points whose id is not yet present in the series.
+
+        The data points supplied are converted using
+        :meth:`GanttData.from_array() <highcharts_gantt.options.series.data.gantt.GanttData.from_array>`
+        (respecting :meth:`.trusted_data <GanttSeries.trusted_data>`), and are the only
+        data points touched.
+
+        :param data_points: The data points to insert or replace, as
+          :class:`GanttData <highcharts_gantt.options.series.data.gantt.GanttData>`
+          instances or :class:`dict <python:dict>` objects.
+        :type data_points: iterable
+
+        :returns: The ids of the data points that were appended (i.e. that were not
+          already present in the series).
+        :rtype: :class:`list <python:list>` of :class:`str <python:str>`
+        """
+        data_points = GanttData.from_array(list(data_points or []),
+                                           trusted = self.trusted_data)
+        if not data_points:
+            return []
+
+        index = self._get_point_index()
+        if self._data is None:
+            self._data = []
+
+        appended = []
+        for data_point in data_points:
+            position = index.get(data_point.id, None)
+            if position is None:
+                position = len(self._data)
+                self._data.append(data_point)
+                if data_point.id is not None:
+                    index[data_point.id] = position
+                appended.append(data_point.id)
+            else:
+                self._data[position] = data_point
+
+        self._dependency_graph = None
+        self._interval_index = None
+
+        return appended
+
+    def remove_points(self, ids, ignore_missing = False) -> List[str]:
+        """Remove the data points identified by ``ids`` from the series.
+
+        .. note::
+
+          Removing a data point shifts the position of the data points that follow it,
+          so the series' id index is updated for those data points only.
+
+        :param ids: The id(s) of the data points to remove.
+        :type ids: :class:`str <python:str>` or iterable of :class:`str <python:str>`
+
+        :param ignore_missing: If ``True``, ids that are not present in the series are
+          ignored. If ``False``, raises an exception. Defaults to ``False``.
+        :type ignore_missing: :class:`bool <python:bool>`
+
+        :returns: The ids of the data points that were removed.
+        :rtype: :class:`list <python:list>` of :class:`str <python:str>`
+
+        :raises HighchartsValueError: if one of ``ids`` is not present in the series and
+          ``ignore_missing`` is ``False``
+        """
+        if isinstance(ids, str):
+            ids = [ids]
+        positions = self._get_positions(ids, ignore_missing = ignore_missing)
+        if not positions:
+            return []
+
+        data = self._data
+        index = self._point_index
+        removed = set(positions.values())
+        first = min(removed)
+        if checkers.is_type(data, 'GanttDataColumns'):
+            for position in sorted(removed, reverse = True):
+                del data[position]
+        else:
+            data[first:] = [x for position, x in enumerate(data[first:], start = first)
+                            if position not in removed]
+
+        for id_ in positions:
+            del index[id_]
+        reindexed = set()
+        for position, id_ in enumerate(self._get_point_ids(start = first),
+                                       start = first):
+            if id_ is None or id_ in reindexed:
+                continue
+            reindexed.add(id_)
+            if index.get(id_, first) >= first:
+                index[id_] = position
+
+        if not data:
+            self._data = None
+        self._dependency_graph = None
+        self._interval_index = None
+
+        return list(positions)
+
+    @property
+    def trusted_data(self) -> bool:
+        """If ``True``, values assigned to :meth:`.data <GanttSeries.data>` are assumed
+        to have already been validated, and are loaded using the trusted mode of
+        :meth:`GanttData.from_array() <highcharts_gantt.options.series.data.gantt.GanttData.from_array>`.
+        Defaults to ``False``.
+
+        This setting is *not* serialized to JavaScript or JSON.
+
+        .. warning::
+
+          Invalid data supplied while this setting is ``True`` will *not* raise an
+          exception, and will be serialized as-is.
+
+        .. code-block:: python
+
+          my_series = GanttSeries(trusted_data = True,
+                                  data = rows_from_warehouse)
+
+        :rtype: :class:`bool <python:bool>`
+        """
+        return self._trusted_data
+
+    @trusted_data.setter
+    def trusted_data(self, value):
+        self._trusted_data = bool(value)
+
+    @property
+    def compact_data(self) -> bool:
+        """If ``True``, the series' data points are serialized (to JavaScript or JSON)
+        as positional arrays, with the property that corresponds to each position
+        given once in the series' :meth:`.keys <GanttSeries.keys>`. Defaults to
+        ``False``.
+
+        Property names make up much of the payload of a large series, so this
+        substantially reduces the size of the serialized chart, and the time the
+        browser takes to parse it.
+
+        This setting is *not* itself serialized to JavaScript or JSON.
+
+        .. code-block:: python
+
+          my_series = GanttSeries(compact_data = True,
+                                  data = [{'id': 'a', 'start': '2024-01-01',
+                                           'end': '2024-01-05'},
+                                          {'id': 'b', 'start': '2024-01-05',
+                                           'end': '2024-01-08', 'dependency': 'a'}])
+
+          # Serializes as:
+          # keys: ['id', 'start', 'end', 'dependency'],
+          # data: [['a', 1704067200.0, 1704412800.0],
+          #        ['b', 1704412800.0, 1704672000.0, 'a']]
+
+        .. note::
+
+          Only the ``id``, ``name``, ``start``, ``end``, ``parent``, ``dependency``,
+          ``completed``, and ``milestone`` properties are serialized positionally,
+          ordered by how many data points use them. Data points that use any other
+          property (e.g. ``color`` or ``custom``), that configure their ``completed``
+          or ``dependency`` as objects, or that would leave a gap in the array, are
+          serialized as objects.
+
+        .. warning::
+
+          Any :meth:`.keys <GanttSeries.keys>` you have set on the series are replaced
+          when it is serialized.
+
+        :rtype: :class:`bool <python:bool>`
+        """
+        return self._compact_data
+
+    @compact_data.setter
+    def compact_data(self, value):
+        self._compact_data = bool(value)
+
+    @property
+    def asana_sync_token(self) -> Optional[str]:
+        """The Asana events sync token obtained by the last call to
+        :meth:`.sync_from_asana() <GanttSeries.sync_from_asana>`. Defaults to
+        :obj:`None <python:None>`.
+
+        This token is *not* serialized to JavaScript or JSON, but may be set explicitly
+        (e.g. to restore a token persisted elsewhere).
+
+        :rtype: :class:`str <python:str>` or :obj:`None <python:None>`
+        """
+        return self._asana_sync_token
+
+    @asana_sync_token.setter
+    def asana_sync_token(self, value):
+        self._asana_sync_token = validators.string(value, allow_empty = True)
+
+    @property
+    def asana_synced_at(self) -> Optional[datetime.datetime]:
+        """The (UTC) date and time at which the series' data was last synchronized
+        with Asana using :meth:`.sync_from_asana() <GanttSeries.sync_from_asana>`.
+        Defaults to :obj:`None <python:None>`.
+
+        .. note::
+
+          If supplied a naive :class:`datetime <python:datetime.datetime>`, it will be
+          assumed to be in UTC.
+
+        :rtype: :class:`datetime <python:datetime.datetime>` or
+          :obj:`None <python:None>`
+        """
+        return self._asana_synced_at
+
+    @asana_synced_at.setter
+    def asana_synced_at(self, value):
+        value = validators.datetime(value, allow_empty = True)
+        if value and not value.tzinfo:
+            value = value.replace(tzinfo = datetime.timezone.utc)
+
+        self._asana_synced_at = value
+
+    @property
+    def jira_synced_at(self) -> Optional[datetime.datetime]:
+        """The (UTC) date and time at which the series' data was last synchronized
+        with JIRA using :meth:`.sync_from_jira() <GanttSeries.sync_from_jira>`.
+        Defaults to :obj:`None <python:None>`.
+
+        This watermark determines which issues are retrieved on the next call to
+        :meth:`.sync_from_jira() <GanttSeries.sync_from_jira>`. It is *not*
+        serialized to JavaScript or JSON, but may be set explicitly (e.g. to restore
+        a watermark persisted elsewhere).
+
+        .. note::
+
+          If supplied a naive :class:`datetime <python:datetime.datetime>`, it will be
+          assumed to be in UTC.
+
+        :rtype: :class:`datetime <python:datetime.datetime>` or
+          :obj:`None <python:None>`
+        """
+        return self._jira_synced_at
+
+    @jira_synced_at.setter
+    def jira_synced_at(self, value):
+        value = validators.datetime(value, allow_empty = True)
+        if value and not value.tzinfo:
+            value = value.replace(tzinfo = datetime.timezone.utc)
+
+        self._jira_synced_at = value
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
@@ -160,9 +1093,71 @@ class GanttSeries(SeriesBase, GanttOptions):
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
         untrimmed = mro__to_untrimmed_dict(self, in_cls = in_cls)
+        if checkers.is_type(self._data, 'GanttDataColumns'):
+            untrimmed['data'] = self._data.to_rows()
+        if self.compact_data and untrimmed.get('data', None):
+            keys, data = self._get_compact_data(untrimmed['data'])
+            if keys:
+                untrimmed['keys'] = keys
+                untrimmed['data'] = data
 
         return untrimmed
 
+    @staticmethod
+    def _get_compact_data(points):
+        """Return the ``keys`` and ``data`` to serialize when
+        :meth:`.compact_data <GanttSeries.compact_data>` is ``True``, or
+        ``(None, None)`` if none of ``points`` can be serialized as an array.
+
+        :param points: The data points to serialize.
+        :type points: iterable of
+          :class:`HighchartsMeta <highcharts_core.metaclasses.HighchartsMeta>`
+
+        :rtype: :class:`tuple <python:tuple>` of a :class:`list <python:list>` of
+          :class:`str <python:str>` and a :class:`list <python:list>`
+        """
+        counts = dict.fromkeys(_COMPACT_KEYS, 0)
+        candidates = []
+        for point in points:
+            values = {}
+            untrimmed = point._to_untrimmed_dict()
+            for key in untrimmed:
+                value = untrimmed[key]
+                if value is None:
+                    continue
+                if key in counts:
+                    value = _get_compact_value(key, value)
+                else:
+                    value = _NOT_COMPACT
+                if value is _NOT_COMPACT:
+                    values = None
+                    break
+                values[key] = value
+
+            if values:
+                for key in values:
+                    counts[key] += 1
+            candidates.append(values)
+
+        # Sorting is stable, so keys used equally often stay in _COMPACT_KEYS order.
+        keys = sorted([x for x in _COMPACT_KEYS if counts[x]],
+                      key = lambda x: counts[x],
+                      reverse = True)
+        if not keys:
+            return None, None
+
+        positions = {key: position for position, key in enumerate(keys)}
+        data = []
+        for point, values in zip(points, candidates):
+            # Highcharts would read a gap as an explicit null, so only points whose
+            # properties fill the first positions of ``keys`` become arrays.
+            if values and max(positions[x] for x in values) == len(values) - 1:
+                data.append([values[x] for x in keys[:len(values)]])
+            else:
+                data.append(point)
+
+        return keys, data
+
     def load_from_asana(self,
                         project_gid,
                         section_gid = None,
@@ -290,25 +1285,8 @@ class GanttSeries(SeriesBase, GanttOptions):
         api_request_params = validators.dict(api_request_params, 
                                              allow_empty = True) or {}
         
-        if not personal_access_token:
-            personal_access_token = os.getenv('ASANA_PERSONAL_ACCESS_TOKEN', None)
-            
-        if asana_client and not isinstance(asana_client, asana.client.Client):
-            raise errors.HighchartsValueError(f'asana_client must be a valid asana '
-                                              f'Client instance. Was: '
-                                              f'{asana_client.__class__.__name__}')
-        if asana_client and not asana_client.session.token:
-            raise errors.AsanaAuthenticationError('asana_client is not authenticated')
-          
-        if asana_client:
-            client = asana_client
-        elif not personal_access_token:
-            raise errors.AsanaAuthenticationError('from_asana() requires either a '
-                                                  'personal access token or an '
-                                                  'authenticated Asana client. '
-                                                  'Neither was supplied.')
-        else:
-            client = asana.Client.access_token(personal_access_token)
+        client = self._get_asana_client(personal_access_token = personal_access_token,
+                                        asana_client = asana_client)
     
         if section_gid:
             request = client.tasks.get_tasks_for_section
@@ -325,27 +1303,7 @@ class GanttSeries(SeriesBase, GanttOptions):
         if completed_since:
             request_params['params']['completed_since'] = completed_since.isoformat()
             
-        opt_fields = ['approval_status',
-                      'assignee_status',
-                      'completed',
-                      'completed_at',
-                      'dependencies',
-                      'dependents',
-                      'due_at',
-                      'due_on',
-                      'html_notes',
-                      'name',
-                      'notes',
-                      'start_at',
-                      'start_on',
-                      'assignee',
-                      'assignee_section',
-                      'parent',
-                      'permalink_url',
-                      'custom_fields',
-                      'resource_type',
-                      'resource_subtype']
-        request_params['params']['opt_fields'] = opt_fields
+        request_params['params']['opt_fields'] = ASANA_OPT_FIELDS
         for key in request_params:
             api_request_params[key] = request_params[key]
 
@@ -461,38 +1419,408 @@ class GanttSeries(SeriesBase, GanttOptions):
           :class:`GanttSeries <highcharts_gantt.options.series.GanttSeries>` (besides 
           the ``data`` argument, which will be determined from the Asana tasks).
           Defaults to :obj:`None <python:None>`.
-        :type series_kwargs: :class:`dict <python:dict>` or :obj:`None <python:None>`
+        :type series_kwargs: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+        :returns: A :class:`GanttSeries <highcharts_gantt.options.series.gantt.GanttSeries>`
+          populated with data from the indicated Asana project/section.
+        :rtype: :class:`GanttSeries <highcharts_gantt.options.series.gantt.GanttSeries>`
+        
+        :raises HighchartsDependencyError: if the 
+          `asana <https://pypi.org/project/asana/>`__ Python library is not available 
+          in the runtime environment.
+          
+        :raises HighchartsValueError: if ``connection_callback`` is not 
+          :obj:`None <python:None>`, but is not callable
+        :raises HighchartsValueError: if ``asana_client`` is not 
+          :obj:`None <python:None>`, but is not a valid :class:`asana.client.Client>`
+          instance
+        :raises AsanaAuthenticationError: if ``asana_client`` is not authenticated or 
+          if no personal access token is supplied
+        """
+        series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
+        
+        instance = cls(**series_kwargs)
+        instance.load_from_asana(project_gid,
+                                 section_gid = section_gid,
+                                 completed_since = completed_since,
+                                 use_html_description = use_html_description,
+                                 personal_access_token = personal_access_token,
+                                 asana_client = asana_client,
+                                 api_request_params = api_request_params,
+                                 connection_kwargs = connection_kwargs,
+                                 connection_callback = connection_callback)
+
+        return instance
+
+    async def load_from_asana_async(self, *args, **kwargs):
+        """Asynchronous counterpart to
+        :meth:`.load_from_asana() <GanttSeries.load_from_asana>`, which accepts
+        the same arguments.
+
+        The requests to Asana are executed in the
+        :func:`shared thread pool <highcharts_gantt.utility_functions.get_async_executor>`,
+        so that many series can be loaded concurrently without blocking the event
+        loop.
+        """
+        await run_async(self.load_from_asana, *args, **kwargs)
+
+    @classmethod
+    async def from_asana_async(cls, *args, **kwargs):
+        """Asynchronous counterpart to
+        :meth:`.from_asana() <GanttSeries.from_asana>`, which accepts the same
+        arguments.
+
+        The requests to Asana are executed in the
+        :func:`shared thread pool <highcharts_gantt.utility_functions.get_async_executor>`,
+        so that many series can be created concurrently without blocking the event
+        loop.
+
+        :returns: A :class:`GanttSeries <highcharts_gantt.options.series.gantt.GanttSeries>`
+          populated with data from Asana.
+        :rtype: :class:`GanttSeries <highcharts_gantt.options.series.gantt.GanttSeries>`
+        """
+        return await run_async(cls.from_asana, *args, **kwargs)
+
+    @bypass_response_cache()
+    def sync_from_asana(self,
+                        project_gid,
+                        section_gid = None,
+                        completed_since = None,
+                        use_html_description = True,
+                        personal_access_token = None,
+                        asana_client = None,
+                        connection_kwargs = None,
+                        connection_callback = None):
+        """Update the series' data with the Asana tasks that have changed since the
+        last synchronization, rather than re-loading the entire project.
+
+        On the first call (i.e. when there is no
+        :meth:`.asana_sync_token <GanttSeries.asana_sync_token>` or the series has no
+        data), or when Asana reports that the sync token has expired, this method
+        performs a full load using
+        :meth:`.load_from_asana() <GanttSeries.load_from_asana>` and stores a new sync
+        token.
+
+        On each subsequent call, the project's
+        `events <https://developers.asana.com/reference/events>`__ since the last sync
+        token are used to determine which tasks have been changed, deleted, or removed
+        from the project (or section). Changed tasks are then retrieved in a single
+        (paginated) request filtered with ``modified_since``, and merged into
+        :meth:`.data <GanttSeries.data>` by task ``gid``. Deleted and removed tasks are
+        removed from the series.
+
+        .. note::
+
+          ``modified_since`` is set ``ASANA_SYNC_SKEW`` (five minutes) before the last
+          synchronization, to tolerate a local clock that runs ahead of Asana's. Any
+          changed task that is still missing from the filtered request is then
+          retrieved individually, so that no change reported by the events is lost.
+
+        .. note::
+
+          If ``section_gid`` or ``completed_since`` are supplied, changed tasks that no
+          longer match them are removed from the series as well.
+
+        .. note::
+
+          Requests issued while synchronizing are never served from the
+          :class:`ResponseCache <highcharts_gantt.response_cache.ResponseCache>` (if
+          enabled), since they are often identical from one sync to the next. Their
+          responses are still stored in it.
+
+        :param project_gid: The globally unique ID of the Project whose tasks should be
+          used to assemble the Gantt series.
+        :type project_gid: :class:`str <python:str>`
+
+        :param section_gid: The optional unique ID of the section whose tasks should be
+          used to assemble the Gantt series. Defaults to :obj:`None <python:None>`, which
+          returns all tasks in the project.
+        :type section_gid: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param completed_since: An optional filter which only returns tasks that have
+          been completed after this date. Defaults to :obj:`None <python:None>`, which
+          returns all tasks.
+        :type completed_since: :class:`datetime <python:datetime.datetime>` or
+          :obj:`None <python:None>`
+
+        :param use_html_description: Whether to use the task's HTML notes as the data
+          point's description. Defaults to ``True``.
+        :type use_html_description: :class:`bool <python:bool>`
+
+        :param personal_access_token: A Personal Access Token created by Asana.
+          Defaults to :obj:`None <python:None>`, which tries to determine its value
+          by looking in the ``ASANA_PERSONAL_ACCESS_TOKEN`` environment variable.
+        :type personal_access_token: :class:`str <python:str>` or
+          :obj:`None <python:None>`
+
+        :param asana_client: An Asana API client that has been fully authenticated.
+          Defaults to :obj:`None <python:None>`.
+        :type asana_client: :class:`asana.client.Client` or :obj:`None <python:None>`
+
+        :param connection_kwargs: Set of keyword arugments to supply to the
+          :class:`DataConnection <highcharts_gantt.options.series.data.connect.DataConnection>`
+          constructor, besides the
+          :meth:`.to <highcharts_gantt.options.series.data.connect.DataConnection.to>`
+          property which is derived from the task. Defaults to :obj:`None <python:None>`
+        :type connection_kwargs: :class:`dict <python:dict>` or
+          :obj:`None <python:None>`
+
+        :param connection_callback: A custom Python function or method which accepts two
+          keyword arguments: ``connection_target`` and ``task``, and returns a
+          :class:`DataConnection <highcharts_gantt.options.series.data.connect.DataConnection>`
+          instance. Defaults to :obj:`None <python:None>`.
+        :type connection_callback: Callable or :obj:`None <python:None>`
+
+        :raises HighchartsDependencyError: if the
+          `asana <https://pypi.org/project/asana/>`__ Python library is not available
+          in the runtime environment.
+        :raises HighchartsValueError: if ``asana_client`` is not
+          :obj:`None <python:None>`, but is not a valid :class:`asana.client.Client>`
+          instance
+        :raises AsanaAuthenticationError: if ``asana_client`` is not authenticated or
+          if no personal access token is supplied
+        """
+        if not HAS_ASANA:
+            raise errors.HighchartsDependencyError('The .sync_from_asana() method '
+                                                   'requires the asana Python library. '
+                                                   'However your runtime environment '
+                                                   'does not seem to have it. Please '
+                                                   'install and try again.')
+
+        project_gid = validators.string(project_gid, coerce_value = True)
+        section_gid = validators.string(section_gid,
+                                        allow_empty = True,
+                                        coerce_value = True)
+        completed_since = validators.datetime(completed_since, allow_empty = True)
+
+        client = self._get_asana_client(personal_access_token = personal_access_token,
+                                        asana_client = asana_client)
+
+        sync_started = datetime.datetime.now(tz = datetime.timezone.utc)
+        is_full_sync = not self.asana_sync_token or not self.asana_synced_at \
+            or not self.data
+        changed_gids, removed_gids, sync_token = self._get_asana_events(
+            client,
+            project_gid = project_gid,
+            section_gid = section_gid,
+            sync_token = None if is_full_sync else self.asana_sync_token
+        )
+
+        if changed_gids is None:
+            self.load_from_asana(project_gid = project_gid,
+                                 section_gid = section_gid,
+                                 completed_since = completed_since,
+                                 use_html_description = use_html_description,
+                                 asana_client = client,
+                                 connection_kwargs = connection_kwargs,
+                                 connection_callback = connection_callback)
+            self.asana_sync_token = sync_token
+            self.asana_synced_at = sync_started
+            return
+
+        updated_points = {}
+        if changed_gids:
+            params = {
+                'modified_since': (self.asana_synced_at - ASANA_SYNC_SKEW).isoformat(),
+                'opt_fields': ASANA_OPT_FIELDS
+            }
+            if section_gid:
+                params['section'] = section_gid
+            else:
+                params['project'] = project_gid
+            if completed_since:
+                params['completed_since'] = completed_since.isoformat()
+
+            try:
+                tasks = [x for x in client.tasks.get_tasks(params)]
+            except asana.error.NoAuthorizationError:
+                raise errors.AsanaAuthenticationError('the authentication method '
+                                                      'supplied returned as '
+                                                      'unauthorized')
+
+            for task in tasks:
+                data_point = GanttData.from_asana(task,
+                                                  use_html_description = use_html_description,
+                                                  connection_callback = connection_callback,
+                                                  connection_kwargs = connection_kwargs)
+                updated_points[data_point.id] = data_point
+
+            for gid in [x for x in changed_gids if x not in updated_points]:
+                try:
+                    task = client.tasks.get_task(
+                        gid,
+                        {'opt_fields': ASANA_OPT_FIELDS + ['memberships.project',
+                                                           'memberships.section']}
+                    )
+                except asana.error.NotFoundError:
+                    removed_gids.add(gid)
+                    continue
+                except asana.error.NoAuthorizationError:
+                    raise errors.AsanaAuthenticationError('the authentication method '
+                                                          'supplied returned as '
+                                                          'unauthorized')
+
+                if not self._is_asana_task_in_scope(task,
+                                                    project_gid = project_gid,
+                                                    section_gid = section_gid,
+                                                    completed_since = completed_since):
+                    removed_gids.add(gid)
+                    continue
+
+                data_point = GanttData.from_asana(task,
+                                                  use_html_description = use_html_description,
+                                                  connection_callback = connection_callback,
+                                                  connection_kwargs = connection_kwargs)
+                updated_points[data_point.id] = data_point
+
+        self._merge_data_points(updated_points, removed_gids)
+        self.asana_sync_token = sync_token
+        self.asana_synced_at = sync_started
+
+    @staticmethod
+    def _is_asana_task_in_scope(task,
+                                project_gid,
+                                section_gid = None,
+                                completed_since = None):
+        """Whether the Asana ``task`` belongs to the project (or section) being
+        synchronized, and is not excluded by ``completed_since``.
+
+        .. note::
+
+          If ``task`` does not list its ``memberships``, its membership is assumed.
+
+        :param task: The Asana task representation.
+        :type task: :class:`dict <python:dict>`
+
+        :param project_gid: The globally unique ID of the project being synchronized.
+        :type project_gid: :class:`str <python:str>`
+
+        :param section_gid: The globally unique ID of the section being synchronized,
+          if any. Defaults to :obj:`None <python:None>`.
+        :type section_gid: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param completed_since: If supplied, tasks completed before this date and time
+          are out of scope. Defaults to :obj:`None <python:None>`.
+        :type completed_since: :class:`datetime <python:datetime.datetime>` or
+          :obj:`None <python:None>`
+
+        :rtype: :class:`bool <python:bool>`
+        """
+        memberships = task.get('memberships', None)
+        if memberships is not None:
+            if section_gid:
+                gids = [(x.get('section') or {}).get('gid') for x in memberships]
+                if section_gid not in gids:
+                    return False
+            else:
+                gids = [(x.get('project') or {}).get('gid') for x in memberships]
+                if project_gid not in gids:
+                    return False
+
+        if completed_since and task.get('completed', False):
+            completed_at = validators.datetime(task.get('completed_at', None),
+                                               allow_empty = True)
+            if completed_at and completed_since.tzinfo is None:
+                completed_since = completed_since.replace(tzinfo = completed_at.tzinfo)
+            if completed_at and completed_at < completed_since:
+                return False
+
+        return True
+
+    @staticmethod
+    def _get_asana_client(personal_access_token = None, asana_client = None):
+        """Return an authenticated Asana API client.
+
+        :param personal_access_token: A Personal Access Token created by Asana.
+          Defaults to :obj:`None <python:None>`, which tries to determine its value
+          by looking in the ``ASANA_PERSONAL_ACCESS_TOKEN`` environment variable.
+        :type personal_access_token: :class:`str <python:str>` or
+          :obj:`None <python:None>`
+
+        :param asana_client: An Asana API client that has been fully authenticated.
+          Defaults to :obj:`None <python:None>`.
+        :type asana_client: :class:`asana.client.Client` or :obj:`None <python:None>`
 
-        :returns: A :class:`GanttSeries <highcharts_gantt.options.series.gantt.GanttSeries>`
-          populated with data from the indicated Asana project/section.
-        :rtype: :class:`GanttSeries <highcharts_gantt.options.series.gantt.GanttSeries>`
-        
-        :raises HighchartsDependencyError: if the 
-          `asana <https://pypi.org/project/asana/>`__ Python library is not available 
-          in the runtime environment.
-          
-        :raises HighchartsValueError: if ``connection_callback`` is not 
-          :obj:`None <python:None>`, but is not callable
-        :raises HighchartsValueError: if ``asana_client`` is not 
-          :obj:`None <python:None>`, but is not a valid :class:`asana.client.Client>`
-          instance
-        :raises AsanaAuthenticationError: if ``asana_client`` is not authenticated or 
+        :rtype: :class:`asana.client.Client`
+
+        :raises HighchartsValueError: if ``asana_client`` is not a valid
+          :class:`asana.client.Client>` instance
+        :raises AsanaAuthenticationError: if ``asana_client`` is not authenticated or
           if no personal access token is supplied
         """
-        series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
-        
-        instance = cls(**series_kwargs)
-        instance.load_from_asana(project_gid,
-                                 section_gid = section_gid,
-                                 completed_since = completed_since,
-                                 use_html_description = use_html_description,
-                                 personal_access_token = personal_access_token,
-                                 asana_client = asana_client,
-                                 api_request_params = api_request_params,
-                                 connection_kwargs = connection_kwargs,
-                                 connection_callback = connection_callback)
+        if not personal_access_token:
+            personal_access_token = os.getenv('ASANA_PERSONAL_ACCESS_TOKEN', None)
 
-        return instance
+        if asana_client and not isinstance(asana_client, asana.client.Client):
+            raise errors.HighchartsValueError(f'asana_client must be a valid asana '
+                                              f'Client instance. Was: '
+                                              f'{asana_client.__class__.__name__}')
+        if asana_client and not asana_client.session.token:
+            raise errors.AsanaAuthenticationError('asana_client is not authenticated')
+
+        if asana_client:
+            client = asana_client
+        elif not personal_access_token:
+            raise errors.AsanaAuthenticationError('from_asana() requires either a '
+                                                  'personal access token or an '
+                                                  'authenticated Asana client. '
+                                                  'Neither was supplied.')
+        else:
+            client = asana.Client.access_token(personal_access_token)
+
+        return install_response_cache(client, 'asana')
+
+    @staticmethod
+    def _get_asana_events(client, project_gid, section_gid = None, sync_token = None):
+        """Retrieve the task events for ``project_gid`` that occurred since
+        ``sync_token`` was issued.
+
+        :returns: A tuple of the set of changed task gids, the set of deleted or
+          removed task gids, and the new sync token. If ``sync_token`` is
+          :obj:`None <python:None>` or has expired, the sets of gids are
+          :obj:`None <python:None>`.
+        :rtype: :class:`tuple <python:tuple>`
+        """
+        params = {
+            'resource': project_gid
+        }
+        if sync_token:
+            params['sync'] = sync_token
+
+        removal_parents = [project_gid, section_gid]
+        changed_gids = set()
+        removed_gids = set()
+        while True:
+            try:
+                result = client.events.get(params)
+            except asana.error.InvalidTokenError as error:
+                return None, None, error.sync
+            except asana.error.NoAuthorizationError:
+                raise errors.AsanaAuthenticationError('the authentication method '
+                                                      'supplied returned as '
+                                                      'unauthorized')
+
+            for event in result.get('data', None) or []:
+                resource = event.get('resource', None) or {}
+                if resource.get('resource_type', None) != 'task':
+                    continue
+
+                gid = resource.get('gid', None)
+                action = event.get('action', None)
+                parent = event.get('parent', None) or {}
+                if action == 'deleted' or \
+                   (action == 'removed' and parent.get('gid', None) in removal_parents):
+                    removed_gids.add(gid)
+                    changed_gids.discard(gid)
+                else:
+                    changed_gids.add(gid)
+                    removed_gids.discard(gid)
+
+            params['sync'] = result.get('sync', None)
+            if not result.get('has_more', False):
+                break
+
+        return changed_gids, removed_gids, params['sync']
 
     def load_from_monday(self,
                          board_id,
@@ -500,7 +1828,8 @@ class GanttSeries(SeriesBase, GanttOptions):
                          template = None,
                          property_column_map = None,
                          connection_kwargs = None,
-                         connection_callback = None):
+                         connection_callback = None,
+                         page_size = 100):
         """Update the :class:`GanttSeries <highcharts_gantt.options.series.gantt.GanttSeries>` instance 
         with data from a `Monday.com <https://www.monday.com>`__ work board.
         
@@ -580,6 +1909,10 @@ class GanttSeries(SeriesBase, GanttOptions):
             
         :type connection_callback: Callable or :obj:`None <python:None>`
         
+        :param page_size: The number of items to retrieve from the Monday.com API per 
+          request. Defaults to ``100``.
+        :type page_size: :class:`int <python:int>`
+        
         :raises HighchartsDependencyError: if the 
           `monday <https://pypi.org/project/monday/>`__ Python library is not available 
           in the runtime environment
@@ -588,13 +1921,16 @@ class GanttSeries(SeriesBase, GanttOptions):
           are empty
         
         """
-        tasks = monday.get_tasks(board_id, api_token = api_token)
+        tasks = monday.iter_tasks(board_id,
+                                  api_token = api_token,
+                                  page_size = page_size)
 
-        data_points = [GanttData.from_monday(tasks[x],
+        data_points = [GanttData.from_monday(x,
                                              template = template,
                                              property_column_map = property_column_map,
                                              connection_kwargs = connection_kwargs,
-                                             connection_callback = connection_callback) for x in tasks]
+                                             connection_callback = connection_callback) 
+                       for x in tasks]
 
         self.data = data_points
 
@@ -606,6 +1942,7 @@ class GanttSeries(SeriesBase, GanttOptions):
                     property_column_map = None,
                     connection_kwargs = None,
                     connection_callback = None,
+                    page_size = 100,
                     series_kwargs = None):
         """Create a :class:`GanttSeries <highcharts_gantt.options.series.gantt.GanttSeries>` instance from a 
         `Monday.com <https://www.monday.com>`__ work board.
@@ -686,6 +2023,10 @@ class GanttSeries(SeriesBase, GanttOptions):
             
         :type connection_callback: Callable or :obj:`None <python:None>`
         
+        :param page_size: The number of items to retrieve from the Monday.com API per 
+          request. Defaults to ``100``.
+        :type page_size: :class:`int <python:int>`
+        
         :param series_kwargs: Collection of additional keyword arguments to use when 
           instantiating the 
           :class:`GanttSeries <highcharts_gantt.options.series.GanttSeries>` (besides 
@@ -707,18 +2048,46 @@ class GanttSeries(SeriesBase, GanttOptions):
         """
         series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
 
-        tasks = monday.get_tasks(board_id, api_token = api_token)
-        data_points = [GanttData.from_monday(tasks[x],
-                                             template = template,
-                                             property_column_map = property_column_map,
-                                             connection_kwargs = connection_kwargs,
-                                             connection_callback = connection_callback) for x in tasks]
-        
         instance = cls(**series_kwargs)
-        instance.data = data_points
+        instance.load_from_monday(board_id,
+                                  api_token = api_token,
+                                  template = template,
+                                  property_column_map = property_column_map,
+                                  connection_kwargs = connection_kwargs,
+                                  connection_callback = connection_callback,
+                                  page_size = page_size)
 
         return instance
 
+    async def load_from_monday_async(self, *args, **kwargs):
+        """Asynchronous counterpart to
+        :meth:`.load_from_monday() <GanttSeries.load_from_monday>`, which accepts
+        the same arguments.
+
+        The requests to Monday.com are executed in the
+        :func:`shared thread pool <highcharts_gantt.utility_functions.get_async_executor>`,
+        so that many series can be loaded concurrently without blocking the event
+        loop.
+        """
+        await run_async(self.load_from_monday, *args, **kwargs)
+
+    @classmethod
+    async def from_monday_async(cls, *args, **kwargs):
+        """Asynchronous counterpart to
+        :meth:`.from_monday() <GanttSeries.from_monday>`, which accepts the same
+        arguments.
+
+        The requests to Monday.com are executed in the
+        :func:`shared thread pool <highcharts_gantt.utility_functions.get_async_executor>`,
+        so that many series can be created concurrently without blocking the event
+        loop.
+
+        :returns: A :class:`GanttSeries <highcharts_gantt.options.series.gantt.GanttSeries>`
+          populated with data from Monday.com.
+        :rtype: :class:`GanttSeries <highcharts_gantt.options.series.gantt.GanttSeries>`
+        """
+        return await run_async(cls.from_monday, *args, **kwargs)
+
     def load_from_jira(self,
                        project_key,
                        server = None,
@@ -729,7 +2098,11 @@ class GanttSeries(SeriesBase, GanttOptions):
                        client_kwargs = None,
                        jira_client = None,
                        connection_kwargs = None,
-                       connection_callback = None):
+                       connection_callback = None,
+                       page_size = 100,
+                       max_workers = 8,
+                       fields = None,
+                       custom_fields = '*all'):
         """Update the
         :class:`GanttSeries <highcharts_gantt.options.series.gantt.GanttSeries>`
         instance with data from an `Atlassian JIRA <https://www.atlassian.com/>`__ project.
@@ -845,6 +2218,38 @@ class GanttSeries(SeriesBase, GanttOptions):
             
         :type connection_callback: Callable or :obj:`None <python:None>`
         
+        :param page_size: The number of issues to retrieve from JIRA per request. 
+          Defaults to ``100``.
+        :type page_size: :class:`int <python:int>`
+        
+        :param max_workers: The maximum number of pages of issues to retrieve from JIRA
+          concurrently. Defaults to ``8``.
+        :type max_workers: :class:`int <python:int>`
+
+        :param fields: The names of additional JIRA fields to retrieve for each issue,
+          besides those needed to assemble the data points. If ``'*all'``, all fields
+          will be retrieved. Only applies if ``custom_fields`` is not ``'*all'``, since
+          otherwise all fields are retrieved. Defaults to :obj:`None <python:None>`.
+        :type fields: iterable of :class:`str <python:str>`, ``'*all'``, or
+          :obj:`None <python:None>`
+
+        :param custom_fields: The names of the JIRA fields whose (raw) values should be
+          included in each data point's ``custom`` property, alongside the issue's
+          ``key``. If :obj:`None <python:None>`, only the issue's ``key`` is included.
+          Defaults to ``'*all'``, which uses the complete raw issue representation (and
+          retrieves all of each issue's fields).
+
+          .. tip::
+
+            The complete raw issue representation can be an order of magnitude larger
+            than the data point itself. Supplying a list of field names (or
+            :obj:`None <python:None>`) also limits the fields retrieved from JIRA to
+            those that are needed, which shrinks both the JIRA responses and the
+            serialized chart.
+
+        :type custom_fields: iterable of :class:`str <python:str>`, ``'*all'``, or
+          :obj:`None <python:None>`
+        
         :raises HighchartsDependencyError: if the `jira <https://jira.readthedocs.io/>`__
           Python library is not available in the runtime environment.
         :raises JIRAAuthenticationError: if no authentication details are provided or if
@@ -867,75 +2272,26 @@ class GanttSeries(SeriesBase, GanttOptions):
                                                    'runtime environment. Please install'
                                                    ' and try again.')
 
-        if not jira_client:
-            client_kwargs = validators.dict(client_kwargs, allow_empty = True) or {}
-            if not server:
-                server = os.getenv('HIGHCHARTS_JIRA_SERVER',
-                                   client_kwargs.get('server', 'https://jira.atlassian.com'))
-
-            client_kwargs['server'] = validators.url(server, allow_special_ips = True)
-
-            project_key = validators.string(project_key)
-
-            username = validators.string(username, allow_empty = True) \
-                or os.getenv('HIGHCHARTS_JIRA_USERNAME', None)
-            password_or_token = validators.string(password_or_token, allow_empty = True) \
-                or os.getenv('HIGHCHARTS_JIRA_TOKEN', None)
-
-            use_basic = oauth_dict is None and username is not None
-            use_token = oauth_dict is None and username is None
-            
-            if use_basic:
-                client_kwargs['basic_auth'] = (username, password_or_token)
-            elif use_token:
-                client_kwargs['token_auth'] = password_or_token
-            elif oauth_dict is not None:
-                client_kwargs['oauth'] = validators.dict(oauth_dict, 
-                                                         allow_empty = False)
-            else:
-                raise errors.JIRAAuthenticationError('no authentication details '
-                                                     'provided')
-            try:
-                jira_client = jira.JIRA(**client_kwargs)
-            except jira.JIRAError as error:
-                if error.status_code == 401:
-                    raise errors.JIRAAuthenticationError('JIRA failed to authenticate')
-                else:
-                    raise error
-        else:
-            if not isinstance(jira_client, jira.client.JIRA):
-                raise errors.HighchartsValueError(f'jira_client must be a valid '
-                                                  f'jira.client.JIRA instance. Was: '
-                                                  f'{jira_client.__class__.__name__}')
-
-        if not jira_client._session:
-            raise errors.JIRAAuthenticationError('jira_client is not authenticated')
-
-        if jql and f'project = {project_key}' not in jql and f'project={project_key}' not in jql:
-            raise errors.HighchartsValueError(f'jql contains a project reference '
-                                                f'that does not match project_key '
-                                                f'("{project_key}").')    
-        elif not jql:
-            jql = f'project = {project_key}'
-
-        try:
-            issues = jira_client.search_issues(jql)
-        except jira.JIRAError as error:
-            if error.status_code == 400:
-                raise errors.JIRAProjectNotFoundError(f'No JIRA project with key "{project_key}" '
-                                                      f'was found. Note that this may be because '
-                                                      f'your authentication failed silently, '
-                                                      f'a common issue when using JIRA Cloud.')
-            else:
-                raise error
-
-        if issues.total > len(issues):
-            issues.extend(jira_client.search_issues(jql, startAt = len(issues)))
+        project_key = validators.string(project_key)
+        jira_client = get_jira_client(server = server,
+                                      username = username,
+                                      password_or_token = password_or_token,
+                                      oauth_dict = oauth_dict,
+                                      client_kwargs = client_kwargs,
+                                      jira_client = jira_client)
+        jql = self._get_jira_jql(project_key, jql)
+        issues = self._search_jira(jira_client,
+                                   project_key,
+                                   jql,
+                                   page_size = page_size,
+                                   max_workers = max_workers,
+                                   fields = get_jira_fields(fields, custom_fields))
 
         data_points_with_none = [
             GanttData.from_jira(x,
                                 connection_kwargs = connection_kwargs,
-                                connection_callback = connection_callback)
+                                connection_callback = connection_callback,
+                                custom_fields = custom_fields)
             for x in issues
         ]
 
@@ -955,6 +2311,10 @@ class GanttSeries(SeriesBase, GanttOptions):
                   jira_client = None,
                   connection_kwargs = None,
                   connection_callback = None,
+                  page_size = 100,
+                  max_workers = 8,
+                  fields = None,
+                  custom_fields = '*all',
                   series_kwargs = None):
         """Create a 
         :class:`GanttSeries <highcharts_gantt.options.series.gantt.GanttSeries>`
@@ -1071,6 +2431,38 @@ class GanttSeries(SeriesBase, GanttOptions):
             
         :type connection_callback: Callable or :obj:`None <python:None>`
         
+        :param page_size: The number of issues to retrieve from JIRA per request. 
+          Defaults to ``100``.
+        :type page_size: :class:`int <python:int>`
+        
+        :param max_workers: The maximum number of pages of issues to retrieve from JIRA
+          concurrently. Defaults to ``8``.
+        :type max_workers: :class:`int <python:int>`
+
+        :param fields: The names of additional JIRA fields to retrieve for each issue,
+          besides those needed to assemble the data points. If ``'*all'``, all fields
+          will be retrieved. Only applies if ``custom_fields`` is not ``'*all'``, since
+          otherwise all fields are retrieved. Defaults to :obj:`None <python:None>`.
+        :type fields: iterable of :class:`str <python:str>`, ``'*all'``, or
+          :obj:`None <python:None>`
+
+        :param custom_fields: The names of the JIRA fields whose (raw) values should be
+          included in each data point's ``custom`` property, alongside the issue's
+          ``key``. If :obj:`None <python:None>`, only the issue's ``key`` is included.
+          Defaults to ``'*all'``, which uses the complete raw issue representation (and
+          retrieves all of each issue's fields).
+
+          .. tip::
+
+            The complete raw issue representation can be an order of magnitude larger
+            than the data point itself. Supplying a list of field names (or
+            :obj:`None <python:None>`) also limits the fields retrieved from JIRA to
+            those that are needed, which shrinks both the JIRA responses and the
+            serialized chart.
+
+        :type custom_fields: iterable of :class:`str <python:str>`, ``'*all'``, or
+          :obj:`None <python:None>`
+        
         :param series_kwargs: Collection of additional keyword arguments to use when 
           instantiating the 
           :class:`GanttSeries <highcharts_gantt.options.series.GanttSeries>` (besides 
@@ -1111,6 +2503,358 @@ class GanttSeries(SeriesBase, GanttOptions):
                                 client_kwargs = client_kwargs,
                                 jira_client = jira_client,
                                 connection_kwargs = connection_kwargs,
-                                connection_callback = connection_callback)
+                                connection_callback = connection_callback,
+                                page_size = page_size,
+                                max_workers = max_workers,
+                                fields = fields,
+                                custom_fields = custom_fields)
 
         return instance
+
+    async def load_from_jira_async(self, *args, **kwargs):
+        """Asynchronous counterpart to
+        :meth:`.load_from_jira() <GanttSeries.load_from_jira>`, which accepts
+        the same arguments.
+
+        The requests to JIRA are executed in the
+        :func:`shared thread pool <highcharts_gantt.utility_functions.get_async_executor>`,
+        so that many series can be loaded concurrently without blocking the event
+        loop.
+        """
+        await run_async(self.load_from_jira, *args, **kwargs)
+
+    @classmethod
+    async def from_jira_async(cls, *args, **kwargs):
+        """Asynchronous counterpart to
+        :meth:`.from_jira() <GanttSeries.from_jira>`, which accepts the same
+        arguments.
+
+        The requests to JIRA are executed in the
+        :func:`shared thread pool <highcharts_gantt.utility_functions.get_async_executor>`,
+        so that many series can be created concurrently without blocking the event
+        loop.
+
+        :returns: A :class:`GanttSeries <highcharts_gantt.options.series.gantt.GanttSeries>`
+          populated with data from JIRA.
+        :rtype: :class:`GanttSeries <highcharts_gantt.options.series.gantt.GanttSeries>`
+        """
+        return await run_async(cls.from_jira, *args, **kwargs)
+
+    @bypass_response_cache()
+    def sync_from_jira(self,
+                       project_key,
+                       server = None,
+                       jql = None,
+                       username = None,
+                       password_or_token = None,
+                       oauth_dict = None,
+                       client_kwargs = None,
+                       jira_client = None,
+                       connection_kwargs = None,
+                       connection_callback = None,
+                       page_size = 100,
+                       max_workers = 8,
+                       fields = None,
+                       custom_fields = '*all',
+                       detect_removals = False):
+        """Update the series' data with the JIRA issues that have changed since the
+        last synchronization, rather than re-loading the entire project.
+
+        On the first call (i.e. when
+        :meth:`.jira_synced_at <GanttSeries.jira_synced_at>` is
+        :obj:`None <python:None>` or the series has no data), this method performs a full
+        load using :meth:`.load_from_jira() <GanttSeries.load_from_jira>`. On each
+        subsequent call, only issues whose ``updated`` field is at or after the
+        last :meth:`.jira_synced_at <GanttSeries.jira_synced_at>` watermark are
+        retrieved. Those issues are then updated in-place (or appended) in
+        :meth:`.data <GanttSeries.data>`, matched by issue key
+        (:meth:`GanttData.id <highcharts_gantt.options.series.data.gantt.GanttData.id>`).
+        Issues that have been marked as duplicates are removed.
+
+        .. note::
+
+          JIRA does not report deleted issues in search results. To also remove data
+          points whose issues have been deleted (or no longer match ``jql``), set
+          ``detect_removals`` to ``True``. This retrieves the keys (and only the keys)
+          of all issues matching ``jql``, which is significantly cheaper than a full
+          reload.
+
+        .. tip::
+
+          The watermark is rounded out to whole minutes (JIRA's query precision) and
+          re-applied with a one-minute overlap, so an issue may be retrieved by two
+          consecutive synchronizations. This is harmless, since updates are applied
+          by issue key.
+
+        .. note::
+
+          Requests issued while synchronizing are never served from the
+          :class:`ResponseCache <highcharts_gantt.response_cache.ResponseCache>` (if
+          enabled), since they are often identical from one sync to the next. Their
+          responses are still stored in it.
+
+        :param project_key: The key of the JIRA project to synchronize from.
+        :type project_key: :class:`str <python:str>`
+
+        :param server: The URL of the JIRA instance from which to load the issues.
+          Defaults to :obj:`None <python:None>`, which looks for a value in the
+          ``HIGHCHARTS_JIRA_SERVER`` environment variable.
+        :type server: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param jql: An optional :term:`JIRA Query Language` query string to further
+          narrow the issues returned from JIRA. Defaults to :obj:`None <python:None>`.
+        :type jql: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param username: The username to use when authenticating. Defaults to
+          :obj:`None <python:None>`, which looks for a value in the
+          ``HIGHCHARTS_JIRA_USERNAME`` environment variable.
+        :type username: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param password_or_token: The password or access token to use when
+          authenticating. Defaults to :obj:`None <python:None>`, which looks for a
+          value in the ``HIGHCHARTS_JIRA_TOKEN`` environment variable.
+        :type password_or_token: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param oauth_dict: A :class:`dict <python:dict>` of key/value pairs providing
+          configuration of the Oauth2 authentication details. Defaults to
+          :obj:`None <python:None>`.
+        :type oauth_dict: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+        :param client_kwargs: An optional :class:`dict <python:dict>` providing keyword
+          arguments to use when instantiating the JIRA client.
+        :type client_kwargs: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+        :param jira_client: A fully-configured and fully-authenticated JIRA API client.
+          Defaults to :obj:`None <python:None>`.
+        :type jira_client: :class:`jira.client.JIRA <jira:jira.client.JIRA>` instance
+          that has been fully authenticated
+
+        :param connection_kwargs: Set of keyword arugments to supply to the
+          :class:`DataConnection <highcharts_gantt.options.series.data.connect.DataConnection>`
+          constructor, besides the
+          :meth:`.to <highcharts_gantt.options.series.data.connect.DataConnection.to>`
+          property which is derived from the task. Defaults to :obj:`None <python:None>`
+        :type connection_kwargs: :class:`dict <python:dict>` or
+          :obj:`None <python:None>`
+
+        :param connection_callback: A custom Python function or method which accepts two
+          keyword arguments: ``connection_target`` and ``issue``, and returns a
+          :class:`DataConnection <highcharts_gantt.options.series.data.connect.DataConnection>`
+          instance. Defaults to :obj:`None <python:None>`.
+        :type connection_callback: Callable or :obj:`None <python:None>`
+
+        :param page_size: The number of issues to retrieve from JIRA per request.
+          Defaults to ``100``.
+        :type page_size: :class:`int <python:int>`
+
+        :param max_workers: The maximum number of pages of issues to retrieve from JIRA
+          concurrently. Defaults to ``8``.
+        :type max_workers: :class:`int <python:int>`
+
+        :param fields: The names of additional JIRA fields to retrieve for each issue,
+          besides those needed to assemble the data points. If ``'*all'``, all fields
+          will be retrieved. Only applies if ``custom_fields`` is not ``'*all'``, since
+          otherwise all fields are retrieved. Defaults to :obj:`None <python:None>`.
+        :type fields: iterable of :class:`str <python:str>`, ``'*all'``, or
+          :obj:`None <python:None>`
+
+        :param custom_fields: The names of the JIRA fields whose (raw) values should be
+          included in each data point's ``custom`` property, alongside the issue's
+          ``key``. If :obj:`None <python:None>`, only the issue's ``key`` is included.
+          Defaults to ``'*all'``, which uses the complete raw issue representation (and
+          retrieves all of each issue's fields).
+
+          .. tip::
+
+            The complete raw issue representation can be an order of magnitude larger
+            than the data point itself. Supplying a list of field names (or
+            :obj:`None <python:None>`) also limits the fields retrieved from JIRA to
+            those that are needed, which shrinks both the JIRA responses and the
+            serialized chart.
+
+        :type custom_fields: iterable of :class:`str <python:str>`, ``'*all'``, or
+          :obj:`None <python:None>`
+
+        :param detect_removals: If ``True``, removes data points whose issues no longer
+          match ``jql`` (e.g. because they were deleted). Defaults to ``False``.
+        :type detect_removals: :class:`bool <python:bool>`
+
+        :raises HighchartsDependencyError: if the `jira <https://jira.readthedocs.io/>`__
+          Python library is not available in the runtime environment.
+        :raises JIRAAuthenticationError: if no authentication details are provided or if
+          the authentication process fails
+        :raises JIRAProjectNotFoundError: if the ``project_key`` is not found in the JIRA
+          ``server`` indicated
+        :raises HighchartsValueError: if other keyword arguments are misconfigured
+        """
+        if not HAS_JIRA:
+            raise errors.HighchartsDependencyError('The .sync_from_jira() method depends '
+                                                   'on the jira Python library. This '
+                                                   'library was not found in the '
+                                                   'runtime environment. Please install'
+                                                   ' and try again.')
+
+        sync_started = datetime.datetime.now(tz = datetime.timezone.utc)
+
+        if not self.jira_synced_at or not self.data:
+            self.load_from_jira(project_key = project_key,
+                                server = server,
+                                jql = jql,
+                                username = username,
+                                password_or_token = password_or_token,
+                                oauth_dict = oauth_dict,
+                                client_kwargs = client_kwargs,
+                                jira_client = jira_client,
+                                connection_kwargs = connection_kwargs,
+                                connection_callback = connection_callback,
+                                page_size = page_size,
+                                max_workers = max_workers,
+                                fields = fields,
+                                custom_fields = custom_fields)
+            self.jira_synced_at = sync_started
+            return
+
+        project_key = validators.string(project_key)
+        jira_client = get_jira_client(server = server,
+                                      username = username,
+                                      password_or_token = password_or_token,
+                                      oauth_dict = oauth_dict,
+                                      client_kwargs = client_kwargs,
+                                      jira_client = jira_client)
+        jql = self._get_jira_jql(project_key, jql)
+
+        delta_jql = self._get_jira_delta_jql(jql,
+                                             since = self.jira_synced_at,
+                                             now = sync_started)
+        issues = self._search_jira(jira_client,
+                                   project_key,
+                                   delta_jql,
+                                   page_size = page_size,
+                                   max_workers = max_workers,
+                                   fields = get_jira_fields(fields, custom_fields))
+
+        updated_points = {}
+        removed_ids = set()
+        for issue in issues:
+            data_point = GanttData.from_jira(issue,
+                                             connection_kwargs = connection_kwargs,
+                                             connection_callback = connection_callback,
+                                             custom_fields = custom_fields)
+            if data_point is None:
+                removed_ids.add(issue.key)
+            else:
+                updated_points[data_point.id] = data_point
+
+        if detect_removals:
+            current_ids = set(x.key for x in self._search_jira(jira_client,
+                                                                 project_key,
+                                                                 jql,
+                                                                 page_size = page_size,
+                                                                 max_workers = max_workers,
+                                                                 fields = 'key'))
+            removed_ids.update(x.id for x in self.data if x.id not in current_ids)
+
+        self._merge_data_points(updated_points, removed_ids)
+        self.jira_synced_at = sync_started
+
+    def _merge_data_points(self, updated_points, removed_ids):
+        """Update the series' :meth:`.data <GanttSeries.data>` in-place by id.
+
+        Existing data points whose id is in ``removed_ids`` are dropped, those whose id
+        is a key in ``updated_points`` are replaced (keeping their position), and any
+        remaining ``updated_points`` are appended.
+
+        :param updated_points: The new or changed data points, keyed by id.
+        :type updated_points: :class:`dict <python:dict>` of :class:`GanttData`
+
+        :param removed_ids: The ids of the data points to remove.
+        :type removed_ids: iterable of :class:`str <python:str>`
+        """
+        self.remove_points(removed_ids, ignore_missing = True)
+        self.upsert_points(updated_points.values())
+
+    @staticmethod
+    def _get_jira_jql(project_key, jql = None):
+        """Return the :term:`JIRA Query Language` query string to use when retrieving
+        issues for ``project_key``.
+
+        :param project_key: The key of the JIRA project.
+        :type project_key: :class:`str <python:str>`
+
+        :param jql: An optional query string to further narrow the issues returned.
+          Defaults to :obj:`None <python:None>`.
+        :type jql: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :rtype: :class:`str <python:str>`
+
+        :raises HighchartsValueError: if ``jql`` references a different project
+        """
+        if jql and f'project = {project_key}' not in jql and f'project={project_key}' not in jql:
+            raise errors.HighchartsValueError(f'jql contains a project reference '
+                                              f'that does not match project_key '
+                                              f'("{project_key}").')
+        elif not jql:
+            jql = f'project = {project_key}'
+
+        return jql
+
+    @staticmethod
+    def _get_jira_delta_jql(jql, since, now):
+        """Return a version of ``jql`` restricted to issues updated since ``since``.
+
+        The restriction uses a relative ``updated`` clause (e.g. ``updated >= -15m``),
+        which JIRA evaluates against its own clock and timezone. It is rounded up to
+        whole minutes and padded by one minute to tolerate clock skew.
+
+        :param jql: The :term:`JIRA Query Language` query string to restrict.
+        :type jql: :class:`str <python:str>`
+
+        :param since: The watermark of the last synchronization.
+        :type since: :class:`datetime <python:datetime.datetime>`
+
+        :param now: The current date and time.
+        :type now: :class:`datetime <python:datetime.datetime>`
+
+        :rtype: :class:`str <python:str>`
+        """
+        minutes = max(math.ceil((now - since).total_seconds() / 60), 0) + 1
+        query, *order_by = re.split(r'\s+order\s+by\s+',
+                                    jql,
+                                    maxsplit = 1,
+                                    flags = re.IGNORECASE)
+
+        delta_jql = f'({query}) AND updated >= -{minutes}m'
+        if order_by:
+            delta_jql += f' ORDER BY {order_by[0]}'
+
+        return delta_jql
+
+    @staticmethod
+    def _search_jira(jira_client,
+                     project_key,
+                     jql,
+                     page_size = 100,
+                     max_workers = 8,
+                     **kwargs):
+        """Retrieve all of the JIRA issues that match ``jql``, mapping JIRA's response
+        errors to Highcharts exceptions.
+
+        :rtype: :class:`list <python:list>` of :class:`Issue <jira:jira.resources.Issue>`
+
+        :raises JIRAProjectNotFoundError: if the ``project_key`` is not found in the JIRA
+          server
+        """
+        try:
+            return get_jira_issues(jira_client,
+                                   jql,
+                                   page_size = page_size,
+                                   max_workers = max_workers,
+                                   **kwargs)
+        except jira.JIRAError as error:
+            if error.status_code == 400:
+                raise errors.JIRAProjectNotFoundError(f'No JIRA project with key "{project_key}" '
+                                                      f'was found. Note that this may be because '
+                                                      f'your authentication failed silently, '
+                                                      f'a common issue when using JIRA Cloud.')
+            else:
+                raise error
@@ -5,6 +5,7 @@ import json
 from validator_collection import validators, checkers
 
 from highcharts_gantt import errors
+from highcharts_gantt.js_literal_functions import get_key_value_pairs
 
 from highcharts_gantt.options.series.base import SeriesBase
 from highcharts_gantt.options.series.arcdiagram import ArcDiagramSeries
@@ -124,6 +125,74 @@ GANTT_SERIES_LIST = [
     'gantt'
 ]
 
+def _js_literal_to_dict(as_str) -> dict:
+    """Parse a JavaScript object literal describing a series into a
+    :class:`dict <python:dict>`, applying the same rules as
+    :meth:`HighchartsMeta.from_js_literal() <highcharts_core.metaclasses.HighchartsMeta.from_js_literal>`.
+
+    This lets :func:`create_series_obj` read the series ``type`` and then build the
+    concrete series from a single parse of ``as_str``.
+
+    :param as_str: The JavaScript object literal.
+    :type as_str: :class:`str <python:str>`
+
+    :rtype: :class:`dict <python:dict>`
+
+    :raises HighchartsParseError: if ``as_str`` is not a valid object literal
+    """
+    if as_str.lstrip().startswith('{'):
+        parsed, updated_str = SeriesBase._validate_js_literal(
+            f'var randomVariable = {as_str}',
+            _break_loop_on_failure = True
+        )
+    else:
+        parsed, updated_str = SeriesBase._validate_js_literal(as_str)
+        if parsed.body and not checkers.is_type(parsed.body[0], 'VariableDeclaration'):
+            parsed, updated_str = SeriesBase._validate_js_literal(
+                f'var randomVariable = {as_str}',
+                _break_loop_on_failure = True
+            )
+
+    if not parsed.body:
+        return {}
+
+    if len(parsed.body) > 1:
+        raise errors.HighchartsCollectionError(f'each JavaScript object literal is '
+                                               f'expected to contain one object. '
+                                               f'However, you attempted to parse '
+                                               f'{len(parsed.body)} objects.')
+
+    body = parsed.body[0]
+    if not checkers.is_type(body, 'VariableDeclaration'):
+        raise errors.HighchartsVariableDeclarationError('To parse a JavaScriot '
+                                                        'object literal, it is '
+                                                        'expected to be either a '
+                                                        'variable declaration or a'
+                                                        'standalone block statement.'
+                                                        'Input received did not '
+                                                        'conform.')
+
+    declarations = body.declarations
+    if not declarations:
+        return {}
+
+    if len(declarations) > 1:
+        raise errors.HighchartsCollectionError(f'each JavaScript object literal is '
+                                               f'expected to contain one object. '
+                                               f'However, you attempted to parse '
+                                               f'{len(parsed.body)} objects.')
+
+    object_expression = declarations[0].init
+    if not checkers.is_type(object_expression, 'ObjectExpression'):
+        raise errors.HighchartsParseError(f'Highcharts expects an object literal to '
+                                          f'to be defined as a standard '
+                                          f'ObjectExpression. Received: '
+                                          f'{type(object_expression)}')
+
+    return {x[0]: x[1] for x in get_key_value_pairs(object_expression.properties,
+                                                    updated_str)}
+
+
 def create_series_obj(value,
                       default_type = None) -> Optional[SeriesBase]:
     """Create an instance descended from
@@ -170,10 +239,11 @@ def create_series_obj(value,
 
         instance = cls.from_dict(value)
     elif isinstance(value, str):
+        as_dict = None
         if 'data:' in value:
             try:
-                preliminary = SeriesBase.from_js_literal(value)
-                type_ = preliminary.type
+                as_dict = _js_literal_to_dict(value)
+                type_ = as_dict.get('type', default_type)
             except errors.HighchartsParseError:
                 preliminary_as_dict = json.loads(value)
 
@@ -192,9 +262,12 @@ def create_series_obj(value,
                                               f'"type" value that was not recognized: '
                                               f'{type_}')
 
-        try:
-            instance = cls.from_js_literal(value)
-        except errors.HighchartsParseError:
-            instance = cls.from_json(value)
+        if as_dict is not None:
+            instance = cls.from_dict(as_dict)
+        else:
+            try:
+                instance = cls.from_js_literal(value)
+            except errors.HighchartsParseError:
+                instance = cls.from_json(value)
 
     return instance
@@ -0,0 +1,534 @@
+import os
+import time
+import hashlib
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from requests.adapters import HTTPAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from validator_collection import validators, checkers
+
+from highcharts_gantt import errors
+
+try:
+    import orjson as json
+except ImportError:
+    try:
+        import rapidjson as json
+    except ImportError:
+        try:
+            import simplejson as json
+        except ImportError:
+            import json
+
+
+_RESPONSE_CACHE = None
+_BYPASS = threading.local()
+
+
+class ResponseCache(object):
+    """A persistent (SQLite-backed) cache of the responses returned by the Asana, JIRA,
+    and Monday.com APIs.
+
+    Entries are keyed by a hash of the source, the request (method, URL, and body),
+    and the credentials used, so that responses are never shared between users.
+    Entries younger than :meth:`.ttl <ResponseCache.ttl>` are served without
+    contacting the API. Older entries that carry an ``ETag`` or ``Last-Modified``
+    header are revalidated using a conditional request, and are otherwise
+    re-retrieved.
+
+    Expired entries are pruned (see :meth:`.evict() <ResponseCache.evict>`) when the
+    cache is opened, and at most once per :meth:`.ttl <ResponseCache.ttl>` as new
+    entries are stored, so the database does not grow without limit.
+
+    .. tip::
+
+      Since the cache is persisted to disk, it can also be used as an offline replay
+      fixture (e.g. for benchmarks) by setting a very large ``ttl``.
+
+    """
+
+    def __init__(self, path = None, ttl = 3600):
+        self._lock = threading.Lock()
+        self._path = None
+        self._ttl = None
+        self._connection = None
+        self._evicted_at = 0
+
+        self.path = path
+        self.ttl = ttl
+
+        self.evict()
+
+    @property
+    def path(self) -> str:
+        """The path to the SQLite database file in which responses are persisted.
+        Defaults to ``'~/.cache/highcharts_gantt/responses.sqlite'``.
+
+        :rtype: :class:`str <python:str>`
+        """
+        return self._path
+
+    @path.setter
+    def path(self, value):
+        value = validators.string(value, allow_empty = True) or \
+            os.path.join(os.path.expanduser('~'),
+                         '.cache',
+                         'highcharts_gantt',
+                         'responses.sqlite')
+        if value != ':memory:':
+            directory = os.path.dirname(os.path.abspath(value))
+            os.makedirs(directory, exist_ok = True)
+
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+            self._path = value
+            self._connection = sqlite3.connect(value, check_same_thread = False)
+            self._connection.execute('CREATE TABLE IF NOT EXISTS responses ('
+                                     'key TEXT PRIMARY KEY, '
+                                     'source TEXT, '
+                                     'status INTEGER, '
+                                     'headers TEXT, '
+                                     'body BLOB, '
+                                     'etag TEXT, '
+                                     'last_modified TEXT, '
+                                     'stored_at REAL)')
+            self._connection.commit()
+
+    @property
+    def ttl(self) -> float:
+        """The number of seconds for which a cached response is considered fresh.
+        Defaults to ``3600``.
+
+        :rtype: numeric
+        """
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, value):
+        self._ttl = validators.numeric(value, minimum = 0)
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    @staticmethod
+    def make_key(source, *args):
+        """Return the cache key for a request to ``source`` described by ``args``.
+
+        :param source: The API to which the request is made (e.g. ``'jira'``).
+        :type source: :class:`str <python:str>`
+
+        :rtype: :class:`str <python:str>`
+        """
+        digest = hashlib.sha256(source.encode('utf-8'))
+        for arg in args:
+            if arg is None:
+                arg = b''
+            elif not isinstance(arg, bytes):
+                arg = str(arg).encode('utf-8')
+            digest.update(b'\x00' + arg)
+
+        return f'{source}:{digest.hexdigest()}'
+
+    def get(self, key):
+        """Return the entry stored under ``key``.
+
+        :returns: A :class:`dict <python:dict>` with the keys ``'status'``,
+          ``'headers'``, ``'body'``, ``'etag'``, ``'last_modified'``, and
+          ``'stored_at'``, or :obj:`None <python:None>` if there is no such entry.
+        :rtype: :class:`dict <python:dict>` or :obj:`None <python:None>`
+        """
+        with self._lock:
+            row = self._connection.execute('SELECT status, headers, body, etag, '
+                                           'last_modified, stored_at FROM responses '
+                                           'WHERE key = ?',
+                                           (key, )).fetchone()
+        if not row:
+            return None
+
+        return {
+            'status': row[0],
+            'headers': json.loads(row[1]),
+            'body': row[2],
+            'etag': row[3],
+            'last_modified': row[4],
+            'stored_at': row[5]
+        }
+
+    def set(self,
+            key,
+            source,
+            body,
+            status = 200,
+            headers = None,
+            etag = None,
+            last_modified = None):
+        """Store an entry under ``key``, replacing any existing entry.
+
+        :param key: The key under which to store the entry.
+        :type key: :class:`str <python:str>`
+
+        :param source: The API which returned the response (e.g. ``'jira'``).
+        :type source: :class:`str <python:str>`
+
+        :param body: The body of the response.
+        :type body: :class:`bytes <python:bytes>`
+
+        :param status: The HTTP status code of the response. Defaults to ``200``.
+        :type status: :class:`int <python:int>`
+
+        :param headers: The headers of the response. Defaults to
+          :obj:`None <python:None>`.
+        :type headers: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+        :param etag: The response's ``ETag``. Defaults to :obj:`None <python:None>`.
+        :type etag: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param last_modified: The response's ``Last-Modified`` header. Defaults to
+          :obj:`None <python:None>`.
+        :type last_modified: :class:`str <python:str>` or :obj:`None <python:None>`
+        """
+        headers = json.dumps(dict(headers or {}))
+        if isinstance(headers, bytes):
+            headers = headers.decode('utf-8')
+
+        with self._lock:
+            self._connection.execute('INSERT OR REPLACE INTO responses VALUES '
+                                     '(?, ?, ?, ?, ?, ?, ?, ?)',
+                                     (key,
+                                      source,
+                                      status,
+                                      headers,
+                                      body,
+                                      etag,
+                                      last_modified,
+                                      time.time()))
+            self._connection.commit()
+
+        if time.time() - self._evicted_at >= self.ttl:
+            self.evict()
+
+    def touch(self, key):
+        """Mark the entry stored under ``key`` as fresh (e.g. after it has been
+        revalidated).
+
+        :param key: The key of the entry.
+        :type key: :class:`str <python:str>`
+        """
+        with self._lock:
+            self._connection.execute('UPDATE responses SET stored_at = ? WHERE key = ?',
+                                     (time.time(), key))
+            self._connection.commit()
+
+    def is_fresh(self, entry):
+        """Whether ``entry`` is younger than :meth:`.ttl <ResponseCache.ttl>`.
+
+        :param entry: An entry returned by :meth:`.get() <ResponseCache.get>`.
+        :type entry: :class:`dict <python:dict>`
+
+        :rtype: :class:`bool <python:bool>`
+        """
+        return entry is not None and time.time() - entry['stored_at'] < self.ttl
+
+    def evict(self):
+        """Remove all entries that are older than :meth:`.ttl <ResponseCache.ttl>`.
+
+        .. note::
+
+          This is called automatically when the cache is opened and, at most once per
+          :meth:`.ttl <ResponseCache.ttl>`, when an entry is stored. Expired entries
+          therefore remain available for revalidation for up to another
+          :meth:`.ttl <ResponseCache.ttl>`.
+
+        :returns: The number of entries removed.
+        :rtype: :class:`int <python:int>`
+        """
+        with self._lock:
+            self._evicted_at = time.time()
+            cursor = self._connection.execute('DELETE FROM responses WHERE stored_at < ?',
+                                              (self._evicted_at - self.ttl, ))
+            self._connection.commit()
+
+        return cursor.rowcount
+
+    def clear(self, source = None):
+        """Remove all entries (for ``source``, if supplied).
+
+        :param source: If supplied, only removes the entries returned by this API (e.g.
+          ``'jira'``). Defaults to :obj:`None <python:None>`.
+        :type source: :class:`str <python:str>` or :obj:`None <python:None>`
+        """
+        with self._lock:
+            if source:
+                self._connection.execute('DELETE FROM responses WHERE source = ?',
+                                         (source, ))
+            else:
+                self._connection.execute('DELETE FROM responses')
+            self._connection.commit()
+
+
+class CachingAdapter(HTTPAdapter):
+    """A :mod:`requests <requests:requests>` transport adapter which serves responses
+    from (and stores responses in) a :class:`ResponseCache`.
+    """
+
+    def __init__(self, cache, source, methods = ('GET', ), **kwargs):
+        self.cache = cache
+        self.source = source
+        self.methods = [x.upper() for x in methods]
+
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if request.method.upper() not in self.methods:
+            return super().send(request, **kwargs)
+
+        key = self.cache.make_key(self.source,
+                                  request.method.upper(),
+                                  request.url,
+                                  request.body,
+                                  request.headers.get('Authorization', None))
+        entry = None
+        if not is_response_cache_bypassed():
+            entry = self.cache.get(key)
+        if self.cache.is_fresh(entry):
+            return self._build_cached_response(request, entry)
+
+        if entry and entry['etag']:
+            request.headers['If-None-Match'] = entry['etag']
+        if entry and entry['last_modified']:
+            request.headers['If-Modified-Since'] = entry['last_modified']
+
+        response = super().send(request, **kwargs)
+        if response.status_code == 304 and entry:
+            self.cache.touch(key)
+            return self._build_cached_response(request, entry)
+
+        if response.status_code == 200:
+            headers = {key: value for key, value in response.headers.items()
+                       if key.lower() not in ['set-cookie',
+                                              'content-encoding',
+                                              'transfer-encoding']}
+            self.cache.set(key,
+                           self.source,
+                           response.content,
+                           status = response.status_code,
+                           headers = headers,
+                           etag = response.headers.get('ETag', None),
+                           last_modified = response.headers.get('Last-Modified', None))
+
+        return response
+
+    @staticmethod
+    def _build_cached_response(request, entry):
+        response = Response()
+        response.status_code = entry['status']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = 'OK'
+        response.url = request.url
+        response.request = request
+        response._content = entry['body']
+        response._content_consumed = True
+        response.from_cache = True
+
+        return response
+
+
+@contextmanager
+def bypass_response_cache(bypass = True):
+    """Context manager within which requests issued *on the current thread* are
+    never served from a :class:`ResponseCache`, so that the API is always contacted.
+    Successful responses are still stored, refreshing the cache for later requests.
+
+    This is used by the incremental synchronization methods (e.g.
+    :meth:`GanttSeries.sync_from_jira() <highcharts_gantt.options.series.gantt.GanttSeries.sync_from_jira>`),
+    whose requests are often byte-identical from one sync to the next but whose
+    results must always be current.
+
+    .. note::
+
+      Worker threads do not inherit the bypass. Code that issues requests from a
+      thread pool should read
+      :func:`is_response_cache_bypassed() <highcharts_gantt.response_cache.is_response_cache_bypassed>`
+      in the calling thread and re-enter this context in each worker.
+
+    :param bypass: Whether to bypass the cache. Defaults to ``True``.
+    :type bypass: :class:`bool <python:bool>`
+    """
+    previous = is_response_cache_bypassed()
+    _BYPASS.active = bool(bypass) or previous
+    try:
+        yield
+    finally:
+        _BYPASS.active = previous
+
+
+def is_response_cache_bypassed():
+    """Whether requests issued on the current thread bypass the response cache (see
+    :func:`bypass_response_cache() <highcharts_gantt.response_cache.bypass_response_cache>`).
+
+    :rtype: :class:`bool <python:bool>`
+    """
+    return getattr(_BYPASS, 'active', False)
+
+
+def get_response_cache():
+    """Return the :class:`ResponseCache` enabled using
+    :func:`enable_response_cache() <highcharts_gantt.response_cache.enable_response_cache>`,
+    if any.
+
+    :rtype: :class:`ResponseCache` or :obj:`None <python:None>`
+    """
+    return _RESPONSE_CACHE
+
+
+def enable_response_cache(path = None, ttl = 3600):
+    """Enable the persistent response cache for all Asana, JIRA, and Monday.com API
+    clients that are subsequently created or supplied to **Highcharts Gantt for
+    Python**.
+
+    :param path: The path to the SQLite database file in which to persist responses.
+      Defaults to :obj:`None <python:None>`, which uses
+      ``'~/.cache/highcharts_gantt/responses.sqlite'``.
+    :type path: :class:`str <python:str>` or :obj:`None <python:None>`
+
+    :param ttl: The number of seconds for which a cached response is considered fresh.
+      Defaults to ``3600``.
+    :type ttl: numeric
+
+    :returns: The enabled cache.
+    :rtype: :class:`ResponseCache`
+    """
+    global _RESPONSE_CACHE
+
+    _RESPONSE_CACHE = ResponseCache(path = path, ttl = ttl)
+
+    return _RESPONSE_CACHE
+
+
+def disable_response_cache():
+    """Disable the persistent response cache for API clients that are subsequently
+    created.
+
+    .. note::
+
+      Clients to which the cache has already been installed will continue to use it.
+
+    """
+    global _RESPONSE_CACHE
+
+    _RESPONSE_CACHE = None
+
+
+def install_response_cache(client, source, cache = None):
+    """Install ``cache`` into ``client``, so that the client's responses are served
+    from (and stored in) the cache.
+
+    :param client: The API client into which the cache should be installed. Accepts
+      a JIRA client (:class:`jira.client.JIRA <jira:jira.client.JIRA>`), an Asana
+      client (:class:`asana.client.Client`), or a Monday.com client
+      (:class:`monday.MondayClient`).
+
+    :param source: The API to which ``client`` connects. Accepts ``'asana'``,
+      ``'jira'``, or ``'monday'``.
+    :type source: :class:`str <python:str>`
+
+    :param cache: The cache to install. Defaults to :obj:`None <python:None>`, which
+      installs the cache enabled using
+      :func:`enable_response_cache() <highcharts_gantt.response_cache.enable_response_cache>`
+      (if any).
+    :type cache: :class:`ResponseCache` or :obj:`None <python:None>`
+
+    :returns: ``client``
+    :raises HighchartsValueError: if ``source`` is not supported
+    """
+    if cache is None:
+        cache = get_response_cache()
+    if cache is None or client is None:
+        return client
+
+    if source in ['asana', 'jira']:
+        session = getattr(client, 'session', None) if source == 'asana' \
+            else getattr(client, '_session', None)
+        if session is None or checkers.is_type(session.get_adapter('https://'),
+                                               'CachingAdapter'):
+            return client
+        adapter = CachingAdapter(cache, source)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+    elif source == 'monday':
+        for resource in vars(client).values():
+            graphql_client = getattr(resource, 'client', None)
+            if graphql_client is not None and \
+               not getattr(graphql_client, '_response_cache', None):
+                _install_graphql_cache(graphql_client, cache)
+    else:
+        raise errors.HighchartsValueError(f'source must be "asana", "jira", or '
+                                          f'"monday". Received: {source}')
+
+    return client
+
+
+def _install_graphql_cache(graphql_client, cache):
+    """Wrap the ``execute()`` method of a Monday.com ``GraphQLClient`` so that the
+    results of (non-mutating) queries are served from (and stored in) ``cache``.
+
+    .. note::
+
+      The Monday.com API does not support conditional requests, so cached results are
+      only evicted based on their age.
+
+    .. note::
+
+      Monday.com reports errors (e.g. exhausted complexity budgets or rate limits)
+      with an HTTP ``200`` status, so only results that contain ``data`` and no
+      error are stored.
+
+    """
+    execute = graphql_client.execute
+
+    def cached_execute(query, variables = None):
+        if variables is not None or query.lstrip().startswith('mutation'):
+            return execute(query, variables)
+
+        key = cache.make_key('monday',
+                             graphql_client.endpoint,
+                             query,
+                             graphql_client.token)
+        entry = None
+        if not is_response_cache_bypassed():
+            entry = cache.get(key)
+        if cache.is_fresh(entry):
+            return json.loads(entry['body'])
+
+        result = execute(query, variables)
+        if not _is_graphql_success(result):
+            return result
+
+        body = json.dumps(result)
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        cache.set(key, 'monday', body)
+
+        return result
+
+    graphql_client.execute = cached_execute
+    graphql_client._response_cache = cache
+
+
+def _is_graphql_success(result):
+    """Whether ``result`` (as returned by a Monday.com ``GraphQLClient``) holds data
+    rather than an error.
+
+    :rtype: :class:`bool <python:bool>`
+    """
+    if not isinstance(result, dict) or 'data' not in result:
+        return False
+
+    return not any(result.get(x) for x in ['errors', 'error_code', 'error_message'])
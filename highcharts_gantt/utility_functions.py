@@ -1,8 +1,18 @@
+import gc
+import os
+import asyncio
+import functools
+import threading
+from contextlib import contextmanager
 from typing import Any
+from concurrent.futures import ThreadPoolExecutor
 
 from highcharts_core.utility_functions import *
 
 from highcharts_gantt import errors
+from highcharts_gantt.response_cache import (install_response_cache,
+                                             bypass_response_cache,
+                                             is_response_cache_bypassed)
 
 try:
     import orjson as json
@@ -15,18 +25,55 @@ except ImportError:
         except ImportError:
             import json
 
+try:
+    import jira
+    HAS_JIRA = True
+except ImportError:
+    HAS_JIRA = False
+
 from validator_collection import checkers, validators
 
+_ASYNC_EXECUTOR = None
+_ASYNC_EXECUTOR_LOCK = threading.Lock()
+
+JIRA_ISSUE_FIELDS = ['summary',
+                     'description',
+                     'status',
+                     'resolution',
+                     'resolutiondate',
+                     'statuscategorychangedate',
+                     'duedate',
+                     'progress',
+                     'worklog',
+                     'parent',
+                     'issuelinks']
+
 
 def parse_jira_issue(issue,
                      connection_kwargs = None,
-                     connection_callback = None):
+                     connection_callback = None,
+                     custom_fields = '*all'):
     """Return a :class:`dict <python:dict>` whose keys are 
     :class:`GanttData <highcharts_gantt.options.series.data.gantt.GanttData>` 
     properties and values are corresponding field values parsed from ``issue``.
     
     :param issue: The JIRA :class:`Issue <jira:jira.resources.Issue>` to parse.
     :type issue: :class:`Issue <jira:jira.resources.Issue>`
+
+    :param custom_fields: The names of the JIRA fields whose (raw) values should be
+      included in the data point's ``custom`` property, which will then contain the
+      issue's ``key`` and a ``fields`` :class:`dict <python:dict>` populated with the
+      whitelisted fields. If :obj:`None <python:None>`, only the ``key`` is included.
+      Defaults to ``'*all'``, which uses the complete raw issue representation.
+
+      .. tip::
+
+        The complete raw issue representation can be an order of magnitude larger
+        than the data point itself, so supplying a whitelist of fields (or
+        :obj:`None <python:None>`) can considerably shrink the serialized chart.
+
+    :type custom_fields: iterable of :class:`str <python:str>`, ``'*all'``, or
+      :obj:`None <python:None>`
     
     :returns: A :class:`dict <python:dict>` whose keys are 
       :class:`GanttData <highcharts_gantt.options.series.data.gantt.GanttData>` 
@@ -50,7 +97,7 @@ def parse_jira_issue(issue,
     worklogs_sorted_by_start = sorted(issue.fields.worklog.worklogs, 
                                       key = lambda x: validators.datetime(x.started))
     if issue.fields.status.name == 'Duplicate':
-        raise errors.DuplicateJIRAIssueError()
+        raise errors.JIRADuplicateIssueError()
 
     if not issue.fields.status and not issue.fields.resolution:
         is_status_finished = None
@@ -153,6 +200,327 @@ def parse_jira_issue(issue,
     if dependencies:
         data_point_kwargs['dependency'] = dependencies
 
-    data_point_kwargs['custom'] = issue.raw
+    if custom_fields == '*all':
+        data_point_kwargs['custom'] = issue.raw
+    else:
+        custom = {
+            'key': issue.key
+        }
+        if custom_fields:
+            if isinstance(custom_fields, str):
+                custom_fields = [custom_fields]
+            custom_fields = validators.iterable(custom_fields,
+                                                forbid_literals = (str, bytes, dict))
+            raw_fields = issue.raw.get('fields', None) or {}
+            custom['fields'] = {x: raw_fields.get(x, None) for x in custom_fields}
+        data_point_kwargs['custom'] = custom
+
+    return data_point_kwargs
+
+
+def get_jira_issues(jira_client,
+                    jql,
+                    page_size = 100,
+                    max_workers = 8,
+                    **kwargs):
+    """Retrieve *all* of the JIRA issues that match ``jql``, paginating through the
+    search results concurrently.
+
+    The first page of results is retrieved on its own to determine the total number of
+    matching issues. The remaining pages are then retrieved in parallel using a bounded
+    pool of worker threads, and are returned in the order in which JIRA returned them.
+
+    :param jira_client: A fully-configured and fully-authenticated JIRA API client.
+    :type jira_client: :class:`jira.client.JIRA <jira:jira.client.JIRA>`
+
+    :param jql: The :term:`JIRA Query Language` query string to execute.
+    :type jql: :class:`str <python:str>`
+
+    :param page_size: The number of issues to request per page. Defaults to ``100``.
+
+      .. note::
+
+        JIRA servers may cap the page size they return. If so, the page size actually
+        returned by the server will be used to determine the remaining pages.
+
+    :type page_size: :class:`int <python:int>`
+
+    :param max_workers: The maximum number of pages to retrieve concurrently. Defaults
+      to ``8``.
+    :type max_workers: :class:`int <python:int>`
+
+    .. note::
+
+      All other keyword arguments are passed to
+      :meth:`JIRA.search_issues() <jira:jira.client.JIRA.search_issues>`.
+
+    :returns: The collection of issues matching ``jql``.
+    :rtype: :class:`list <python:list>` of :class:`Issue <jira:jira.resources.Issue>`
+
+    :raises JIRAError: if the JIRA API returns an error
+    """
+    page_size = validators.integer(page_size, minimum = 1)
+    max_workers = validators.integer(max_workers, minimum = 1)
+
+    first_page = jira_client.search_issues(jql,
+                                           startAt = 0,
+                                           maxResults = page_size,
+                                           **kwargs)
+    issues = [x for x in first_page]
+
+    total = getattr(first_page, 'total', None) or len(issues)
+    if not issues or total <= len(issues):
+        return issues
+
+    page_size = min(page_size, getattr(first_page, 'maxResults', None) or len(issues))
+    start_positions = range(len(issues), total, page_size)
+
+    bypass_cache = is_response_cache_bypassed()
+
+    def get_page(start_at):
+        with bypass_response_cache(bypass_cache):
+            return jira_client.search_issues(jql,
+                                             startAt = start_at,
+                                             maxResults = page_size,
+                                             **kwargs)
+
+    with ThreadPoolExecutor(max_workers = min(max_workers,
+                                              len(start_positions))) as executor:
+        for page in executor.map(get_page, start_positions):
+            issues.extend(page)
+
+    return issues
+
+
+def get_jira_fields(fields = None, custom_fields = None):
+    """Return the JIRA fields to request when searching for issues that will be
+    parsed using :func:`parse_jira_issue() <highcharts_gantt.utility_functions.parse_jira_issue>`.
+
+    :param fields: The names of additional JIRA fields to request, besides those
+      listed in ``JIRA_ISSUE_FIELDS`` (i.e. those that are needed to assemble a data
+      point). If ``'*all'``, all fields will be requested. Defaults to
+      :obj:`None <python:None>`.
+    :type fields: iterable of :class:`str <python:str>`, ``'*all'``, or
+      :obj:`None <python:None>`
+
+    :param custom_fields: The names of the JIRA fields that will be included in the
+      data points' ``custom`` property. If ``'*all'``, all fields will be requested.
+      Defaults to :obj:`None <python:None>`.
+    :type custom_fields: iterable of :class:`str <python:str>`, ``'*all'``, or
+      :obj:`None <python:None>`
+
+    :returns: A comma-delimited list of JIRA field names (or ``'*all'``), suitable
+      for use as the ``fields`` argument to
+      :meth:`JIRA.search_issues() <jira:jira.client.JIRA.search_issues>`.
+    :rtype: :class:`str <python:str>`
+    """
+    if fields == '*all' or custom_fields == '*all':
+        return '*all'
+
+    requested_fields = [x for x in JIRA_ISSUE_FIELDS]
+    for value in [fields, custom_fields]:
+        if isinstance(value, str):
+            value = [value]
+        value = validators.iterable(value,
+                                    allow_empty = True,
+                                    forbid_literals = (str, bytes, dict)) or []
+        requested_fields.extend(x for x in value if x not in requested_fields)
+
+    return ','.join(requested_fields)
+
+
+def get_jira_client(server = None,
+                    username = None,
+                    password_or_token = None,
+                    oauth_dict = None,
+                    client_kwargs = None,
+                    jira_client = None):
+    """Return a fully-configured and authenticated JIRA API client.
+
+    If ``jira_client`` is supplied, it is validated and returned as-is. Otherwise, a new
+    client is instantiated using the authentication details supplied (or the
+    ``HIGHCHARTS_JIRA_SERVER``, ``HIGHCHARTS_JIRA_USERNAME``, and
+    ``HIGHCHARTS_JIRA_TOKEN`` environment variables).
+
+    :param server: The URL of the JIRA instance to connect to. Defaults to
+      :obj:`None <python:None>`, which looks for a value in the
+      ``HIGHCHARTS_JIRA_SERVER`` environment variable and falls back to
+      ``'https://jira.atlassian.com'``.
+    :type server: :class:`str <python:str>` or :obj:`None <python:None>`
+
+    :param username: The username to use when authenticating using either ``basic``
+      or ``token`` authentication. Defaults to :obj:`None <python:None>`.
+    :type username: :class:`str <python:str>` or :obj:`None <python:None>`
+
+    :param password_or_token: The password or access token to use when
+      authenticating. Defaults to :obj:`None <python:None>`.
+    :type password_or_token: :class:`str <python:str>` or :obj:`None <python:None>`
+
+    :param oauth_dict: A :class:`dict <python:dict>` of key/value pairs providing
+      configuration of the Oauth2 authentication details. Defaults to
+      :obj:`None <python:None>`.
+    :type oauth_dict: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+    :param client_kwargs: An optional :class:`dict <python:dict>` providing keyword
+      arguments to use when instantiating the JIRA client.
+    :type client_kwargs: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+    :param jira_client: A fully-configured and fully-authenticated JIRA API client.
+      Defaults to :obj:`None <python:None>`.
+    :type jira_client: :class:`jira.client.JIRA <jira:jira.client.JIRA>` or
+      :obj:`None <python:None>`
+
+    :returns: An authenticated JIRA API client.
+    :rtype: :class:`jira.client.JIRA <jira:jira.client.JIRA>`
+
+    :raises HighchartsDependencyError: if the `jira <https://jira.readthedocs.io/>`__
+      Python library is not available in the runtime environment.
+    :raises JIRAAuthenticationError: if no authentication details are provided or if
+      the authentication process fails
+    :raises HighchartsValueError: if ``jira_client`` is not a JIRA client
+    """
+    if not HAS_JIRA:
+        raise errors.HighchartsDependencyError('get_jira_client() depends on the jira '
+                                               'Python library. This library was not '
+                                               'found in the runtime environment. '
+                                               'Please install and try again.')
+
+    if not jira_client:
+        client_kwargs = validators.dict(client_kwargs, allow_empty = True) or {}
+        if not server:
+            server = os.getenv('HIGHCHARTS_JIRA_SERVER',
+                               client_kwargs.get('server', 'https://jira.atlassian.com'))
+
+        client_kwargs['server'] = validators.url(server, allow_special_ips = True)
+
+        username = validators.string(username, allow_empty = True) \
+            or os.getenv('HIGHCHARTS_JIRA_USERNAME', None)
+        password_or_token = validators.string(password_or_token, allow_empty = True) \
+            or os.getenv('HIGHCHARTS_JIRA_TOKEN', None)
+
+        use_basic = oauth_dict is None and username is not None
+        use_token = oauth_dict is None and username is None
+
+        if use_basic:
+            client_kwargs['basic_auth'] = (username, password_or_token)
+        elif use_token:
+            client_kwargs['token_auth'] = password_or_token
+        elif oauth_dict is not None:
+            client_kwargs['oauth'] = validators.dict(oauth_dict,
+                                                     allow_empty = False)
+        else:
+            raise errors.JIRAAuthenticationError('no authentication details '
+                                                 'provided')
+        try:
+            jira_client = jira.JIRA(**client_kwargs)
+        except jira.JIRAError as error:
+            if error.status_code == 401:
+                raise errors.JIRAAuthenticationError('JIRA failed to authenticate')
+            else:
+                raise error
+    else:
+        if not isinstance(jira_client, jira.client.JIRA):
+            raise errors.HighchartsValueError(f'jira_client must be a valid '
+                                              f'jira.client.JIRA instance. Was: '
+                                              f'{jira_client.__class__.__name__}')
+
+    if not jira_client._session:
+        raise errors.JIRAAuthenticationError('jira_client is not authenticated')
+
+    return install_response_cache(jira_client, 'jira')
+
+
+def get_async_executor():
+    """Return the thread pool shared by the library's ``async`` loaders (e.g.
+    :meth:`Chart.from_jira_async() <highcharts_gantt.chart.Chart.from_jira_async>`).
+
+    The pool is created on first use and re-used for the lifetime of the process, so
+    that concurrent ``async`` loads share a bounded set of worker threads rather than
+    each occupying a thread of the event loop's default executor.
+
+    :rtype: :class:`ThreadPoolExecutor <python:concurrent.futures.ThreadPoolExecutor>`
+    """
+    global _ASYNC_EXECUTOR
+
+    with _ASYNC_EXECUTOR_LOCK:
+        if _ASYNC_EXECUTOR is None:
+            _ASYNC_EXECUTOR = ThreadPoolExecutor(thread_name_prefix = 'highcharts_gantt')
+
+    return _ASYNC_EXECUTOR
+
+
+async def run_async(func, *args, **kwargs):
+    """Execute ``func`` with ``args`` and ``kwargs`` in the shared
+    :func:`async executor <highcharts_gantt.utility_functions.get_async_executor>`
+    and await its result without blocking the running event loop.
+
+    :param func: The (synchronous) callable to execute.
+    :type func: Callable
+
+    :returns: The value returned by ``func``.
+    """
+    loop = asyncio.get_running_loop()
+
+    return await loop.run_in_executor(get_async_executor(),
+                                      functools.partial(func, *args, **kwargs))
+
+
+@contextmanager
+def paused_gc():
+    """Context manager which disables the cyclic garbage collector for the duration of
+    its block, re-enabling it afterwards (if it was enabled to begin with).
+
+    Used when building large indexes over a series' data points: allocating several
+    containers per data point would otherwise trigger repeated collection passes over
+    the (large, and still reachable) collection of data points being indexed.
+
+    .. code-block:: python
+
+      with paused_gc():
+          index = [[] for data_point in my_series.data]
+
+    """
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def get_schedule_timestamps(data):
+    """Return the ``(start, end, milestone)`` of each data point in ``data``, with
+    ``start`` and ``end`` expressed as POSIX timestamps in seconds (or
+    :obj:`None <python:None>` if not set).
+
+    Data points held in a
+    :class:`GanttDataColumns <highcharts_gantt.options.series.data.gantt.GanttDataColumns>`
+    collection are read directly from its columns, without creating
+    :class:`GanttData <highcharts_gantt.options.series.data.gantt.GanttData>` views.
+
+    :param data: The data points, as an iterable of
+      :class:`GanttData <highcharts_gantt.options.series.data.gantt.GanttData>`
+      instances or a
+      :class:`GanttDataColumns <highcharts_gantt.options.series.data.gantt.GanttDataColumns>`
+      collection.
+
+    :rtype: :class:`list <python:list>` of :class:`tuple <python:tuple>`
+    """
+    if checkers.is_type(data, 'GanttDataColumns'):
+        missing = data._MISSING_TIMESTAMP
+        starts = data._start
+        ends = data._end
+
+        return [(starts[index] / 1000 if starts[index] != missing else None,
+                 ends[index] / 1000 if ends[index] != missing else None,
+                 False) if view is None else
+                (view.start.timestamp() if view.start else None,
+                 view.end.timestamp() if view.end else None,
+                 view.milestone)
+                for index, view in enumerate(data._views)]
 
-    return data_point_kwargs
\ No newline at end of file
+    return [(x.start.timestamp() if x.start else None,
+             x.end.timestamp() if x.end else None,
+             x.milestone)
+            for x in data or []]
@@ -107,3 +107,10 @@ def test_to_dict(kwargs, error):
 ])
 def test_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls, input_files, filename, as_file, error)
+
+
+@pytest.mark.parametrize('kwargs, error', STANDARD_PARAMS)
+def test_slots(kwargs, error):
+    result = cls(**kwargs)
+
+    assert vars(result) == {}
@@ -6,7 +6,8 @@ import datetime
 from json.decoder import JSONDecodeError
 from validator_collection import validators
 
-from highcharts_gantt.options.series.data.gantt import ProgressIndicator as cls, GanttData as cls2
+from highcharts_gantt.options.series.data.gantt import ProgressIndicator as cls, GanttData as cls2, \
+    GanttDataColumns as cls3
 from highcharts_gantt import errors
 from tests.fixtures import input_files, check_input_file, to_camelCase, to_js_dict, \
     Class__init__, Class__to_untrimmed_dict, Class_from_dict, Class_to_dict, \
@@ -239,4 +240,138 @@ def test_GanttData_from_monday(kwargs, error):
                 assert len(result.dependency) == len(task['dependencies'])
     else:
         with pytest.raises(error):
-            result = cls2.from_monday(**kwargs)
\ No newline at end of file
+            result = cls2.from_monday(**kwargs)
+
+def test_GanttDataColumns():
+    start = datetime.datetime(2024, 1, 1, tzinfo = datetime.timezone.utc)
+    points = [{
+        'id': f'task-{x}',
+        'name': f'Task {x}',
+        'parent': 'task-0' if x else None,
+        'start': start + datetime.timedelta(days = x),
+        'end': start + datetime.timedelta(days = x + 2),
+        'completed': 0.25,
+        'dependency': f'task-{x - 1}' if x > 1 else None
+    } for x in range(5)]
+
+    result = cls3.from_array(points)
+    expected = [cls2.from_dict(x) for x in points]
+
+    assert len(result) == 5
+    assert all(x is None for x in result._views)
+    assert [x.to_js_literal() for x in result.to_rows()] == \
+        [x.to_js_literal() for x in expected]
+    assert [x.to_dict() for x in result.to_rows()] == [x.to_dict() for x in expected]
+
+    assert result[2].start == points[2]['start']
+    result[2].name = 'Renamed'
+    assert "name: 'Renamed'" in result.to_rows()[2].to_js_literal()
+
+    del result[0]
+    result.insert(0, {'id': 'custom', 'custom': {'a': 1}})
+    assert len(result) == 5
+    assert isinstance(result._views[0], cls2)
+    assert result[0].custom == {'a': 1}
+
+
+def test_GanttDataColumns_length_mismatch():
+    with pytest.raises(errors.HighchartsValueError):
+        result = cls3(id = ['a', 'b'], name = ['Task A'])
+
+
+@pytest.mark.parametrize('value, keys, error', [
+    ([{
+        'id': 'a',
+        'name': 'Task A',
+        'start': datetime.datetime(2024, 1, 1, tzinfo = datetime.timezone.utc),
+        'end': datetime.datetime(2024, 1, 3, tzinfo = datetime.timezone.utc),
+        'completed': 0.5,
+        'dependency': ['b'],
+        'custom': {'owner': 'me'},
+        'className': 'task'
+    }, {
+        'id': 'b',
+        'start': '2024-01-01',
+        'completed': {'amount': 0.25}
+    }], None, None),
+    ([('a', 'Task A', datetime.datetime(2024, 1, 1, tzinfo = datetime.timezone.utc))],
+     ['id', 'name', 'start'], None),
+
+    ([('a', 'Task A')], None, errors.HighchartsValueError),
+    ([('a', 'Task A')], ['id', 'invalid-key'], errors.HighchartsValueError),
+    ([123], None, errors.HighchartsValueError),
+])
+def test_GanttData_from_array_trusted(value, keys, error):
+    if not error:
+        result = cls2.from_array(value, trusted = True, keys = keys)
+        if keys:
+            value = [dict(zip(keys, x)) for x in value]
+        expected = cls2.from_array(value)
+
+        assert len(result) == len(expected)
+        for trusted, validated in zip(result, expected):
+            assert isinstance(trusted, cls2) is True
+            assert trusted.to_js_literal() == validated.to_js_literal()
+            assert trusted.to_dict() == validated.to_dict()
+    else:
+        with pytest.raises(error):
+            result = cls2.from_array(value, trusted = True, keys = keys)
+
+
+@pytest.mark.parametrize('kwargs, error', STANDARD_PARAMS)
+def test_ProgressIndicator_slots(kwargs, error):
+    result = cls(**kwargs)
+
+    assert vars(result) == {}
+
+
+def test_GanttData_slots():
+    result = cls2(id = 'task-1',
+                  name = 'Task 1',
+                  start = '2024-01-01',
+                  completed = {'amount': 0.5},
+                  dependency = [{'to': 'task-0'}],
+                  custom = {'owner': 'me'})
+    trusted = cls2.from_array([{'id': 'task-2', 'custom': {'owner': 'me'}}],
+                              trusted = True)[0]
+
+    assert vars(result) == {}
+    assert vars(trusted) == {}
+    assert vars(result.completed) == {}
+    assert vars(result.dependency[0]) == {}
+
+
+def test_GanttData_cached_fragments():
+    result = cls2(id = 'task-1',
+                  name = 'Task 1',
+                  start = '2024-01-01',
+                  completed = {'amount': 0.5},
+                  dependency = ['task-0'])
+
+    as_str = result.to_js_literal()
+    as_json = result.to_json()
+    assert result.to_js_literal() is as_str
+    assert result.to_json() is as_json
+
+    result.name = 'Renamed'
+    assert result.to_js_literal() is not as_str
+    assert 'Renamed' in result.to_js_literal()
+    assert result.to_js_literal() is result.to_js_literal()
+
+    result.completed.amount = 0.75
+    assert '0.75' in result.to_js_literal()
+    assert '0.75' in str(result.to_json())
+
+    result.dependency.append('task-2')
+    assert 'task-2' in result.to_js_literal()
+
+
+def test_GanttData_cached_fragments_untracked():
+    result = cls2(id = 'task-1', custom = {'owner': 'me'})
+
+    as_str = result.to_js_literal()
+    assert result.to_js_literal() == as_str
+    assert result._fragments is None
+
+    result.custom['owner'] = 'you'
+    assert 'you' in result.to_js_literal()
@@ -1,5 +1,7 @@
 """Tests for ``highcharts.no_data``."""
 import os
+import datetime
+
 import pytest
 
 from json.decoder import JSONDecodeError
@@ -658,4 +660,412 @@ def test_GanttSeries_from_jira(kwargs, expected_data_points, error):
             result = cls.from_jira(**kwargs)
     else:
         with pytest.raises(error):
-            result = cls.from_jira(**kwargs)
\ No newline at end of file
+            result = cls.from_jira(**kwargs)
+
+class FakeJIRA(object):
+    """Stand-in for an authenticated JIRA client which serves a fixed set of issues."""
+
+    def __init__(self, issues):
+        self._session = True
+        self.issues = issues
+        self.current_issues = issues
+        self.queries = []
+
+    def search_issues(self, jql, startAt = 0, maxResults = 50, **kwargs):
+        from jira.client import ResultList
+
+        self.queries.append(jql)
+        if kwargs.get('fields') == 'key':
+            issues = self.current_issues
+        else:
+            issues = self.issues
+
+        return ResultList(issues[startAt:startAt + maxResults],
+                          _startAt = startAt,
+                          _maxResults = maxResults,
+                          _total = len(issues))
+
+
+def make_jira_issue(key, summary = 'Task', status = 'In Progress'):
+    from jira.resources import Issue
+
+    return Issue({}, None, raw = {
+        'key': key,
+        'fields': {
+            'summary': summary,
+            'description': None,
+            'status': {'name': status},
+            'resolution': None,
+            'duedate': '2024-01-10',
+            'progress': {'percent': 50},
+            'worklog': {'worklogs': [{'started': '2024-01-01T00:00:00.000+0000'}]},
+            'issuelinks': []
+        }
+    })
+
+
+@pytest.mark.parametrize('jql, expected', [
+    ('project = ABC', '(project = ABC) AND updated >= -6m'),
+    ('project = ABC ORDER BY rank', '(project = ABC) AND updated >= -6m ORDER BY rank'),
+])
+def test_GanttSeries_get_jira_delta_jql(jql, expected):
+    now = datetime.datetime(2024, 1, 1, 12, 0, 0, tzinfo = datetime.timezone.utc)
+    since = now - datetime.timedelta(minutes = 4, seconds = 30)
+
+    assert cls._get_jira_delta_jql(jql, since = since, now = now) == expected
+
+
+@pytest.mark.parametrize('detect_removals, expected_ids', [
+    (False, ['ABC-1', 'ABC-3', 'ABC-4']),
+    (True, ['ABC-3', 'ABC-4']),
+])
+def test_GanttSeries_sync_from_jira(monkeypatch, detect_removals, expected_ids):
+    from highcharts_gantt.options.series import gantt
+
+    monkeypatch.setattr(gantt, 'get_jira_client', lambda **kwargs: kwargs['jira_client'])
+
+    client = FakeJIRA([make_jira_issue('ABC-1'),
+                       make_jira_issue('ABC-2'),
+                       make_jira_issue('ABC-3')])
+    series = cls()
+    series.sync_from_jira('ABC', jira_client = client)
+    assert [x.id for x in series.data] == ['ABC-1', 'ABC-2', 'ABC-3']
+    assert series.jira_synced_at is not None
+
+    client.issues = [make_jira_issue('ABC-2', status = 'Duplicate'),
+                     make_jira_issue('ABC-3', summary = 'Renamed'),
+                     make_jira_issue('ABC-4')]
+    client.current_issues = client.issues[1:]
+
+    series.sync_from_jira('ABC', jira_client = client, detect_removals = detect_removals)
+
+    assert 'updated >=' in client.queries[1]
+    assert [x.id for x in series.data] == expected_ids
+    assert [x.name for x in series.data if x.id == 'ABC-3'] == ['Renamed']
+
+
+class FakeAsanaEvents(object):
+    """Stand-in for the Asana events resource which replays queued events."""
+
+    def __init__(self):
+        self.events = []
+        self.syncs = 0
+
+    def get(self, params):
+        import asana
+
+        class Response(object):
+            def json(response):
+                return {'sync': f'sync-{self.syncs}'}
+
+        self.syncs += 1
+        if not params.get('sync'):
+            raise asana.error.InvalidTokenError(Response())
+
+        events, self.events = self.events, []
+
+        return {'data': events, 'sync': f'sync-{self.syncs}', 'has_more': False}
+
+
+class FakeAsanaTasks(object):
+    """Stand-in for the Asana tasks resource which serves a fixed set of tasks."""
+
+    def __init__(self, tasks):
+        self.tasks = tasks
+        self.requests = []
+
+    def get_tasks_for_project(self, project_gid, params = None, **kwargs):
+        self.requests.append(('project', project_gid))
+        return iter(self.tasks)
+
+    def get_tasks(self, params = None, **kwargs):
+        self.requests.append(('modified_since', params['modified_since']))
+        return iter([x for x in self.tasks
+                     if x.get('modified', False)
+                     and x.get('modified_at', params['modified_since']) >= \
+                     params['modified_since']])
+
+    def get_task(self, task_gid, params = None, **kwargs):
+        import asana
+
+        class Response(object):
+            def json(response):
+                return {'errors': [{'message': 'Not found'}]}
+
+        self.requests.append(('task', task_gid))
+        for task in self.tasks:
+            if task['gid'] == task_gid:
+                return task
+
+        raise asana.error.NotFoundError(Response())
+
+
+def make_asana_task(gid, name = 'Task', modified = False):
+    return {
+        'gid': gid,
+        'name': name,
+        'start_on': '2024-01-01',
+        'due_on': '2024-01-10',
+        'completed': False,
+        'dependencies': [],
+        'modified': modified
+    }
+
+
+def test_GanttSeries_sync_from_asana():
+    import asana
+
+    client = asana.Client.access_token('fake-token')
+    client.events = FakeAsanaEvents()
+    client.tasks = FakeAsanaTasks([make_asana_task('1'),
+                                   make_asana_task('2'),
+                                   make_asana_task('3')])
+
+    series = cls()
+    series.sync_from_asana('123', asana_client = client)
+    assert [x.id for x in series.data] == ['1', '2', '3']
+    assert series.asana_sync_token == 'sync-1'
+    assert client.tasks.requests == [('project', '123')]
+
+    client.tasks.tasks = [make_asana_task('1'),
+                          make_asana_task('3', name = 'Renamed', modified = True),
+                          make_asana_task('4', modified = True)]
+    client.events.events = [
+        {'action': 'changed', 'resource': {'gid': '3', 'resource_type': 'task'}},
+        {'action': 'added', 'resource': {'gid': '4', 'resource_type': 'task'},
+         'parent': {'gid': '123', 'resource_type': 'project'}},
+        {'action': 'deleted', 'resource': {'gid': '2', 'resource_type': 'task'}},
+        {'action': 'changed', 'resource': {'gid': '123', 'resource_type': 'project'}},
+    ]
+    series.sync_from_asana('123', asana_client = client)
+
+    assert [x.id for x in series.data] == ['1', '3', '4']
+    assert series.data[1].name == 'Renamed'
+    assert series.asana_sync_token == 'sync-2'
+    assert len(client.tasks.requests) == 2
+    assert client.tasks.requests[1][0] == 'modified_since'
+
+
+def test_GanttSeries_sync_from_asana_clock_skew():
+    import asana
+    import datetime
+
+    client = asana.Client.access_token('fake-token')
+    client.events = FakeAsanaEvents()
+    client.tasks = FakeAsanaTasks([make_asana_task('1'),
+                                   make_asana_task('2'),
+                                   make_asana_task('3')])
+
+    series = cls()
+    series.sync_from_asana('123', asana_client = client)
+
+    # The local clock runs 10 minutes ahead of Asana's, so changes made just before
+    # the previous sync carry a modified_at that precedes the padded watermark.
+    now = datetime.datetime.now(tz = datetime.timezone.utc)
+    series.asana_synced_at = now + datetime.timedelta(minutes = 10)
+    modified_at = now.isoformat()
+
+    renamed = make_asana_task('3', name = 'Renamed', modified = True)
+    renamed['modified_at'] = modified_at
+    moved = make_asana_task('2', modified = True)
+    moved['modified_at'] = modified_at
+    moved['memberships'] = [{'project': {'gid': '999'}, 'section': None}]
+    client.tasks.tasks = [make_asana_task('1'), moved, renamed]
+    client.events.events = [
+        {'action': 'changed', 'resource': {'gid': '2', 'resource_type': 'task'}},
+        {'action': 'changed', 'resource': {'gid': '3', 'resource_type': 'task'}},
+    ]
+    series.sync_from_asana('123', asana_client = client)
+
+    assert [x.id for x in series.data] == ['1', '3']
+    assert series.data[1].name == 'Renamed'
+    assert sorted(x for x in client.tasks.requests if x[0] == 'task') == \
+        [('task', '2'), ('task', '3')]
+
+
+def test_GanttSeries_from_jira_async(monkeypatch):
+    import asyncio
+    from highcharts_gantt.options.series import gantt
+
+    monkeypatch.setattr(gantt, 'get_jira_client', lambda **kwargs: kwargs['jira_client'])
+
+    client = FakeJIRA([make_jira_issue('ABC-1'), make_jira_issue('ABC-2')])
+
+    expected = cls.from_jira('ABC', jira_client = client)
+    result = asyncio.run(cls.from_jira_async('ABC', jira_client = client))
+
+    assert isinstance(result, cls) is True
+    assert result.to_js_literal() == expected.to_js_literal()
+
+
+@pytest.mark.parametrize('kwargs, expected_custom', [
+    ({}, '*raw'),
+    ({'custom_fields': '*all'}, '*raw'),
+    ({'custom_fields': None}, {'key': 'ABC-1'}),
+    ({'custom_fields': ['status']},
+     {'key': 'ABC-1', 'fields': {'status': {'name': 'In Progress'}}}),
+])
+def test_GanttSeries_from_jira_custom_fields(monkeypatch, kwargs, expected_custom):
+    from highcharts_gantt.options.series import gantt
+
+    monkeypatch.setattr(gantt, 'get_jira_client', lambda **kwargs: kwargs['jira_client'])
+
+    requested_fields = []
+    client = FakeJIRA([make_jira_issue('ABC-1')])
+    search_issues = client.search_issues
+
+    def search_issues_with_fields(jql, **kwargs):
+        requested_fields.append(kwargs.get('fields'))
+        return search_issues(jql, **kwargs)
+
+    client.search_issues = search_issues_with_fields
+
+    result = cls.from_jira('ABC', jira_client = client, **kwargs)
+
+    if expected_custom == '*raw':
+        assert requested_fields[0] == '*all'
+        assert result.data[0].custom.to_dict() == client.issues[0].raw
+    else:
+        assert requested_fields[0] != '*all'
+        assert 'worklog' in requested_fields[0].split(',')
+        assert result.data[0].custom.to_dict() == expected_custom
+
+
+def test_GanttSeries_trusted_data():
+    data = [{
+        'id': 'task-1',
+        'name': 'Task 1',
+        'completed': 0.5
+    }]
+    validated = cls(data = data)
+    result = cls(trusted_data = True, data = data)
+
+    assert result.trusted_data is True
+    assert result.data[0].completed == 0.5
+    assert result.to_js_literal() == validated.to_js_literal()
+    assert 'trustedData' not in result.to_dict()
+
+
+def test_GanttSeries_roll_up():
+    def day(value):
+        return datetime.datetime(2024, 1, value, tzinfo = datetime.timezone.utc)
+
+    series = cls(data = [
+        {'id': 'project'},
+        {'id': 'phase', 'parent': 'project', 'completed': {'amount': 0, 'fill': '#ccc'}},
+        {'id': 'a', 'parent': 'phase', 'start': day(1), 'end': day(3), 'completed': 1},
+        {'id': 'b', 'parent': 'phase', 'start': day(3), 'end': day(5)},
+        {'id': 'c', 'parent': 'project', 'start': day(2), 'end': day(10),
+         'completed': 0.5},
+    ])
+
+    assert series.roll_up() == ['phase', 'project']
+
+    project, phase = series.data[0], series.data[1]
+    assert project.start == day(1)
+    assert project.end == day(10)
+    assert project.completed == 0.5
+    assert phase.end == day(5)
+    assert phase.completed.amount == 0.5
+    assert phase.completed.fill == '#ccc'
+
+    series.data[3].completed = 1
+    assert series.roll_up(ids = 'b') == ['phase', 'project']
+    assert phase.completed.amount == 1
+    assert project.completed == pytest.approx(2 / 3)
+
+    assert series.roll_up(ids = 'c') == ['project']
+
+    series.data = [{'id': 'a', 'parent': 'b'}, {'id': 'b', 'parent': 'a'}]
+    with pytest.raises(errors.GanttDependencyError):
+        series.roll_up()
+
+
+def test_GanttSeries_update_points():
+    series = cls(data = [{'id': f'task-{x}', 'parent': 'task-0' if x else None}
+                         for x in range(5)])
+    graph = series.dependency_graph
+
+    result = series.update_points({'task-1': {'completed': 0.5},
+                                   'task-2': {'className': 'late'}})
+    assert result == ['task-1', 'task-2']
+    assert series.data[1].completed == 0.5
+    assert series.data[2].class_name == 'late'
+    assert series.dependency_graph is graph
+
+    result = series.update_points([{'id': 'task-3', 'parent': 'task-1'}])
+    assert result == ['task-3']
+    assert series.dependency_graph.get_successors('task-1') == []
+    assert series.dependency_graph.children[1] == [3]
+
+    series.update_points({'task-4': {'id': 'renamed'}})
+    assert series.update_points({'renamed': {'name': 'Renamed'}}) == ['renamed']
+
+    assert series.update_points({'missing': {'name': 'x'}}, ignore_missing = True) == []
+    with pytest.raises(errors.HighchartsValueError):
+        series.update_points({'missing': {'name': 'x'}})
+    with pytest.raises(errors.HighchartsValueError):
+        series.update_points({'task-1': {'not_a_property': 1}})
+
+
+def test_GanttSeries_upsert_remove_points():
+    series = cls(data = [{'id': f'task-{x}'} for x in range(5)])
+
+    assert series.remove_points(['task-1', 'task-3']) == ['task-1', 'task-3']
+    assert [x.id for x in series.data] == ['task-0', 'task-2', 'task-4']
+
+    assert series.upsert_points([{'id': 'task-2', 'name': 'Replaced'},
+                                 {'id': 'task-5'}]) == ['task-5']
+    assert [x.id for x in series.data] == ['task-0', 'task-2', 'task-4', 'task-5']
+    assert series.data[1].name == 'Replaced'
+
+    series.update_points({'task-5': {'name': 'Appended'}})
+    assert series.data[3].name == 'Appended'
+
+    assert series.remove_points('missing', ignore_missing = True) == []
+    with pytest.raises(errors.HighchartsValueError):
+        series.remove_points('missing')
+
+    series.remove_points(['task-0', 'task-2', 'task-4', 'task-5'])
+    assert series.data is None
+
+
+def test_GanttSeries_compact_data():
+    from highcharts_gantt.options.series.data.gantt import GanttDataColumns
+
+    data = [
+        {'id': 'a', 'name': 'Task A', 'start': '2024-01-01', 'end': '2024-01-05'},
+        {'id': 'b', 'name': 'Task B', 'start': '2024-01-05', 'end': '2024-01-08',
+         'dependency': [{'to': 'a'}], 'completed': 0.5},
+        {'id': 'c', 'name': 'Task C', 'start': '2024-01-05', 'end': '2024-01-08',
+         'color': '#ff0000'},
+        {'id': 'd', 'start': '2024-01-08', 'completed': {'amount': 0.5, 'fill': '#ccc'}},
+        {'id': 'e', 'name': 'Task E', 'start': '2024-01-08', 'end': '2024-01-09',
+         'completed': 1},
+    ]
+    validated = cls(data = data)
+    result = cls(compact_data = True, data = data)
+
+    assert result.compact_data is True
+    as_dict = result.to_dict()
+    assert 'compactData' not in as_dict
+    assert as_dict['keys'] == ['id', 'name', 'start', 'end', 'completed', 'dependency']
+    assert as_dict['data'][0] == ['a', 'Task A', 1704067200.0, 1704412800.0]
+    assert as_dict['data'][1] == ['b', 'Task B', 1704412800.0, 1704672000.0, 0.5, ['a']]
+    assert as_dict['data'][2] == validated.data[2].to_dict()
+    assert as_dict['data'][3] == validated.data[3].to_dict()
+    assert as_dict['data'][4] == ['e', 'Task E', 1704672000.0, 1704758400.0, 1]
+    assert b'"keys":' in result.to_json() or '"keys":' in result.to_json()
+    assert "keys: ['id'" in result.to_js_literal()
+
+    reloaded = cls.from_dict(as_dict)
+    assert reloaded.data[1].dependency == ['a']
+    assert [x.to_dict() for x in reloaded.data if x.id != 'b'] == \
+        [x.to_dict() for x in validated.data if x.id != 'b']
+
+    columns = cls(compact_data = True,
+                  data = GanttDataColumns(id = ['a', 'b'],
+                                          start = [1704067200000, 1704412800000]))
+    assert columns.to_dict()['data'] == [['a', 1704067200.0], ['b', 1704412800.0]]
+
+    assert 'keys' not in cls(compact_data = True, data = [data[2]]).to_dict()
@@ -0,0 +1,35 @@
+"""Tests for ``highcharts.series_generator``."""
+
+import pytest
+
+from highcharts_gantt.options.series import series_generator
+from highcharts_gantt.options.series.area import LineSeries
+from highcharts_gantt.options.series.gantt import GanttSeries
+from highcharts_gantt import errors
+
+
+@pytest.mark.parametrize('value, default_type, expected_cls, error', [
+    ("{type: 'gantt', name: 'Plan', data: [{id: 'a', start: 1, end: 2}]}",
+     None, GanttSeries, None),
+    ("var series = {type: 'line', data: [{y: 1}, {y: 2}]};",
+     None, LineSeries, None),
+    ("{name: 'Plan', data: [{id: 'a', start: 1, end: 2}]}",
+     'gantt', GanttSeries, None),
+    ('{"type": "line", "data": [{"y": 1}, {"y": 2}]}',
+     None, LineSeries, None),
+    ({'type': 'gantt', 'data': [{'id': 'a', 'start': 1, 'end': 2}]},
+     None, GanttSeries, None),
+
+    ("{name: 'Plan', data: [{y: 1}]}", None, None, errors.HighchartsValueError),
+    ("{type: 'not-a-series', data: [{y: 1}]}", None, None, errors.HighchartsValueError),
+])
+def test_create_series_obj(value, default_type, expected_cls, error):
+    if not error:
+        result = series_generator.create_series_obj(value, default_type = default_type)
+        assert isinstance(result, expected_cls) is True
+        if isinstance(value, str) and 'data:' in value:
+            expected = expected_cls.from_js_literal(value)
+            assert result.to_js_literal() == expected.to_js_literal()
+    else:
+        with pytest.raises(error):
+            series_generator.create_series_obj(value, default_type = default_type)
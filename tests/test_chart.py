@@ -167,4 +167,144 @@ def test_from_jira(kwargs, expected_data_points, error):
             result = cls.from_jira(**kwargs)
     else:
         with pytest.raises(error):
-            result = cls.from_jira(**kwargs)
\ No newline at end of file
+            result = cls.from_jira(**kwargs)
+
+@pytest.mark.parametrize('filename, as_file, error', [
+    ('chart_obj/01-input.js', False, None),
+    ('chart_obj/01-input.js', True, None),
+    ('chart_obj/01-input.js', False, errors.HighchartsValueError),
+])
+def test_write_js_literal(input_files, tmp_path, filename, as_file, error):
+    import io
+
+    input_file = check_input_file(input_files, filename)
+    with open(input_file, 'r') as file_:
+        instance = cls.from_js_literal(file_.read())
+
+    if error:
+        with pytest.raises(error):
+            instance.write_js_literal(None)
+    elif as_file:
+        output_file = tmp_path / 'chart.js'
+        with open(output_file, 'w', encoding = 'utf-8') as file_:
+            instance.write_js_literal(file_)
+        with open(output_file, 'r', encoding = 'utf-8') as file_:
+            assert file_.read() == instance.to_js_literal()
+    else:
+        stream = io.StringIO()
+        instance.write_js_literal(stream)
+        assert stream.getvalue() == instance.to_js_literal()
+
+
+@pytest.mark.parametrize('merge, expected_series, expected_data_points', [
+    (False, 2, [2, 3]),
+    (True, 1, [5]),
+])
+def test_from_portfolio(monkeypatch, merge, expected_series, expected_data_points):
+    from highcharts_gantt.options.series.gantt import GanttSeries
+
+    def from_jira(project_key, series_kwargs = None, **kwargs):
+        if project_key == 'BAD':
+            raise errors.JIRAProjectNotFoundError('not found')
+        points = {'ABC': 2, 'XYZ': 3}[project_key]
+        series = GanttSeries(**(series_kwargs or {}))
+        series.data = [{'id': f'{project_key}-{x}',
+                        'start': '2024-01-01',
+                        'end': '2024-01-10'}
+                       for x in range(points)]
+
+        return series
+
+    monkeypatch.setattr(GanttSeries, 'from_jira', from_jira)
+
+    result = cls.from_portfolio([{'type': 'jira', 'project_key': 'ABC'},
+                                 {'type': 'jira', 'project_key': 'BAD'},
+                                 {'type': 'jira', 'project_key': 'XYZ'}],
+                                merge = merge,
+                                max_workers = 2)
+
+    assert result.is_gantt_chart is True
+    assert len(result.options.series) == expected_series
+    assert [len(x.data) for x in result.options.series] == expected_data_points
+    assert [x['data_points'] for x in result.portfolio_report] == [2, 0, 3]
+    assert isinstance(result.portfolio_report[1]['error'],
+                      errors.JIRAProjectNotFoundError) is True
+    assert all(x['elapsed'] is not None for x in result.portfolio_report)
+    if not merge:
+        assert [x.name for x in result.options.series] == ['ABC', 'XYZ']
+
+    with pytest.raises(errors.JIRAProjectNotFoundError):
+        cls.from_portfolio([{'type': 'jira', 'project_key': 'BAD'}],
+                           raise_on_error = True)
+
+    with pytest.raises(errors.HighchartsValueError):
+        cls.from_portfolio([{'type': 'trello'}])
+
+
+@pytest.mark.parametrize('sources, max_workers, expected_page_workers', [
+    ([{'project_key': 'ABC'}], 8, [8]),
+    ([{'project_key': 'ABC'}, {'project_key': 'XYZ'}], 8, [4, 4]),
+    ([{'project_key': f'P{x}'} for x in range(40)], 8, [1] * 40),
+    ([{'project_key': 'ABC', 'max_workers': 2}, {'project_key': 'XYZ'}], 6, [2, 3]),
+])
+def test_from_portfolio_max_workers(monkeypatch, sources, max_workers, expected_page_workers):
+    from highcharts_gantt.options.series.gantt import GanttSeries
+
+    page_workers = {}
+
+    def from_jira(project_key, max_workers = 8, series_kwargs = None, **kwargs):
+        page_workers[project_key] = max_workers
+        return GanttSeries(**(series_kwargs or {}))
+
+    monkeypatch.setattr(GanttSeries, 'from_jira', from_jira)
+
+    cls.from_portfolio([dict(x, type = 'jira') for x in sources],
+                       max_workers = max_workers)
+
+    assert [page_workers[x['project_key']] for x in sources] == expected_page_workers
+
+
+def test_from_portfolio_duplicate_ids(monkeypatch):
+    from highcharts_gantt.options.series.gantt import GanttSeries
+
+    def from_asana(project_gid, series_kwargs = None, **kwargs):
+        series = GanttSeries(**(series_kwargs or {}))
+        series.data = [{'id': x, 'start': '2024-01-01', 'end': '2024-01-10'}
+                       for x in {'1': ['a', 'b'], '2': ['b', 'c', 'a']}[project_gid]]
+
+        return series
+
+    monkeypatch.setattr(GanttSeries, 'from_asana', from_asana)
+    sources = [{'type': 'asana', 'project_gid': '1'},
+               {'type': 'asana', 'project_gid': '2'}]
+
+    result = cls.from_portfolio(sources, merge = True)
+
+    assert [x.id for x in result.options.series[0].data] == ['a', 'b', 'c']
+    assert [x['duplicate_ids'] for x in result.portfolio_report] == [[], ['b', 'a']]
+
+    unmerged = cls.from_portfolio(sources)
+    assert [len(x.data) for x in unmerged.options.series] == [2, 3]
+
+    with pytest.raises(errors.HighchartsValueError):
+        cls.from_portfolio(sources, merge = True, raise_on_error = True)
+
+
+def test_from_portfolio_does_not_modify_sources(monkeypatch):
+    from highcharts_gantt.options.series.gantt import GanttSeries
+
+    def from_asana(project_gid, series_kwargs = None, **kwargs):
+        return GanttSeries(**(series_kwargs or {}))
+
+    monkeypatch.setattr(GanttSeries, 'from_asana', from_asana)
+    sources = [{'type': 'asana', 'project_gid': '1', 'series_kwargs': {'id': 'one'}},
+               {'type': 'asana', 'project_gid': '2', 'series_kwargs': {}}]
+
+    unmerged = cls.from_portfolio(sources, series_kwargs = {'color': '#ff0000'})
+    assert [x.name for x in unmerged.options.series] == ['1', '2']
+    assert sources[0]['series_kwargs'] == {'id': 'one'}
+    assert sources[1]['series_kwargs'] == {}
+
+    merged = cls.from_portfolio(sources, merge = True)
+    assert merged.options.series[0].name is None
+    assert merged.options.series[0].color is None
@@ -0,0 +1,79 @@
+"""Tests for ``highcharts_gantt.critical_path``."""
+
+import datetime
+
+import pytest
+
+from highcharts_gantt import errors
+from highcharts_gantt.options.series.data.connect import DataConnection
+from highcharts_gantt.options.series.data.gantt import GanttDataColumns
+from highcharts_gantt.options.series.gantt import GanttSeries
+
+
+def day(value):
+    return datetime.datetime(2024, 1, value, tzinfo = datetime.timezone.utc)
+
+
+POINTS = [
+    {'id': 'design', 'start': day(1), 'end': day(3)},
+    {'id': 'build', 'start': day(3), 'end': day(6), 'dependency': 'design'},
+    {'id': 'docs', 'start': day(3), 'end': day(4), 'dependency': 'design'},
+    {'id': 'release', 'start': day(6), 'end': day(7), 'dependency': ['build', 'docs']},
+    {'id': 'kickoff', 'start': day(2), 'milestone': True},
+]
+
+
+@pytest.mark.parametrize('data', [
+    POINTS,
+    GanttDataColumns.from_array([{key: value for key, value in x.items()
+                                  if key != 'milestone'}
+                                 for x in POINTS]),
+])
+def test_CriticalPath(data):
+    series = GanttSeries(data = data)
+    result = series.get_critical_path()
+
+    assert len(result) == 5
+    assert result.critical_path == ['design', 'build', 'release']
+    assert result.critical_edges == [(0, 1), (1, 3)]
+    assert result.project_start == day(1)
+    assert result.project_finish == day(7)
+
+    docs = result['docs']
+    assert docs.early_start == day(3)
+    assert docs.late_start == day(5)
+    assert docs.total_float == datetime.timedelta(days = 2)
+    assert docs.is_critical is False
+
+    assert result['kickoff'].total_float == datetime.timedelta(days = 5)
+    assert series.get_critical_path(
+        tolerance = datetime.timedelta(days = 2)
+    ).critical_path == ['design', 'build', 'docs', 'release']
+
+
+def test_CriticalPath_cycle():
+    series = GanttSeries(data = [{'id': 'a', 'dependency': 'b'},
+                                 {'id': 'b', 'dependency': 'a'}])
+
+    with pytest.raises(errors.GanttDependencyError):
+        result = series.get_critical_path()
+
+
+def test_GanttSeries_highlight_critical_path():
+    series = GanttSeries(data = POINTS)
+
+    with pytest.raises(errors.HighchartsValueError):
+        series.highlight_critical_path()
+
+    series.highlight_critical_path(color = '#ff0000',
+                                   connector_color = '#ff0000',
+                                   connector_width = 3)
+
+    assert [x.color for x in series.data] == ['#ff0000', '#ff0000', None,
+                                              '#ff0000', None]
+    assert isinstance(series.data[1].dependency, DataConnection)
+    assert series.data[1].dependency.line_width == 3
+    assert isinstance(series.data[3].dependency[0], DataConnection)
+    assert series.data[3].dependency[0].to == 'build'
+    assert series.data[3].dependency[1] == 'docs'
+    assert series.dependency_graph.is_valid is True
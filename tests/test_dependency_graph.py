@@ -0,0 +1,115 @@
+"""Tests for ``highcharts_gantt.dependency_graph``."""
+
+import pytest
+
+from highcharts_gantt import errors
+from highcharts_gantt.dependency_graph import DependencyGraph, DanglingReference
+from highcharts_gantt.options.series.data.gantt import GanttData, GanttDataColumns
+from highcharts_gantt.options.series.gantt import GanttSeries
+
+
+def make_points(as_dicts):
+    return GanttData.from_array(as_dicts)
+
+
+@pytest.mark.parametrize('points, expected', [
+    ([], {
+        'topological_order': [],
+        'cycles': [],
+        'parent_cycles': [],
+        'dangling_references': [],
+        'duplicate_ids': [],
+        'is_valid': True,
+    }),
+    ([
+        {'id': 'design'},
+        {'id': 'build', 'dependency': 'design', 'parent': 'project'},
+        {'id': 'test', 'dependency': [{'to': 'build'}, 'design'], 'parent': 'project'},
+        {'id': 'project'},
+    ], {
+        'topological_order': [0, 3, 1, 2],
+        'cycles': [],
+        'parent_cycles': [],
+        'dangling_references': [],
+        'duplicate_ids': [],
+        'is_valid': True,
+    }),
+    ([
+        {'id': 'a', 'dependency': 'c'},
+        {'id': 'b', 'dependency': ['a', 'missing']},
+        {'id': 'c', 'dependency': 'b', 'parent': 'd'},
+        {'id': 'd', 'parent': 'c'},
+        {'id': 'e', 'dependency': 'e'},
+        {'id': 'f'},
+        {'id': 'a'},
+    ], {
+        'topological_order': [3, 5, 6],
+        'cycles': [['a', 'b', 'c'], ['e']],
+        'parent_cycles': [['c', 'd']],
+        'dangling_references': [DanglingReference(1, 'b', 'dependency', 'missing')],
+        'duplicate_ids': ['a'],
+        'is_valid': False,
+    }),
+])
+def test_DependencyGraph(points, expected):
+    result = DependencyGraph(make_points(points))
+
+    assert len(result) == len(points)
+    for key in expected:
+        assert getattr(result, key) == expected[key]
+
+    if expected['is_valid']:
+        result.validate()
+    else:
+        with pytest.raises(errors.GanttDependencyError):
+            result.validate()
+
+
+def test_DependencyGraph_adjacency():
+    result = DependencyGraph(make_points([
+        {'id': 'design'},
+        {'id': 'build', 'dependency': 'design', 'parent': 'project'},
+        {'id': 'test', 'dependency': [{'to': 'build'}, 'design'], 'parent': 'project'},
+        {'id': 'project'},
+    ]))
+
+    assert result.predecessors == [[], [0], [1, 0], []]
+    assert result.successors == [[1, 2], [2], [], []]
+    assert result.parents == [None, 3, 3, None]
+    assert result.children == [[], [], [], [1, 2]]
+    assert result.get_predecessors('test') == ['build', 'design']
+    assert result.get_successors('design') == ['build', 'test']
+
+
+def test_DependencyGraph_columns():
+    points = [{'id': f'task-{x}',
+               'parent': 'task-0' if x else None,
+               'dependency': f'task-{x - 1}' if x > 1 else None}
+              for x in range(20)]
+    columns = GanttDataColumns.from_array(points)
+    columns[5].dependency = 'missing'
+
+    result = DependencyGraph(columns)
+    expected = DependencyGraph(make_points(points))
+
+    assert result.parents == expected.parents
+    assert result.predecessors[6] == expected.predecessors[6]
+    assert result.dangling_references == [
+        DanglingReference(5, 'task-5', 'dependency', 'missing')
+    ]
+
+
+def test_GanttSeries_dependency_graph():
+    series = GanttSeries(data = [{'id': 'a'}, {'id': 'b', 'dependency': 'a'}])
+    result = series.dependency_graph
+
+    assert result.is_valid is True
+    assert series.dependency_graph is result
+
+    series.data[0].dependency = 'b'
+    assert series.dependency_graph is result
+    series.reset_dependency_graph()
+    assert series.dependency_graph.cycles == [['a', 'b']]
+
+    series.data = [{'id': 'c', 'dependency': 'a'}]
+    assert series.dependency_graph.dangling_references[0].target == 'a'
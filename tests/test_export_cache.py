@@ -0,0 +1,119 @@
+"""Tests for ``highcharts_gantt.export_cache``."""
+
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from highcharts_gantt import export_cache
+from highcharts_gantt.chart import Chart
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Serves a stand-in exported image, recording each request it receives."""
+
+    requests = []
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self.requests.append(body)
+
+        content = f'image-{len(self.requests)}'.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'image/png')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    Handler.requests = []
+    httpd = HTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target = httpd.serve_forever, daemon = True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = export_cache.enable_export_cache(path = str(tmp_path / 'exports'))
+    yield cache
+    export_cache.disable_export_cache()
+
+
+def test_ExportCache(tmp_path):
+    path = str(tmp_path / 'exports')
+    cache = export_cache.ExportCache(path = path, max_size = 10)
+
+    keys = [cache.make_key('https://export.highcharts.com', x) for x in range(4)]
+    assert len(set(keys)) == 4
+    assert keys[0] == cache.make_key('https://export.highcharts.com', 0)
+
+    assert cache.get(keys[0]) is None
+    cache.set(keys[0], b'aaaa')
+    cache.set(keys[1], b'bbbb')
+    assert cache.get(keys[0]) == b'aaaa'
+    assert cache.size == 8
+
+    cache.set(keys[2], b'cccc')
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == b'aaaa'
+    assert cache.get(keys[2]) == b'cccc'
+    assert len(cache) == 2
+    assert cache.size == 8
+
+    cache.set(keys[3], b'x' * 11)
+    assert cache.get(keys[3]) is None
+
+    os.utime(os.path.join(path, keys[2]), (time.time() - 60, time.time() - 60))
+    reloaded = export_cache.ExportCache(path = path, max_size = 10)
+    assert len(reloaded) == 2
+    reloaded.max_size = 4
+    assert reloaded.get(keys[2]) is None
+    assert reloaded.get(keys[0]) == b'aaaa'
+
+    reloaded.clear()
+    assert len(reloaded) == 0
+    assert reloaded.size == 0
+    assert os.listdir(path) == []
+
+
+@pytest.mark.parametrize('exports, expected_requests', [
+    ([{}, {}], 1),
+    ([{}, {'scale': 2}, {'scale': 2}], 2),
+    ([{'width': 400}, {'width': 600}, {'format_': 'svg'}, {}], 4),
+    ([{'title': 'One'}, {'title': 'Two'}, {'title': 'One'}], 2),
+])
+def test_download_chart(server, cache, exports, expected_requests):
+    results = []
+    for kwargs in exports:
+        title = kwargs.pop('title', 'Chart')
+        chart = Chart(options = {'title': {'text': title}})
+        results.append(chart.download_chart(protocol = 'http',
+                                            domain = '127.0.0.1',
+                                            port = server.server_address[1],
+                                            timeout = 5,
+                                            **kwargs))
+
+    assert len(Handler.requests) == expected_requests
+    assert len(cache) == expected_requests
+    assert len(set(results)) == expected_requests
+
+
+def test_download_chart_disabled(server, tmp_path):
+    chart = Chart(options = {'title': {'text': 'Chart'}})
+    for _ in range(2):
+        chart.download_chart(protocol = 'http',
+                             domain = '127.0.0.1',
+                             port = server.server_address[1],
+                             timeout = 5)
+
+    assert len(Handler.requests) == 2
@@ -3,6 +3,7 @@ from copy import deepcopy
 import pytest
 
 from json.decoder import JSONDecodeError
+from requests.exceptions import HTTPError
 from validator_collection import checkers
 
 from highcharts_gantt.headless_export import ExportServer as cls
@@ -190,3 +191,153 @@ def test_get_chart(input_files,
             assert result is not None
             if target_filename:
                 assert checkers.is_on_filesystem(target_file) is True
+
+
+@pytest.fixture
+def stand_in_export_server():
+    """Run a local stand-in for the Export Server, which responds with the requested
+    format and the chart's title, and fails the first request for any chart whose
+    title starts with ``'flaky'`` (and every request for any chart whose title starts
+    with ``'broken'``)."""
+    import json
+    import threading
+    import time
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+    state = {
+        'requests': 0,
+        'active': 0,
+        'max_active': 0,
+        'failed': set()
+    }
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            length = int(self.headers['Content-Length'])
+            body = json.loads(self.rfile.read(length))
+            title = body['infile']['title']['text']
+
+            with lock:
+                state['requests'] += 1
+                state['active'] += 1
+                state['max_active'] = max(state['max_active'], state['active'])
+            time.sleep(0.02)
+            with lock:
+                state['active'] -= 1
+                is_failure = title.startswith('broken') or \
+                    (title.startswith('flaky') and title not in state['failed'])
+                state['failed'].add(title)
+
+            if is_failure:
+                self.send_response(503)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+
+            content = f'{body["type"]}:{title}'.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target = server.serve_forever, daemon = True)
+    thread.start()
+
+    yield server.server_address[1], state
+
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize('titles, max_workers, raise_errors, expected, error', [
+    (['chart-{}'.format(x) for x in range(20)], 4, True, None, None),
+    (['chart-1', 'flaky-2', 'chart-3'], 2, True, None, None),
+    (['chart-1', 'broken-2', 'chart-3'], 2, False, {1: HTTPError}, None),
+    (['chart-1', 'broken-2', 'chart-3'], 1, True, None, HTTPError),
+])
+def test_request_charts(stand_in_export_server,
+                        tmp_path,
+                        titles,
+                        max_workers,
+                        raise_errors,
+                        expected,
+                        error):
+    from highcharts_gantt.chart import Chart
+
+    port, state = stand_in_export_server
+    expected = expected or {}
+    pulled = []
+
+    def get_charts():
+        for index, title in enumerate(titles):
+            pulled.append(index)
+            if index % 3 == 0:
+                yield Chart(options = {'title': {'text': title}})
+            elif index % 3 == 1:
+                yield HighchartsOptions(title = {'text': title})
+            else:
+                yield {
+                    'options': {'title': {'text': title}},
+                    'format_': 'svg',
+                    'filename': str(tmp_path / f'{title}.svg')
+                }
+
+    instance = cls(protocol = 'http', domain = '127.0.0.1', port = port)
+    kwargs = {
+        'timeout': 5,
+        'max_workers': max_workers,
+        'backoff': 0,
+        'raise_errors': raise_errors
+    }
+
+    if not error:
+        results = {}
+        for index, result in instance.request_charts(get_charts(), **kwargs):
+            assert index not in results
+            assert len(pulled) - len(results) <= 2 * max_workers
+            results[index] = result
+
+        assert sorted(results) == list(range(len(titles)))
+        assert 1 < state['max_active'] <= max_workers
+        for index, title in enumerate(titles):
+            if index in expected:
+                assert isinstance(results[index], expected[index]) is True
+                continue
+
+            format_ = 'svg' if index % 3 == 2 else 'png'
+            assert results[index] == f'{format_}:{title}'.encode('utf-8')
+            if format_ == 'svg':
+                with open(tmp_path / f'{title}.svg', 'rb') as file_:
+                    assert file_.read() == results[index]
+
+        session = instance._session
+        assert session is not None
+        list(instance.request_charts(get_charts(), **kwargs))
+        assert instance._session is session
+
+        instance.close()
+        assert instance._session is None
+    else:
+        with pytest.raises(error):
+            for result in instance.request_charts(get_charts(), **kwargs):
+                pass
+
+
+def test_get_charts(stand_in_export_server):
+    port, state = stand_in_export_server
+    charts = [HighchartsOptions(title = {'text': f'chart-{x}'}) for x in range(5)]
+
+    results = dict(cls.get_charts(charts,
+                                  protocol = 'http',
+                                  domain = '127.0.0.1',
+                                  port = port,
+                                  format_ = 'jpeg',
+                                  timeout = 5))
+
+    assert results == {x: f'jpeg:chart-{x}'.encode('utf-8') for x in range(5)}
+    assert state['requests'] == 5
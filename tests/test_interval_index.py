@@ -0,0 +1,137 @@
+"""Tests for ``highcharts_gantt.interval_index``."""
+
+import datetime
+import random
+
+import pytest
+
+from highcharts_gantt import errors
+from highcharts_gantt.interval_index import IntervalIndex
+from highcharts_gantt.options.series.data.gantt import GanttData, GanttDataColumns
+from highcharts_gantt.options.series.gantt import GanttSeries
+
+START = datetime.datetime(2024, 1, 1, tzinfo = datetime.timezone.utc)
+DAY = datetime.timedelta(days = 1)
+
+
+def overlapping(data, start, end):
+    """Return the positions of the data points overlapping a window, by scanning."""
+    result = []
+    for position, data_point in enumerate(data):
+        first = data_point.start or data_point.end
+        last = data_point.end
+        if first is None:
+            continue
+        if last is None or data_point.milestone or last < first:
+            last = first
+        if first <= end and last >= start:
+            result.append(position)
+
+    return result
+
+
+@pytest.mark.parametrize('start, end, expected', [
+    (START, START, [0, 1]),
+    (START + 2 * DAY, START + 3 * DAY, [1, 2, 4]),
+    (START + 5 * DAY, START + 5 * DAY, [1, 3]),
+    (START + 6 * DAY, START + 9 * DAY, [1]),
+    (START + 11 * DAY, START + 20 * DAY, []),
+    (START - 10 * DAY, START - DAY, []),
+])
+def test_IntervalIndex(start, end, expected):
+    data = GanttData.from_array([
+        {'id': 'a', 'start': START, 'end': START + DAY},
+        {'id': 'b', 'start': START, 'end': START + 10 * DAY},
+        {'id': 'c', 'start': START + 3 * DAY, 'end': START + 4 * DAY},
+        {'id': 'd', 'start': START + 5 * DAY, 'milestone': True},
+        {'id': 'e', 'end': START + 2 * DAY},
+        {'id': 'f'},
+    ])
+    result = IntervalIndex(data)
+
+    assert len(result) == 6
+    assert result.indexed_count == 5
+    assert result.overlapping(start, end) == expected
+
+
+def test_IntervalIndex_random():
+    generator = random.Random(42)
+    points = []
+    for x in range(300):
+        start = START + generator.randint(0, 500) * DAY
+        points.append({
+            'id': f'task-{x}',
+            'start': start if generator.random() < 0.9 else None,
+            'end': start + generator.choice([0, 1, 5, 60, 400]) * DAY,
+            'milestone': generator.random() < 0.1
+        })
+    data = GanttData.from_array(points)
+    result = IntervalIndex(data)
+
+    for x in range(100):
+        start = START + generator.randint(-50, 600) * DAY
+        end = start + generator.choice([0, 3, 30, 300]) * DAY
+        assert result.overlapping(start, end) == overlapping(data, start, end)
+
+
+def test_IntervalIndex_columns():
+    columns = GanttDataColumns(id = ['a', 'b', 'c'],
+                               start = [1704067200000, 1704153600000, None],
+                               end = [1704153600000, 1704240000000, None])
+    columns[1].end = START + 10 * DAY
+    result = IntervalIndex(columns)
+
+    assert result.indexed_count == 2
+    assert result.overlapping('2024-01-05', '2024-01-06') == [1]
+
+
+def test_IntervalIndex_invalid_window():
+    result = IntervalIndex()
+
+    assert result.overlapping(START, START) == []
+    with pytest.raises(errors.HighchartsValueError):
+        result.overlapping(START, START - DAY)
+
+
+def test_GanttSeries_get_window():
+    series = GanttSeries(name = 'Plan', data = [
+        {'id': 'project'},
+        {'id': 'design', 'parent': 'project', 'start': START, 'end': START + 9 * DAY},
+        {'id': 'build', 'parent': 'project', 'start': START + 31 * DAY,
+         'end': START + 40 * DAY, 'dependency': 'design'},
+        {'id': 'review', 'parent': 'build', 'start': START + 35 * DAY,
+         'end': START + 36 * DAY},
+        {'id': 'launch', 'start': START + 60 * DAY, 'milestone': True},
+    ])
+
+    result = series.get_points_in_window(START + 35 * DAY, START + 35 * DAY)
+    assert [x.id for x in result] == ['project', 'build', 'review']
+    result = series.get_points_in_window(START + 35 * DAY,
+                                         START + 35 * DAY,
+                                         include_ancestors = False)
+    assert [x.id for x in result] == ['build', 'review']
+
+    window = series.get_window(START + 50 * DAY, START + 70 * DAY)
+    assert window is not series
+    assert window.name == 'Plan'
+    assert [x.id for x in window.data] == ['launch']
+    assert window.data[0] is series.data[4]
+    assert len(series.data) == 5
+    assert series.get_window(START - 9 * DAY, START - DAY).data is None
+
+    index = series.interval_index
+    series.update_points({'launch': {'start': START + 20 * DAY}})
+    assert series.interval_index is not index
+    assert [x.id for x in series.get_points_in_window(START + 20 * DAY,
+                                                      START + 21 * DAY)] == ['launch']
+
+
+def test_GanttSeries_get_window_columns():
+    series = GanttSeries(data = GanttDataColumns(id = ['a', 'b'],
+                                                 start = [1704067200000, 1706745600000],
+                                                 end = [1704153600000, 1706832000000]))
+    window = series.get_window('2024-02-01', '2024-02-02')
+
+    assert isinstance(window.data, GanttDataColumns)
+    assert [x.id for x in window.data] == ['b']
+    assert len(series.data) == 2
@@ -190,3 +190,34 @@ def test_convert_js_property_to_python(original_str, override, expected, error):
     else:
         with pytest.raises(error):
             result = js.convert_js_property_to_python(item, original_str)
+
+
+@pytest.mark.parametrize('kwargs, error', [
+    ({'name': 'Plan',
+      'data': [{'id': 'a',
+                'name': 'Task A',
+                'start': '2024-01-01',
+                'end': '2024-01-05',
+                'completed': 0.5},
+               {'id': 'b',
+                'name': 'Task B',
+                'start': '2024-01-05',
+                'end': '2024-01-08',
+                'dependency': 'a'}]}, None),
+    ({}, None),
+    ({'name': 'Plan'}, errors.HighchartsValueError),
+])
+def test_write_js_literal(kwargs, error):
+    import io
+    from highcharts_gantt.options.series.gantt import GanttSeries
+
+    series = GanttSeries(**kwargs)
+    if not error:
+        stream = io.StringIO()
+        result = js.write_js_literal(series, stream)
+
+        assert result is True
+        assert stream.getvalue() == (series.to_js_literal() or '')
+    else:
+        with pytest.raises(error):
+            js.write_js_literal(series, 'not-a-stream')
@@ -2,7 +2,7 @@
 
 import pytest
 
-from highcharts_gantt.metaclasses import HighchartsMeta
+from highcharts_gantt.metaclasses import HighchartsMeta, DirectJSONMixin
 from highcharts_gantt import constants
 
 from json.decoder import JSONDecodeError
@@ -333,3 +333,35 @@ def test_from_js_literal(cls, as_str, error):
     else:
         with pytest.raises(error):
             result = cls.from_js_literal(as_str)
+
+
+class DirectJSONTestClass(DirectJSONMixin, TestClass):
+    """Class used to test the :class:`DirectJSONMixin` functionality."""
+    pass
+
+
+@pytest.mark.parametrize('kwargs, error', [
+    ({'item1': 123, 'item2': 456}, None),
+    ({'item1': 0, 'item2': False}, None),
+    ({'item1': '', 'item2': []}, None),
+    ({'item1': constants.EnforcedNull, 'item2': 'null'}, None),
+    ({'item1': [1, None, constants.EnforcedNull, [], {}, {'a': None}],
+      'item2': {'nested': {'value': 0, 'empty': None}}}, None),
+    ({'item1': [test_class_instance, TestClass()],
+      'item2': TestClass(item1 = TestClass(item2 = [1.5, 'string']))}, None),
+    ({'item1': object()}, TypeError),
+])
+def test_DirectJSONMixin_to_json(kwargs, error):
+    instance = DirectJSONTestClass(**kwargs)
+    if not error:
+        result = instance.to_json()
+        assert result == HighchartsMeta.to_json(instance)
+
+        as_bytes = instance.to_json_bytes()
+        assert isinstance(as_bytes, bytes) is True
+        if isinstance(result, str):
+            result = result.encode('utf-8')
+        assert as_bytes == result
+    else:
+        with pytest.raises(error):
+            instance.to_json_bytes()
@@ -104,4 +104,228 @@ def test_get_tasks(board_id, expected_tasks, expected_columns, log_tasks, error)
                                       log_tasks = log_tasks)
     else:
         with pytest.raises(error):
-            result = monday.get_tasks(board_id, api_token, log_tasks)
\ No newline at end of file
+            result = monday.get_tasks(board_id, api_token, log_tasks)
+
+class FakeBoards(object):
+    """Stand-in for the ``monday`` boards resource, serving ``total`` items."""
+
+    def __init__(self, total, board_exists = True):
+        self.total = total
+        self.board_exists = board_exists
+        self.requested_pages = []
+
+    def fetch_items_by_board_id(self, board_ids, limit = None, page = None):
+        self.requested_pages.append(page)
+        if not self.board_exists:
+            return { 'data': { 'boards': [] } }
+
+        start = (page - 1) * limit
+        end = min(start + limit, self.total)
+        items = [{ 'id': str(x), 'name': f'Item {x}', 'column_values': [] }
+                 for x in range(start, end)]
+
+        return { 'data': { 'boards': [{ 'items': items }] } }
+
+
+class FakeClient(object):
+    def __init__(self, total, board_exists = True):
+        self.boards = FakeBoards(total, board_exists = board_exists)
+
+
+@pytest.mark.parametrize('total, page_size, expected_pages, error', [
+    (0, 100, 1, None),
+    (99, 100, 1, None),
+    (100, 100, 2, None),
+    (250, 100, 3, None),
+    (20000, 500, 41, None),
+
+    (0, 100, 1, errors.MondayBoardNotFoundError),
+])
+def test_iter_items(total, page_size, expected_pages, error):
+    client = FakeClient(total, board_exists = error is None)
+
+    if not error:
+        result = [x for x in monday.iter_items(client, 123, page_size = page_size)]
+        assert len(result) == total
+        assert [x['id'] for x in result] == [str(x) for x in range(total)]
+        assert client.boards.requested_pages == [x + 1 for x in range(expected_pages)]
+    else:
+        with pytest.raises(error):
+            result = [x for x in monday.iter_items(client, 123, page_size = page_size)]
+
+
+class FakeItems(object):
+    """Stand-in for the ``monday`` items resource."""
+
+    def __init__(self, existing_ids):
+        self.existing_ids = [str(x) for x in existing_ids]
+        self.requests = []
+
+    def fetch_items_by_id(self, ids):
+        self.requests.append(ids)
+        items = [{ 'id': str(x), 'name': f'Item {x}', 'column_values': [] }
+                 for x in ids if str(x) in self.existing_ids]
+
+        return { 'data': { 'items': items } }
+
+
+@pytest.mark.parametrize('item_ids, existing_ids, batch_size, expected_requests, error', [
+    ([], [], 25, 0, None),
+    ([1, 2, 3], [1, 2, 3], 25, 1, None),
+    ([1, 2, 2, 3], [1, 2, 3], 25, 1, None),
+    ([x for x in range(2000)], [x for x in range(2000)], 100, 20, None),
+
+    ([1, 2, 3], [1, 2], 25, 1, errors.MondayItemNotFoundError),
+])
+def test_get_items_by_id(item_ids, existing_ids, batch_size, expected_requests, error):
+    client = FakeClient(0)
+    client.items = FakeItems(existing_ids)
+
+    if not error:
+        result = monday.get_items_by_id(client, item_ids, batch_size = batch_size)
+        assert sorted(result.keys()) == sorted(set([str(x) for x in item_ids]))
+        assert len(client.items.requests) == expected_requests
+    else:
+        with pytest.raises(error):
+            result = monday.get_items_by_id(client, item_ids, batch_size = batch_size)
+
+
+def test_get_subitem_ids():
+    column_definitions = {
+        'subitems': { 'id': 'subitems', 'title': 'Subitems', 'type': 'subtasks' },
+        'text': { 'id': 'text', 'title': 'Text', 'type': 'text' },
+    }
+    item = {
+        'id': '1',
+        'name': 'Parent',
+        'column_values': [
+            {
+                'id': 'subitems',
+                'value': '{"linkedPulseIds": [{"linkedPulseId": 2}, {"linkedPulseId": 3}]}'
+            },
+            { 'id': 'text', 'value': '"Some text"' },
+            { 'id': 'unknown', 'value': None },
+        ]
+    }
+
+    result = monday.get_subitem_ids(item, column_definitions)
+
+    assert result == ['2', '3']
+
+
+COLUMN_DEFINITIONS = {
+    'text': { 'id': 'text', 'title': 'Owner', 'type': 'text', 'settings_str': '{}' },
+    'status': {
+        'id': 'status',
+        'title': 'Status',
+        'type': 'color',
+        'settings_str': '{"labels": {"0": "Working on it", "1": "Done"}}'
+    },
+    'dropdown': {
+        'id': 'dropdown',
+        'title': 'Tags',
+        'type': 'dropdown',
+        'settings_str': '{"labels": [{"id": 1, "name": "Red"}, {"id": 2, "name": "Blue"}]}'
+    },
+    'date4': { 'id': 'date4', 'title': 'Date', 'type': 'date', 'settings_str': '{}' },
+    'numbers': { 'id': 'numbers', 'title': 'Estimate', 'type': 'numeric', 'settings_str': '{}' },
+}
+
+
+def test_convert_item_to_task():
+    item = {
+        'id': '1',
+        'name': 'Task 1',
+        'column_values': [
+            { 'id': 'text', 'text': 'Jane', 'value': '"Jane"' },
+            { 'id': 'status', 'text': 'Done', 'value': '{"index": 1}' },
+            { 'id': 'dropdown', 'text': 'Red, Blue', 'value': '{"ids": [1, 2]}' },
+            { 'id': 'date', 'text': '2023-01-02', 'value': '{"date": "2023-01-02"}' },
+            { 'id': 'numbers', 'text': '3', 'value': '"3"' },
+        ]
+    }
+    schema = monday.BoardSchema(COLUMN_DEFINITIONS)
+
+    result = monday.convert_item_to_task(item, schema, None)
+    uncompiled_result = monday.convert_item_to_task(item, COLUMN_DEFINITIONS, None)
+
+    assert result == uncompiled_result
+    assert result['id'] == '1'
+    assert result['name'] == 'Task 1'
+    assert result['columns']['Owner'] == 'Jane'
+    assert result['columns']['Status'] == 'Done'
+    assert result['columns']['Tags'] == ['Red', 'Blue']
+    assert result['columns']['Date'] == validators.date('2023-01-02')
+    assert result['columns']['Estimate'] == '3'
+
+
+def test_format_column_compiles_requested_column_only(monkeypatch):
+    compiled = []
+    compile_column = monday.BoardSchema._compile_column
+
+    def tracking_compile_column(self, column):
+        compiled.append(column['id'])
+        return compile_column(self, column)
+
+    monkeypatch.setattr(monday.BoardSchema, '_compile_column', tracking_compile_column)
+
+    result = monday.format_column({ 'id': 'status', 'text': 'Done', 'value': '{"index": 1}' },
+                                  COLUMN_DEFINITIONS,
+                                  None)
+
+    assert result == 'Done'
+    assert compiled == ['status']
+
+
+class FakeColumnBoards(object):
+    def __init__(self):
+        self.requests = 0
+
+    def fetch_columns_by_board_id(self, board_id):
+        self.requests += 1
+        columns = [COLUMN_DEFINITIONS[x] for x in COLUMN_DEFINITIONS]
+
+        return { 'data': { 'boards': [{ 'id': str(board_id), 'columns': columns }] } }
+
+
+@pytest.mark.parametrize('ttl, expected_requests', [
+    (300, 1),
+    (0, 3),
+    (None, 3),
+])
+def test_get_board_schema(ttl, expected_requests):
+    client = FakeClient(0)
+    client.boards = FakeColumnBoards()
+    board_id = 98765 + expected_requests
+
+    results = [monday.get_board_schema(client, board_id, ttl = ttl) for x in range(3)]
+
+    assert client.boards.requests == expected_requests
+    assert isinstance(results[0], monday.BoardSchema)
+    assert results[0].get_column({ 'id': 'status' })[0] == 'Status'
+
+
+def test_get_board_schema_per_token(monkeypatch):
+    monkeypatch.setattr(monday, '_BOARD_SCHEMAS', {})
+    now = [1000.0]
+    monkeypatch.setattr(monday.time, 'monotonic', lambda: now[0])
+
+    first = FakeClient(0)
+    first.token = 'first-token'
+    first.boards = FakeColumnBoards()
+    second = FakeClient(0)
+    second.token = 'second-token'
+    second.boards = FakeColumnBoards()
+
+    monday.get_board_schema(first, 11111, ttl = 60)
+    monday.get_board_schema(first, 11111, ttl = 60)
+    monday.get_board_schema(second, 11111, ttl = 60)
+
+    assert first.boards.requests == 1
+    assert second.boards.requests == 1
+    assert len(monday._BOARD_SCHEMAS) == 2
+
+    now[0] += 120
+    monday.get_board_schema(first, 22222, ttl = 60)
+
+    assert list(monday._BOARD_SCHEMAS) == [('22222', 'first-token')]
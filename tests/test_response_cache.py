@@ -0,0 +1,279 @@
+"""Tests for ``highcharts_gantt.response_cache``."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+import requests
+
+from highcharts_gantt import response_cache
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Serves a fixed JSON body with an ``ETag``, honouring ``If-None-Match``."""
+
+    requests = []
+
+    def do_GET(self):
+        self.requests.append(self.headers.get('If-None-Match', None))
+        if self.headers.get('If-None-Match', None) == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        body = b'{"issues": [1, 2, 3]}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', '"v1"')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    Handler.requests = []
+    httpd = HTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target = httpd.serve_forever, daemon = True)
+    thread.start()
+
+    yield f'http://127.0.0.1:{httpd.server_port}'
+
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_CachingAdapter(tmp_path, server):
+    cache = response_cache.ResponseCache(path = str(tmp_path / 'responses.sqlite'),
+                                         ttl = 60)
+    session = requests.Session()
+    adapter = response_cache.CachingAdapter(cache, 'jira')
+    session.mount('http://', adapter)
+
+    first = session.get(f'{server}/search?startAt=0')
+    second = session.get(f'{server}/search?startAt=0')
+
+    assert first.json() == {'issues': [1, 2, 3]}
+    assert second.json() == first.json()
+    assert getattr(second, 'from_cache', False) is True
+    assert Handler.requests == [None]
+
+    cache.ttl = 0
+    third = session.get(f'{server}/search?startAt=0')
+
+    assert third.json() == first.json()
+    assert Handler.requests == [None, '"v1"']
+
+    session.get(f'{server}/search?startAt=50')
+    assert Handler.requests == [None, '"v1"', None]
+
+    # Storing the new entry pruned the expired ones.
+    assert len(cache) == 0
+    assert cache.evict() == 0
+
+
+def test_ResponseCache_prunes_expired(tmp_path, monkeypatch):
+    path = str(tmp_path / 'responses.sqlite')
+    now = [1000.0]
+    monkeypatch.setattr(response_cache.time, 'time', lambda: now[0])
+
+    cache = response_cache.ResponseCache(path = path, ttl = 60)
+    cache.set('old', 'jira', b'{}')
+
+    now[0] += 30
+    cache.set('newer', 'jira', b'{}')
+    assert len(cache) == 2
+
+    now[0] += 45
+    cache.set('newest', 'jira', b'{}')
+    assert cache.get('old') is None
+    assert len(cache) == 2
+
+    now[0] += 120
+    reopened = response_cache.ResponseCache(path = path, ttl = 60)
+    assert len(reopened) == 0
+
+
+def test_ResponseCache_persistence(tmp_path):
+    path = str(tmp_path / 'responses.sqlite')
+    cache = response_cache.ResponseCache(path = path)
+    key = cache.make_key('monday', 'query { boards { id } }', 'token')
+    cache.set(key, 'monday', b'{"data": {}}')
+
+    reopened = response_cache.ResponseCache(path = path)
+    entry = reopened.get(key)
+
+    assert entry['body'] == b'{"data": {}}'
+    assert reopened.is_fresh(entry) is True
+    assert key != cache.make_key('monday', 'query { boards { id } }', 'other-token')
+
+    reopened.clear(source = 'monday')
+    assert reopened.get(key) is None
+
+
+def test_install_response_cache_monday(tmp_path):
+    class FakeGraphQLClient(object):
+        endpoint = 'https://api.monday.com/v2'
+        token = 'token'
+
+        def __init__(self):
+            self.queries = []
+
+        def execute(self, query, variables = None):
+            self.queries.append(query)
+            return {'data': {'boards': [{'id': '1'}]}}
+
+    class FakeResource(object):
+        def __init__(self):
+            self.client = FakeGraphQLClient()
+
+    class FakeMondayClient(object):
+        def __init__(self):
+            self.boards = FakeResource()
+
+    cache = response_cache.ResponseCache(path = str(tmp_path / 'responses.sqlite'))
+    client = response_cache.install_response_cache(FakeMondayClient(),
+                                                   'monday',
+                                                   cache = cache)
+
+    results = [client.boards.client.execute('query { boards { id } }')
+               for x in range(3)]
+    client.boards.client.execute('mutation { archive_board (board_id: 1) { id } }')
+
+    assert all(x == {'data': {'boards': [{'id': '1'}]}} for x in results)
+    assert len(client.boards.client.queries) == 2
+
+
+@pytest.mark.parametrize('error', [
+    {'errors': [{'message': 'Complexity budget exhausted'}]},
+    {'error_code': 'ComplexityException', 'error_message': 'Budget exhausted'},
+    {'data': None, 'errors': [{'message': 'Rate limit exceeded'}]},
+])
+def test_install_response_cache_monday_errors(tmp_path, error):
+    class FakeGraphQLClient(object):
+        endpoint = 'https://api.monday.com/v2'
+        token = 'token'
+
+        def __init__(self):
+            self.responses = [error, {'data': {'boards': [{'id': '1'}]}}]
+            self.queries = []
+
+        def execute(self, query, variables = None):
+            self.queries.append(query)
+            return self.responses[min(len(self.queries), len(self.responses)) - 1]
+
+    class FakeMondayClient(object):
+        def __init__(self):
+            self.boards = type('FakeResource', (object, ), {})()
+            self.boards.client = FakeGraphQLClient()
+
+    cache = response_cache.ResponseCache(path = str(tmp_path / 'responses.sqlite'))
+    client = response_cache.install_response_cache(FakeMondayClient(),
+                                                   'monday',
+                                                   cache = cache)
+
+    results = [client.boards.client.execute('query { boards { id } }')
+               for x in range(3)]
+
+    assert results[0] == error
+    assert results[1] == results[2] == {'data': {'boards': [{'id': '1'}]}}
+    assert len(client.boards.client.queries) == 2
+
+
+class JIRAHandler(BaseHTTPRequestHandler):
+    """Serves JIRA issue searches from a mutable set of issues, recording each JQL
+    query it receives."""
+
+    issues = {}
+    queries = []
+
+    def do_GET(self):
+        import json
+        from urllib.parse import urlparse, parse_qs
+
+        query = parse_qs(urlparse(self.path).query)
+        jql = query.get('jql', [''])[0]
+        self.queries.append(jql)
+
+        issues = [{
+            'id': key,
+            'key': key,
+            'self': f'http://127.0.0.1/rest/api/2/issue/{key}',
+            'fields': {
+                'summary': summary,
+                'description': None,
+                'status': {'name': 'In Progress'},
+                'resolution': None,
+                'duedate': '2024-01-10',
+                'progress': {'percent': 50},
+                'worklog': {'worklogs': [{'started': '2024-01-01T00:00:00.000+0000'}]},
+                'issuelinks': []
+            }
+        } for key, summary in sorted(self.issues.items())]
+
+        body = json.dumps({
+            'startAt': 0,
+            'maxResults': 100,
+            'total': len(issues),
+            'issues': issues
+        }).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_sync_from_jira_bypasses_cache(tmp_path):
+    import datetime
+    import jira
+
+    from highcharts_gantt.options.series.gantt import GanttSeries
+
+    JIRAHandler.issues = {'ABC-1': 'Task', 'ABC-2': 'Task'}
+    JIRAHandler.queries = []
+    httpd = HTTPServer(('127.0.0.1', 0), JIRAHandler)
+    thread = threading.Thread(target = httpd.serve_forever, daemon = True)
+    thread.start()
+
+    cache = response_cache.enable_response_cache(path = str(tmp_path / 'responses.sqlite'),
+                                                 ttl = 3600)
+    try:
+        client = jira.JIRA(server = f'http://127.0.0.1:{httpd.server_port}',
+                           get_server_info = False)
+
+        def sync(series):
+            # Keep the delta JQL (e.g. "updated >= -6m") identical between syncs, as
+            # it would be for a dashboard that refreshes on a fixed interval.
+            if series.jira_synced_at:
+                series.jira_synced_at = datetime.datetime.now(tz = datetime.timezone.utc) \
+                    - datetime.timedelta(minutes = 4, seconds = 30)
+            series.sync_from_jira('ABC', jira_client = client, detect_removals = True)
+
+        series = GanttSeries()
+        sync(series)
+        sync(series)
+
+        JIRAHandler.issues = {'ABC-1': 'Renamed', 'ABC-3': 'Task'}
+        sync(series)
+
+        assert [x.id for x in series.data] == ['ABC-1', 'ABC-3']
+        assert series.data[0].name == 'Renamed'
+        searches = [x for x in JIRAHandler.queries if x]
+        assert len(searches) == 5
+        assert searches[1] == searches[3]
+        assert 'updated >=' in searches[3]
+
+        # Outside of a sync, the (refreshed) cache is used as before.
+        GanttSeries.from_jira('ABC', jira_client = client)
+        assert len([x for x in JIRAHandler.queries if x]) == 5
+    finally:
+        response_cache.disable_response_cache()
+        httpd.shutdown()
+        httpd.server_close()
@@ -5,3 +5,78 @@ import pytest
 from abc import ABC, abstractmethod
 
 from highcharts_gantt import utility_functions
+
+
+class FakeJIRAClient(object):
+    """Stand-in for a JIRA client which returns integer "issues" in pages."""
+
+    def __init__(self, total, server_max_results = None):
+        self.total = total
+        self.server_max_results = server_max_results
+        self.requests = []
+
+    def search_issues(self, jql, startAt = 0, maxResults = 50, **kwargs):
+        from jira.client import ResultList
+
+        if self.server_max_results:
+            maxResults = min(maxResults, self.server_max_results)
+        self.requests.append(startAt)
+        end = min(startAt + maxResults, self.total)
+
+        return ResultList([x for x in range(startAt, end)],
+                          _startAt = startAt,
+                          _maxResults = maxResults,
+                          _total = self.total)
+
+
+@pytest.mark.parametrize('total, page_size, server_max_results, expected_requests', [
+    (0, 100, None, 1),
+    (50, 100, None, 1),
+    (100, 100, None, 1),
+    (250, 100, None, 3),
+    (8000, 100, None, 80),
+    (250, 100, 50, 5),
+])
+def test_get_jira_issues(total, page_size, server_max_results, expected_requests):
+    client = FakeJIRAClient(total, server_max_results = server_max_results)
+
+    result = utility_functions.get_jira_issues(client,
+                                               'project = TEST',
+                                               page_size = page_size,
+                                               max_workers = 4)
+
+    assert result == [x for x in range(total)]
+    assert len(client.requests) == expected_requests
+    assert sorted(client.requests) == sorted(set(client.requests))
+
+
+def test_run_async():
+    import asyncio
+    import threading
+
+    def get_thread(value, offset = 0):
+        return threading.current_thread().name, value + offset
+
+    async def run():
+        return await asyncio.gather(*[utility_functions.run_async(get_thread,
+                                                                  x,
+                                                                  offset = 1)
+                                      for x in range(3)])
+
+    results = asyncio.run(run())
+
+    assert [x[1] for x in results] == [1, 2, 3]
+    assert all(x[0].startswith('highcharts_gantt') for x in results)
+    assert utility_functions.get_async_executor() is utility_functions.get_async_executor()
+
+
+@pytest.mark.parametrize('fields, custom_fields, expected', [
+    (None, None, ','.join(utility_functions.JIRA_ISSUE_FIELDS)),
+    ('assignee', None, ','.join(utility_functions.JIRA_ISSUE_FIELDS + ['assignee'])),
+    (['assignee'], ['labels', 'assignee', 'status'],
+     ','.join(utility_functions.JIRA_ISSUE_FIELDS + ['assignee', 'labels'])),
+    (None, '*all', '*all'),
+    ('*all', ['labels'], '*all'),
+])
+def test_get_jira_fields(fields, custom_fields, expected):
+    assert utility_functions.get_jira_fields(fields, custom_fields) == expected